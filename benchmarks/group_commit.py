@@ -0,0 +1,98 @@
+"""Benchmark: bridge message inserts/sec, autocommit vs group commit.
+
+Runs N concurrent senders against a scratch workspace. "before" issues one
+autocommit INSERT per message through `store.write()` (one fsync each);
+"after" routes the same INSERT through `store.write_batched()`.
+
+Usage: python -m benchmarks.group_commit [--threads 16] [--messages 200]
+"""
+
+import argparse
+import contextvars
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from space.lib import store
+from space.lib.uuid7 import uuid7
+
+INSERT = "INSERT INTO messages (message_id, channel_id, agent_id, content) VALUES (?, ?, ?, ?)"
+
+
+def _seed() -> tuple[str, str]:
+    channel_id, agent_id = uuid7(), uuid7()
+    with store.write() as conn:
+        conn.execute(
+            "INSERT INTO agents (agent_id, identity, created_at) VALUES (?, ?, datetime('now'))",
+            (agent_id, f"bench-{agent_id[-8:]}"),
+        )
+        conn.execute(
+            "INSERT INTO channels (channel_id, name) VALUES (?, ?)",
+            (channel_id, f"bench-{channel_id[-8:]}"),
+        )
+    return channel_id, agent_id
+
+
+def _autocommit(channel_id: str, agent_id: str, content: str) -> None:
+    with store.write() as conn:
+        conn.execute(INSERT, (uuid7(), channel_id, agent_id, content))
+
+
+def _batched(channel_id: str, agent_id: str, content: str) -> None:
+    message_id = uuid7()
+    store.write_batched(
+        lambda conn: conn.execute(INSERT, (message_id, channel_id, agent_id, content))
+    )
+
+
+def _run(send, threads: int, messages: int) -> float:
+    channel_id, agent_id = _seed()
+    barrier = threading.Barrier(threads + 1)
+
+    def sender() -> None:
+        barrier.wait()
+        for i in range(messages):
+            send(channel_id, agent_id, f"message {i}")
+
+    # Threads don't inherit context vars; carry the scratch DB override along.
+    workers = [
+        threading.Thread(target=contextvars.copy_context().run, args=(sender,))
+        for _ in range(threads)
+    ]
+    for w in workers:
+        w.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for w in workers:
+        w.join()
+    elapsed = time.perf_counter() - start
+    return threads * messages / elapsed
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--threads", type=int, default=16)
+    parser.add_argument("--messages", type=int, default=200, help="Messages per thread")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store.set_test_db_path(Path(tmp))
+        try:
+            before = _run(_autocommit, args.threads, args.messages)
+            after = _run(_batched, args.threads, args.messages)
+            committer = store.pool().committer
+        finally:
+            store._reset_for_testing()
+
+    total = args.threads * args.messages
+    print(f"{args.threads} senders x {args.messages} messages ({total} total)")
+    print(f"  autocommit:   {before:>10,.0f} msg/s")
+    print(f"  group commit: {after:>10,.0f} msg/s  ({after / before:.1f}x)")
+    print(
+        f"  batches: {committer.batches}, avg {committer.jobs / max(committer.batches, 1):.1f} writes/commit"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""Benchmark: row -> Message mapping for a large channel.
+
+"before" is the original `from_row`: `dataclasses.fields()`, a set, a dict of
+the row and a key filter for every row. "after" is `store.from_rows`: one
+mapper compiled per (dataclass, cursor.description), positional indexing.
+Both read the same rows from an in-memory table shaped like `messages`.
+
+Usage: python -m benchmarks.row_mapping [--rows 10000] [--repeat 20]
+"""
+
+import argparse
+import sqlite3
+import time
+import tracemalloc
+from dataclasses import dataclass, fields
+
+from space.core.models import Message
+from space.lib.store import from_rows
+
+QUERY = "SELECT message_id, channel_id, agent_id, content, created_at FROM messages"
+
+
+@dataclass
+class _DictMessage:
+    """Message without slots, for the per-object memory comparison."""
+
+    message_id: str
+    channel_id: str
+    agent_id: str
+    content: str
+    created_at: str
+
+
+def _legacy_from_row(row, dataclass_type):
+    field_names = {f.name for f in fields(dataclass_type)}
+    row_dict = dict(row) if not isinstance(row, dict) else row
+    kwargs = {key: row_dict[key] for key in field_names if key in row_dict}
+    return dataclass_type(**kwargs)
+
+
+def _seed(rows: int) -> sqlite3.Connection:
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute(
+        "CREATE TABLE messages (message_id TEXT, channel_id TEXT, agent_id TEXT,"
+        " content TEXT, created_at TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO messages VALUES (?, ?, ?, ?, ?)",
+        (
+            (f"m-{i}", "ch-1", f"a-{i % 7}", f"message body {i}", "2025-01-01T00:00:00")
+            for i in range(rows)
+        ),
+    )
+    return conn
+
+
+def _time(fn, repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def _footprint(build) -> int:
+    tracemalloc.start()
+    objects = build()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    conn = _seed(args.rows)
+
+    def before():
+        return [_legacy_from_row(row, Message) for row in conn.execute(QUERY).fetchall()]
+
+    def after():
+        return from_rows(conn.execute(QUERY), Message)
+
+    assert before() == after()
+
+    t_before = _time(before, args.repeat)
+    t_after = _time(after, args.repeat)
+    print(f"{args.rows} rows, best of {args.repeat}")
+    print(f"  from_row (before)  {t_before * 1000:8.2f} ms  {args.rows / t_before:12,.0f} rows/s")
+    print(f"  from_rows (after)  {t_after * 1000:8.2f} ms  {args.rows / t_after:12,.0f} rows/s")
+    print(f"  speedup            {t_before / t_after:8.2f}x")
+
+    rows = conn.execute(QUERY).fetchall()
+    plain = _footprint(lambda: [_DictMessage(*row) for row in rows])
+    slotted = _footprint(lambda: [Message(*row) for row in rows])
+    print(f"  memory, dict       {plain / 1024:8.0f} KiB")
+    print(f"  memory, slots      {slotted / 1024:8.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
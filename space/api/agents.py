@@ -10,7 +10,7 @@ async def get_agents():
     from space.lib import store
 
     try:
-        with store.ensure() as conn:
+        with store.read() as conn:
             rows = conn.execute(
                 """SELECT agent_id, identity, model, constitution, role, spawn_count,
                           created_at, last_active_at, archived_at
@@ -42,7 +42,7 @@ def get_agent_memories(identity: str, topic: str | None = None, limit: int = 50)
 def get_agent_sessions(agent_id: str):
     from space.lib import store
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             """
             SELECT session_id, provider, model, first_message_at, last_message_at
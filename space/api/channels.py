@@ -31,7 +31,7 @@ async def get_channels(archived: bool = False, reader_id: str | None = None):
     from space.os.bridge import channels
 
     try:
-        channels_list = channels.list_channels(archived=archived, reader_id=reader_id)
+        channels_list = await channels.alist_channels(archived=archived, reader_id=reader_id)
         return [asdict(ch) for ch in channels_list]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -123,13 +123,18 @@ async def mark_channel_read(channel: str, reader_id: str):
     from space.os.bridge import channels, messaging
 
     try:
-        channel_obj = channels.get_channel(channel)
+        channel_obj = await channels.aget_channel(channel)
         if not channel_obj:
             raise HTTPException(status_code=404, detail=f"Channel {channel} not found")
 
-        messages = messaging.get_messages(channel_obj.channel_id)
+        messages = await messaging.aget_messages(channel_obj.channel_id, limit=1)
         if messages:
-            messaging.update_bookmark(reader_id, channel_obj.channel_id, messages[-1].message_id)
+            await asyncio.to_thread(
+                messaging.update_bookmark,
+                reader_id,
+                channel_obj.channel_id,
+                messages[-1].message_id,
+            )
 
         return {"ok": True}
     except HTTPException:
@@ -139,13 +144,15 @@ async def mark_channel_read(channel: str, reader_id: str):
 
 
 @router.get("/{channel}/messages")
-async def get_messages_endpoint(channel: str):
+async def get_messages_endpoint(
+    channel: str, limit: int | None = None, before: str | None = None, after: str | None = None
+):
     from dataclasses import asdict
 
     from space.os.bridge import messaging
 
     try:
-        messages = messaging.get_messages(channel)
+        messages = await messaging.aget_messages(channel, after=after, before=before, limit=limit)
         return [asdict(msg) for msg in messages]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
@@ -155,7 +162,7 @@ async def get_messages_endpoint(channel: str):
 async def stream_messages(channel: str) -> StreamingResponse:
     from space.os.bridge import channels
 
-    channel_obj = channels.get_channel(channel)
+    channel_obj = await channels.aget_channel(channel)
     if not channel_obj:
         raise HTTPException(status_code=404, detail=f"Channel {channel} not found")
 
@@ -173,18 +180,26 @@ async def stream_messages(channel: str) -> StreamingResponse:
 async def stream_channel_messages(channel_id: str) -> AsyncGenerator[str, None]:
     from dataclasses import asdict
 
-    from space.os.bridge import messaging
+    from space.os.bridge import channels, messaging
 
-    sent_count = 0
+    # Cursor: the last message sent. Everything sent sorts at or before it.
+    last_id = last_at = None
     try:
         while True:
-            messages = messaging.get_messages(channel_id)
-            new_messages = messages[sent_count:]
-            if new_messages:
-                for msg in new_messages:
-                    event_data = asdict(msg)
-                    yield f"data: {json.dumps(event_data)}\n\n"
-                sent_count = len(messages)
+            # History once, then only what arrived after the last message sent.
+            try:
+                messages = await messaging.aget_messages(channel_id, after=last_id)
+            except ValueError:
+                if not await channels.aget_channel(channel_id):
+                    return  # channel deleted: end the stream
+                # The cursor message was deleted or archived: resume from the newest
+                # one before it. None means everything left in main is unsent.
+                last_id = await messaging.aget_previous_message_id(channel_id, last_at, last_id)
+                messages = []
+            for msg in messages:
+                yield f"data: {json.dumps(asdict(msg))}\n\n"
+            if messages:
+                last_id, last_at = messages[-1].message_id, messages[-1].created_at
 
             await asyncio.sleep(0.1)
     except asyncio.CancelledError:
@@ -204,7 +219,7 @@ async def send_message(channel: str, body: SendMessage):
     try:
         sender = body.sender
         if not sender:
-            with store.ensure() as conn:
+            with store.read() as conn:
                 row = conn.execute(
                     "SELECT identity FROM agents WHERE (model IS NULL OR model = '') AND archived_at IS NULL LIMIT 1"
                 ).fetchone()
@@ -229,7 +244,7 @@ def get_channel_agent_sessions(channel_name: str, agent_identity: str):
     if not agent:
         raise HTTPException(status_code=404, detail=f"Agent {agent_identity} not found")
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             """
             SELECT DISTINCT s.session_id, s.provider, s.model, s.first_message_at, s.last_message_at
@@ -38,13 +38,57 @@ async def _timer_daemon():
         logger.error(f"Timer daemon failed: {e}", exc_info=True)
 
 
+async def _outbox_worker():
+    """Drain the delimiter outbox in background."""
+    try:
+        from space.os.bridge import outbox
+
+        logger.info("Starting outbox worker...")
+        await asyncio.to_thread(outbox.run)
+    except Exception as e:
+        logger.error(f"Outbox worker failed: {e}", exc_info=True)
+
+
+async def _spawn_supervisor():
+    """Serve spawn requests from this process unless a supervisor already runs."""
+    try:
+        from space.os.spawn import supervisor
+
+        logger.info("Starting spawn supervisor...")
+        await asyncio.to_thread(supervisor.serve)
+    except RuntimeError as e:
+        logger.info(f"Spawn supervisor not started: {e}")
+    except Exception as e:
+        logger.error(f"Spawn supervisor failed: {e}", exc_info=True)
+
+
+async def _maintenance_daemon():
+    """Run database maintenance (checkpoints, FTS merges, optimize) in background."""
+    try:
+        from space.lib.store import maintenance
+
+        logger.info("Starting maintenance daemon...")
+        await asyncio.to_thread(maintenance.run)
+    except Exception as e:
+        logger.error(f"Maintenance daemon failed: {e}", exc_info=True)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan: startup and shutdown hooks."""
     asyncio.create_task(_background_sync())
     asyncio.create_task(_timer_daemon())
+    asyncio.create_task(_outbox_worker())
+    if os.getenv("SPACE_SPAWN_SUPERVISOR", "1") != "0":
+        asyncio.create_task(_spawn_supervisor())
+    if os.getenv("SPACE_MAINTENANCE", "1") != "0":
+        asyncio.create_task(_maintenance_daemon())
     yield
 
+    from space.lib.store import aio
+
+    await aio.close_all()
+
 
 app = FastAPI(title="Space API", lifespan=lifespan)
 
@@ -68,7 +112,7 @@ async def get_human_identity():
     from space.lib import store
 
     try:
-        with store.ensure() as conn:
+        with store.read() as conn:
             row = conn.execute(
                 "SELECT identity FROM agents WHERE model IS NULL AND archived_at IS NULL LIMIT 1"
             ).fetchone()
@@ -92,7 +136,7 @@ def health_check():
     db_error = None
 
     try:
-        with store.ensure() as conn:
+        with store.read() as conn:
             conn.execute("SELECT 1").fetchone()
         db_ok = True
     except Exception as e:
@@ -107,6 +151,13 @@ def health_check():
     }
 
 
+@app.get("/api/maintenance")
+def maintenance_status():
+    from space.lib.store import maintenance
+
+    return {"schedule": maintenance.SCHEDULE, "last_run": maintenance.load_state()}
+
+
 @app.delete("/api/messages/{message_id}")
 async def delete_message(message_id: str):
     from space.os.bridge import messaging
@@ -19,11 +19,18 @@ router = APIRouter(prefix="/api/spawns", tags=["spawns"])
 async def get_spawns():
     from dataclasses import asdict
 
-    from space.os.spawn import spawns
+    from space.os.spawn import metrics, spawns
 
     try:
-        spawns_list = spawns.get_all_spawns(limit=100)
-        return [asdict(sp) for sp in spawns_list]
+        spawns_list = await spawns.aget_all_spawns(limit=100)
+        metrics_by_id = await metrics.aget_metrics([sp.id for sp in spawns_list])
+        return [
+            {
+                **asdict(sp),
+                "metrics": asdict(metrics_by_id[sp.id]) if sp.id in metrics_by_id else None,
+            }
+            for sp in spawns_list
+        ]
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e)) from e
 
@@ -56,7 +63,7 @@ def get_spawn_tree(spawn_id: str):
     if not spawn:
         raise HTTPException(status_code=404, detail=f"Spawn {spawn_id} not found")
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         descendants = conn.execute(
             """
             WITH RECURSIVE spawn_tree AS (
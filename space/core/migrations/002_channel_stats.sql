@@ -0,0 +1,80 @@
+-- 002_channel_stats.sql
+-- Per-channel message counters and member sets, maintained by triggers on messages.
+-- Channel listings read these instead of aggregating the messages table.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS channel_stats (
+    channel_id TEXT PRIMARY KEY,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    last_activity TEXT,
+    FOREIGN KEY (channel_id) REFERENCES channels(channel_id) ON DELETE CASCADE
+);
+
+CREATE TABLE IF NOT EXISTS channel_members (
+    channel_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    message_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (channel_id, agent_id),
+    FOREIGN KEY (channel_id) REFERENCES channels(channel_id) ON DELETE CASCADE
+) WITHOUT ROWID;
+
+INSERT INTO channel_stats (channel_id, message_count, last_activity)
+SELECT channel_id, COUNT(*), MAX(created_at) FROM messages GROUP BY channel_id;
+
+INSERT INTO channel_members (channel_id, agent_id, message_count)
+SELECT channel_id, agent_id, COUNT(*) FROM messages GROUP BY channel_id, agent_id;
+
+-- ============================================================================
+-- COUNTER TRIGGERS
+-- ============================================================================
+
+CREATE TRIGGER IF NOT EXISTS channel_stats_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO channel_stats (channel_id, message_count, last_activity)
+    VALUES (new.channel_id, 1, new.created_at)
+    ON CONFLICT(channel_id) DO UPDATE SET
+        message_count = message_count + 1,
+        last_activity = MAX(COALESCE(last_activity, ''), excluded.last_activity);
+    INSERT INTO channel_members (channel_id, agent_id, message_count)
+    VALUES (new.channel_id, new.agent_id, 1)
+    ON CONFLICT(channel_id, agent_id) DO UPDATE SET message_count = message_count + 1;
+END;
+
+CREATE TRIGGER IF NOT EXISTS channel_stats_ad AFTER DELETE ON messages BEGIN
+    UPDATE channel_stats SET
+        message_count = message_count - 1,
+        last_activity = (
+            SELECT MAX(created_at) FROM messages WHERE channel_id = old.channel_id
+        )
+    WHERE channel_id = old.channel_id;
+    UPDATE channel_members SET message_count = message_count - 1
+    WHERE channel_id = old.channel_id AND agent_id = old.agent_id;
+    DELETE FROM channel_members
+    WHERE channel_id = old.channel_id AND agent_id = old.agent_id AND message_count <= 0;
+END;
+
+-- Moves between channels or agents (e.g. agent merges): retract old, count new.
+CREATE TRIGGER IF NOT EXISTS channel_stats_au AFTER UPDATE OF channel_id, agent_id, created_at ON messages BEGIN
+    UPDATE channel_stats SET
+        message_count = message_count - 1,
+        last_activity = (
+            SELECT MAX(created_at) FROM messages WHERE channel_id = old.channel_id
+        )
+    WHERE channel_id = old.channel_id;
+    UPDATE channel_members SET message_count = message_count - 1
+    WHERE channel_id = old.channel_id AND agent_id = old.agent_id;
+    DELETE FROM channel_members
+    WHERE channel_id = old.channel_id AND agent_id = old.agent_id AND message_count <= 0;
+    INSERT INTO channel_stats (channel_id, message_count, last_activity)
+    VALUES (new.channel_id, 1, new.created_at)
+    ON CONFLICT(channel_id) DO UPDATE SET
+        message_count = message_count + 1,
+        last_activity = (
+            SELECT MAX(created_at) FROM messages WHERE channel_id = new.channel_id
+        );
+    INSERT INTO channel_members (channel_id, agent_id, message_count)
+    VALUES (new.channel_id, new.agent_id, 1)
+    ON CONFLICT(channel_id, agent_id) DO UPDATE SET message_count = message_count + 1;
+END;
+
+COMMIT;
@@ -0,0 +1,23 @@
+-- 003_id_suffix_index.sql
+-- Expression indexes on each ID's last 8 characters, reversed, so suffix (short ID)
+-- lookups become index range scans. The expression must match uuid7.suffix_key().
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_memories_id_suffix ON memories(
+    substr(memory_id, -1, 1) || substr(memory_id, -2, 1) || substr(memory_id, -3, 1) || substr(memory_id, -4, 1) || substr(memory_id, -5, 1) || substr(memory_id, -6, 1) || substr(memory_id, -7, 1) || substr(memory_id, -8, 1)
+);
+CREATE INDEX IF NOT EXISTS idx_tasks_id_suffix ON tasks(
+    substr(task_id, -1, 1) || substr(task_id, -2, 1) || substr(task_id, -3, 1) || substr(task_id, -4, 1) || substr(task_id, -5, 1) || substr(task_id, -6, 1) || substr(task_id, -7, 1) || substr(task_id, -8, 1)
+);
+CREATE INDEX IF NOT EXISTS idx_spawns_id_suffix ON spawns(
+    substr(id, -1, 1) || substr(id, -2, 1) || substr(id, -3, 1) || substr(id, -4, 1) || substr(id, -5, 1) || substr(id, -6, 1) || substr(id, -7, 1) || substr(id, -8, 1)
+);
+CREATE INDEX IF NOT EXISTS idx_knowledge_id_suffix ON knowledge(
+    substr(knowledge_id, -1, 1) || substr(knowledge_id, -2, 1) || substr(knowledge_id, -3, 1) || substr(knowledge_id, -4, 1) || substr(knowledge_id, -5, 1) || substr(knowledge_id, -6, 1) || substr(knowledge_id, -7, 1) || substr(knowledge_id, -8, 1)
+);
+CREATE INDEX IF NOT EXISTS idx_sessions_id_suffix ON sessions(
+    substr(session_id, -1, 1) || substr(session_id, -2, 1) || substr(session_id, -3, 1) || substr(session_id, -4, 1) || substr(session_id, -5, 1) || substr(session_id, -6, 1) || substr(session_id, -7, 1) || substr(session_id, -8, 1)
+);
+
+COMMIT;
@@ -0,0 +1,12 @@
+-- 004_message_keyset.sql
+-- Channel reads page on (created_at, message_id). Extending the channel index with
+-- the tiebreaker makes bookmark, before/after and time-window reads index range scans;
+-- it covers every query the old (channel_id, created_at) index served.
+
+BEGIN;
+
+CREATE INDEX IF NOT EXISTS idx_messages_channel_keyset
+    ON messages(channel_id, created_at, message_id);
+DROP INDEX IF EXISTS idx_messages_channel_created;
+
+COMMIT;
@@ -0,0 +1,21 @@
+-- 005_outbox.sql
+-- Durable queue of delimiter work (@mentions, /control, !signals) per sent message.
+-- Rows are written in the same transaction as the message and deleted once handled;
+-- times are epoch seconds so backoff and lag are plain arithmetic.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY,
+    message_id TEXT NOT NULL UNIQUE,
+    enqueued_at REAL NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    claimed_until REAL,
+    last_error TEXT,
+    dead_at REAL
+);
+
+CREATE INDEX IF NOT EXISTS idx_outbox_ready ON outbox(next_attempt_at) WHERE dead_at IS NULL;
+
+COMMIT;
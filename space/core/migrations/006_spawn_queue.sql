@@ -0,0 +1,16 @@
+-- 006_spawn_queue.sql
+-- Admission queue for spawns. A spawn waiting for a free slot is status 'pending'
+-- with its launch request stored in `request` (JSON); the scheduler starts the
+-- highest priority, oldest one first. queued_at/started_at give the queue wait.
+
+BEGIN;
+
+ALTER TABLE spawns ADD COLUMN priority INTEGER NOT NULL DEFAULT 0;
+ALTER TABLE spawns ADD COLUMN queued_at TEXT;
+ALTER TABLE spawns ADD COLUMN started_at TEXT;
+ALTER TABLE spawns ADD COLUMN request TEXT;
+
+CREATE INDEX IF NOT EXISTS idx_spawns_queue ON spawns(priority DESC, queued_at)
+    WHERE status = 'pending' AND request IS NOT NULL;
+
+COMMIT;
@@ -0,0 +1,22 @@
+-- 007_spawn_metrics.sql
+-- Host cost of each provider run: one row per run (a reused spawn runs once per
+-- @mention). CPU and peak RSS come from the child's rusage (wait4); wall and
+-- first-output times are seconds measured by the launcher.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS spawn_metrics (
+    id INTEGER PRIMARY KEY,
+    spawn_id TEXT NOT NULL REFERENCES spawns(id) ON DELETE CASCADE,
+    recorded_at TEXT NOT NULL,
+    exit_code INTEGER,
+    wall_seconds REAL NOT NULL,
+    first_output_seconds REAL,
+    cpu_user_seconds REAL,
+    cpu_system_seconds REAL,
+    max_rss_kb INTEGER
+);
+
+CREATE INDEX IF NOT EXISTS idx_spawn_metrics_spawn ON spawn_metrics(spawn_id);
+
+COMMIT;
@@ -0,0 +1,10 @@
+-- 008_outbox_progress.sql
+-- Delimiter steps already done for an outbox row ("control", "signals",
+-- "mention:<identity>"), as a JSON array. A retry skips them, so a failure in
+-- a later step never re-runs a /stop, !compact or @mention spawn.
+
+BEGIN;
+
+ALTER TABLE outbox ADD COLUMN steps_done TEXT NOT NULL DEFAULT '[]';
+
+COMMIT;
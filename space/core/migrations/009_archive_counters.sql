@@ -0,0 +1,30 @@
+-- 009_archive_counters.sql
+-- Archive moves delete messages from main without removing them from the channel,
+-- so the delete trigger must not retract them from channel_stats/channel_members.
+-- A mover inserts the trigger's name into paused_triggers inside its delete
+-- transaction and clears it before committing; nothing else ever sees the row.
+
+BEGIN;
+
+CREATE TABLE IF NOT EXISTS paused_triggers (
+    name TEXT PRIMARY KEY
+) WITHOUT ROWID;
+
+DROP TRIGGER IF EXISTS channel_stats_ad;
+
+CREATE TRIGGER channel_stats_ad AFTER DELETE ON messages
+WHEN NOT EXISTS (SELECT 1 FROM paused_triggers WHERE name = 'channel_stats_ad')
+BEGIN
+    UPDATE channel_stats SET
+        message_count = message_count - 1,
+        last_activity = (
+            SELECT MAX(created_at) FROM messages WHERE channel_id = old.channel_id
+        )
+    WHERE channel_id = old.channel_id;
+    UPDATE channel_members SET message_count = message_count - 1
+    WHERE channel_id = old.channel_id AND agent_id = old.agent_id;
+    DELETE FROM channel_members
+    WHERE channel_id = old.channel_id AND agent_id = old.agent_id AND message_count <= 0;
+END;
+
+COMMIT;
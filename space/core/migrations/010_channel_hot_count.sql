@@ -0,0 +1,59 @@
+-- 010_channel_hot_count.sql
+-- channel_stats.message_count counts both tiers (archive moves pause its delete
+-- trigger, see 009). hot_count counts only the messages still in main, which is
+-- what a read without a usable bookmark returns, so unread counts use it.
+
+BEGIN;
+
+ALTER TABLE channel_stats ADD COLUMN hot_count INTEGER NOT NULL DEFAULT 0;
+
+UPDATE channel_stats SET hot_count = (
+    SELECT COUNT(*) FROM messages m WHERE m.channel_id = channel_stats.channel_id
+);
+
+DROP TRIGGER IF EXISTS channel_stats_ai;
+DROP TRIGGER IF EXISTS channel_stats_au;
+
+CREATE TRIGGER channel_stats_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO channel_stats (channel_id, message_count, hot_count, last_activity)
+    VALUES (new.channel_id, 1, 1, new.created_at)
+    ON CONFLICT(channel_id) DO UPDATE SET
+        message_count = message_count + 1,
+        hot_count = hot_count + 1,
+        last_activity = MAX(COALESCE(last_activity, ''), excluded.last_activity);
+    INSERT INTO channel_members (channel_id, agent_id, message_count)
+    VALUES (new.channel_id, new.agent_id, 1)
+    ON CONFLICT(channel_id, agent_id) DO UPDATE SET message_count = message_count + 1;
+END;
+
+-- Runs on every delete, archive moves included (channel_stats_ad is paused for those).
+CREATE TRIGGER channel_stats_ad_hot AFTER DELETE ON messages BEGIN
+    UPDATE channel_stats SET hot_count = hot_count - 1 WHERE channel_id = old.channel_id;
+END;
+
+CREATE TRIGGER channel_stats_au AFTER UPDATE OF channel_id, agent_id, created_at ON messages BEGIN
+    UPDATE channel_stats SET
+        message_count = message_count - 1,
+        hot_count = hot_count - 1,
+        last_activity = (
+            SELECT MAX(created_at) FROM messages WHERE channel_id = old.channel_id
+        )
+    WHERE channel_id = old.channel_id;
+    UPDATE channel_members SET message_count = message_count - 1
+    WHERE channel_id = old.channel_id AND agent_id = old.agent_id;
+    DELETE FROM channel_members
+    WHERE channel_id = old.channel_id AND agent_id = old.agent_id AND message_count <= 0;
+    INSERT INTO channel_stats (channel_id, message_count, hot_count, last_activity)
+    VALUES (new.channel_id, 1, 1, new.created_at)
+    ON CONFLICT(channel_id) DO UPDATE SET
+        message_count = message_count + 1,
+        hot_count = hot_count + 1,
+        last_activity = (
+            SELECT MAX(created_at) FROM messages WHERE channel_id = new.channel_id
+        );
+    INSERT INTO channel_members (channel_id, agent_id, message_count)
+    VALUES (new.channel_id, new.agent_id, 1)
+    ON CONFLICT(channel_id, agent_id) DO UPDATE SET message_count = message_count + 1;
+END;
+
+COMMIT;
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 
 
@@ -66,7 +67,7 @@ class Channel:
     unread_count: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class Message:
     message_id: str
     channel_id: str
@@ -75,7 +76,7 @@ class Message:
     created_at: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Spawn:
     id: str
     agent_id: str
@@ -87,9 +88,35 @@ class Spawn:
     parent_spawn_id: str | None = None
     created_at: str | None = None
     ended_at: str | None = None
+    priority: int = 0
+    queued_at: str | None = None
+    started_at: str | None = None
 
+    @property
+    def queue_wait_seconds(self) -> float | None:
+        """Time spent waiting for an admission slot (so far, while still queued)."""
+        if not self.queued_at:
+            return None
+        end = datetime.fromisoformat(self.started_at) if self.started_at else datetime.now()
+        return max((end - datetime.fromisoformat(self.queued_at)).total_seconds(), 0.0)
 
-@dataclass
+
+@dataclass(slots=True)
+class SpawnMetrics:
+    """Host cost of a spawn, summed over its runs, with its session's tokens."""
+
+    spawn_id: str
+    runs: int = 0
+    wall_seconds: float | None = None
+    first_output_seconds: float | None = None
+    cpu_user_seconds: float | None = None
+    cpu_system_seconds: float | None = None
+    max_rss_kb: int | None = None
+    input_tokens: int | None = None
+    output_tokens: int | None = None
+
+
+@dataclass(slots=True)
 class Memory:
     memory_id: str
     agent_id: str
@@ -101,7 +128,7 @@ class Memory:
     source: str = "manual"
 
 
-@dataclass
+@dataclass(slots=True)
 class Knowledge:
     knowledge_id: str
     domain: str
@@ -111,7 +138,7 @@ class Knowledge:
     archived_at: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     task_id: str
     creator_id: str
@@ -170,6 +197,9 @@ class BridgeStats:
     channels: int = 0
     active_channels: int = 0
     archived_channels: int = 0
+    outbox_pending: int = 0
+    outbox_dead: int = 0
+    outbox_lag_seconds: float = 0.0
 
 
 @dataclass
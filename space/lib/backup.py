@@ -1,22 +1,168 @@
-import contextlib
+import hashlib
+import json
 import logging
 import os
 import shutil
 import sqlite3
+import struct
+import tarfile
+import tempfile
+from collections.abc import Callable
 from datetime import datetime
 from pathlib import Path
+from typing import Annotated
 
 import typer
 
-from space.lib import paths, store
-from space.lib.store.sqlite import resolve
+from space.lib import paths
 
 logger = logging.getLogger(__name__)
 
 app = typer.Typer()
 
 
-def _backup_data_snapshot(timestamp: str, quiet_output: bool) -> dict:
+# Pages copied per backup step; progress is reported after each step.
+BACKUP_STEP_PAGES = 1024
+# Deltas chain back to a full snapshot; past this depth the next one is full.
+MAX_DELTA_CHAIN = 7
+MANIFEST_FILE = "backup.json"
+
+ProgressCallback = Callable[[str, int, int], None]
+
+
+def _snapshot_db(src_db: Path, dest: Path, on_progress: ProgressCallback | None = None) -> None:
+    """Copy a live database with the SQLite backup API, in paged steps.
+
+    The source connection holds one read transaction across all steps, so the copy
+    is a consistent snapshot and concurrent writes (WAL) neither block on it nor
+    force the backup to restart.
+    """
+    src = sqlite3.connect(f"{src_db.resolve().as_uri()}?mode=ro", uri=True, isolation_level=None)
+    dst = sqlite3.connect(dest)
+    try:
+        src.execute("BEGIN")
+        src.execute("SELECT 1 FROM sqlite_master LIMIT 1").fetchone()
+
+        def progress(_status: int, remaining: int, total: int) -> None:
+            if on_progress:
+                on_progress(src_db.name, total - remaining, total)
+
+        src.backup(dst, pages=BACKUP_STEP_PAGES, progress=progress)
+        src.execute("COMMIT")
+    finally:
+        dst.close()
+        src.close()
+
+
+def _page_size(db_file: Path) -> int:
+    with open(db_file, "rb") as f:
+        header = f.read(100)
+    size = struct.unpack(">H", header[16:18])[0]
+    return 65536 if size == 1 else size
+
+
+def _page_hashes(db_file: Path, page_size: int) -> list[bytes]:
+    hashes = []
+    with open(db_file, "rb") as f:
+        while page := f.read(page_size):
+            hashes.append(hashlib.blake2b(page, digest_size=8).digest())
+    return hashes
+
+
+def _read_hashes(path: Path) -> list[bytes]:
+    data = path.read_bytes()
+    return [data[i : i + 8] for i in range(0, len(data), 8)]
+
+
+def _read_manifest(snapshot_dir: Path) -> dict:
+    path = snapshot_dir / MANIFEST_FILE
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _latest_base(db_name: str, before: Path) -> tuple[Path, dict] | None:
+    """Most recent earlier snapshot that recorded page hashes for db_name."""
+    data_dir = before.parent
+    if not data_dir.exists():
+        return None
+    for snapshot_dir in sorted(data_dir.iterdir(), reverse=True):
+        if snapshot_dir.name >= before.name or not snapshot_dir.is_dir():
+            continue
+        entry = _read_manifest(snapshot_dir).get("databases", {}).get(db_name)
+        if entry and (snapshot_dir / f"{db_name}.pages").exists():
+            return snapshot_dir, entry
+        if (snapshot_dir / db_name).exists():
+            # Pre-manifest full copy: nothing to diff against, chain ends here.
+            return None
+    return None
+
+
+def _write_delta(full_copy: Path, delta: Path, changed: list[int], page_size: int) -> None:
+    with open(full_copy, "rb") as src, open(delta, "wb") as out:
+        for page_no in changed:
+            src.seek(page_no * page_size)
+            out.write(struct.pack(">I", page_no))
+            out.write(src.read(page_size))
+
+
+def _store_snapshot(full_copy: Path, backup_path: Path, incremental: bool) -> dict:
+    """Keep full_copy as-is, or as the pages changed since the last snapshot."""
+    db_name = full_copy.name.removeprefix(".").removesuffix(".tmp")
+    page_size = _page_size(full_copy)
+    hashes = _page_hashes(full_copy, page_size)
+    (backup_path / f"{db_name}.pages").write_bytes(b"".join(hashes))
+    entry = {"mode": "full", "page_size": page_size, "pages": len(hashes), "depth": 0}
+
+    base = _latest_base(db_name, backup_path) if incremental else None
+    if base is not None:
+        base_dir, base_entry = base
+        base_hashes = _read_hashes(base_dir / f"{db_name}.pages")
+        changed = [i for i, h in enumerate(hashes) if i >= len(base_hashes) or base_hashes[i] != h]
+        depth = base_entry.get("depth", 0) + 1
+        if (
+            base_entry.get("page_size") == page_size
+            and depth <= MAX_DELTA_CHAIN
+            and len(changed) <= len(hashes) // 2
+        ):
+            _write_delta(full_copy, backup_path / f"{db_name}.delta", changed, page_size)
+            full_copy.unlink()
+            entry.update(mode="delta", base=base_dir.name, changed=len(changed), depth=depth)
+            return entry
+
+    full_copy.replace(backup_path / db_name)
+    return entry
+
+
+def materialize(snapshot_dir: Path, db_name: str, dest: Path) -> Path:
+    """Rebuild db_name as of snapshot_dir into dest, replaying deltas onto their base."""
+    entry = _read_manifest(snapshot_dir).get("databases", {}).get(db_name)
+    if entry is None or entry["mode"] == "full":
+        shutil.copyfile(snapshot_dir / db_name, dest)
+        return dest
+
+    materialize(snapshot_dir.parent / entry["base"], db_name, dest)
+    page_size = entry["page_size"]
+    record = 4 + page_size
+    with open(snapshot_dir / f"{db_name}.delta", "rb") as delta, open(dest, "r+b") as out:
+        out.truncate(entry["pages"] * page_size)
+        while chunk := delta.read(record):
+            (page_no,) = struct.unpack(">I", chunk[:4])
+            out.seek(page_no * page_size)
+            out.write(chunk[4:])
+    return dest
+
+
+def _backup_data_snapshot(
+    timestamp: str,
+    quiet_output: bool,
+    incremental: bool = False,
+    on_progress: ProgressCallback | None = None,
+    verify: bool = False,
+) -> dict:
     src = paths.dot_space()
     if not src.exists():
         if not quiet_output:
@@ -27,109 +173,355 @@ def _backup_data_snapshot(timestamp: str, quiet_output: bool) -> dict:
     backup_path.parent.mkdir(parents=True, exist_ok=True)
     backup_path.mkdir(parents=True, exist_ok=True)
 
-    store.close_all()
+    stats = {}
+    manifest = {"created_at": timestamp, "databases": {}}
+    for db_file in sorted(src.glob("*.db")):
+        tmp = backup_path / f".{db_file.name}.tmp"
+        try:
+            _snapshot_db(db_file, tmp, on_progress)
+        except sqlite3.Error as e:
+            logger.error(f"Failed to back up {db_file.name}: {e}")
+            tmp.unlink(missing_ok=True)
+            stats[db_file.name] = {"error": str(e)}
+            continue
 
-    with contextlib.suppress(sqlite3.DatabaseError):
-        resolve(src)
+        stats[db_file.name] = _get_db_stats(tmp, verify)
+        manifest["databases"][db_file.name] = _store_snapshot(tmp, backup_path, incremental)
 
-    for db_file in src.glob("*.db"):
-        shutil.copy2(db_file, backup_path / db_file.name)
+    (backup_path / MANIFEST_FILE).write_text(json.dumps(manifest, indent=2))
+    os.chmod(backup_path, 0o555)
 
-    stats = _get_backup_stats(backup_path)
+    return stats
 
-    for db_file in backup_path.glob("*.db"):
+
+SESSIONS_MANIFEST = "manifest.json"
+LATEST_LINK = "latest"
+_COPY_CHUNK = 1 << 20
+
+
+def _load_sessions_manifest(root: Path) -> dict:
+    """Last session snapshot's manifest; a pre-manifest flat mirror is adopted as-is."""
+    path = root / SESSIONS_MANIFEST
+    if path.exists():
         try:
-            with sqlite3.connect(str(db_file), timeout=2) as conn:
-                result = conn.execute("PRAGMA integrity_check").fetchone()[0]
-                if result != "ok":
-                    logger.error(f"Backup integrity check failed for {db_file.name}: {result}")
-        except Exception as e:
-            logger.error(f"Failed to verify backup {db_file.name}: {e}")
+            return json.loads(path.read_text())
+        except (OSError, ValueError):
+            logger.warning(f"Ignoring unreadable session backup manifest {path}")
+            return {}
+
+    # Legacy layout: providers mirrored directly under root, copy2'd (mtime kept).
+    files = {}
+    if root.exists():
+        for provider_dir in root.iterdir():
+            if not provider_dir.is_dir() or provider_dir.is_symlink():
+                continue
+            for f in provider_dir.glob("*.jsonl"):
+                st = f.stat()
+                files[f"{provider_dir.name}/{f.name}"] = {
+                    "size": st.st_size,
+                    "mtime_ns": st.st_mtime_ns,
+                    "hash": None,
+                }
+    return {"snapshot": "", "files": files} if files else {}
 
-    os.chmod(backup_path, 0o555)
 
-    return stats
+def _copy_hashed(src: Path, dest: Path) -> str:
+    """Copy src to dest (keeping mtime) and return its content hash, in one read pass."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(src, "rb") as fin, open(dest, "wb") as fout:
+        while chunk := fin.read(_COPY_CHUNK):
+            digest.update(chunk)
+            fout.write(chunk)
+    shutil.copystat(src, dest)
+    return digest.hexdigest()
 
 
-def _backup_sessions(quiet_output: bool) -> dict:
-    from space.lib import providers
+def _file_hash(path: Path) -> str:
+    digest = hashlib.blake2b(digest_size=16)
+    with open(path, "rb") as f:
+        while chunk := f.read(_COPY_CHUNK):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-    src = paths.sessions_dir()
-    backup_path = paths.backup_sessions_dir()
 
-    def count_provider_files(path: Path, provider: str) -> int:
-        provider_dir = path / provider
-        if not provider_dir.exists():
-            return 0
-        return len(list(provider_dir.glob("*.jsonl")))
+def _link(previous: Path, dest: Path) -> bool:
+    """Hardlink an unchanged file from the previous snapshot; False if that failed."""
+    try:
+        os.link(previous, dest)
+        return True
+    except OSError:
+        return False
 
-    before = {p: count_provider_files(backup_path, p) for p in providers.PROVIDER_NAMES}
 
-    if backup_path.exists():
-        os.chmod(backup_path, 0o755)
+def _backup_sessions(quiet_output: bool, timestamp: str | None = None) -> dict:
+    """Snapshot provider sessions into ~/.space_backups/sessions/{timestamp}/.
 
-    backup_path.mkdir(parents=True, exist_ok=True)
+    A manifest of (path, size, mtime, hash) from the previous snapshot decides what
+    changed: unchanged files are hardlinked from it, so each snapshot is a full tree
+    that only costs the delta. Files gone from the source are carried forward.
+    """
+    from space.lib import providers
+
+    timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
+    src = paths.sessions_dir()
+    root = paths.backup_sessions_dir()
+
+    if root.exists():
+        os.chmod(root, 0o755)
+    root.mkdir(parents=True, exist_ok=True)
+
+    previous = _load_sessions_manifest(root)
+    prev_files = previous.get("files", {})
+    prev_dir = root / previous["snapshot"] if previous else None
+
+    snapshot = root / timestamp
+    if snapshot.exists():
+        os.chmod(snapshot, 0o755)
+    snapshot.mkdir(exist_ok=True)
+    files: dict[str, dict] = {}
+    copied = linked = 0
+
+    def carry(rel: str) -> bool:
+        dest = snapshot / rel
+        dest.parent.mkdir(exist_ok=True)
+        if dest.exists():  # re-run within the same second
+            return True
+        return prev_dir is not None and _link(prev_dir / rel, dest)
 
     if src.exists():
-        for provider_dir in src.iterdir():
+        for provider_dir in sorted(src.iterdir()):
             if not provider_dir.is_dir():
                 continue
-
-            backup_provider_dir = backup_path / provider_dir.name
-            backup_provider_dir.mkdir(exist_ok=True)
-
             for session_file in provider_dir.iterdir():
                 if not session_file.is_file():
                     continue
-
-                backup_file = backup_provider_dir / session_file.name
-                shutil.copy2(session_file, backup_file)
-
-    os.chmod(backup_path, 0o555)
-
-    after = {p: count_provider_files(backup_path, p) for p in providers.PROVIDER_NAMES}
+                rel = f"{provider_dir.name}/{session_file.name}"
+                st = session_file.stat()
+                entry = {"size": st.st_size, "mtime_ns": st.st_mtime_ns, "hash": None}
+                prev = prev_files.get(rel)
+
+                if prev and (prev["size"], prev["mtime_ns"]) == (st.st_size, st.st_mtime_ns):
+                    entry["hash"] = prev["hash"]
+                    if carry(rel):
+                        linked += 1
+                        files[rel] = entry
+                        continue
+                elif prev and prev["size"] == st.st_size and prev["hash"]:
+                    # Touched but possibly identical: hash before paying for a copy.
+                    entry["hash"] = _file_hash(session_file)
+                    if entry["hash"] == prev["hash"] and carry(rel):
+                        linked += 1
+                        files[rel] = entry
+                        continue
+
+                dest = snapshot / rel
+                dest.parent.mkdir(exist_ok=True)
+                dest.unlink(missing_ok=True)
+                entry["hash"] = _copy_hashed(session_file, dest)
+                files[rel] = entry
+                copied += 1
+
+    # Additive: sessions deleted at the source stay in every later snapshot.
+    for rel, prev in prev_files.items():
+        if rel not in files and carry(rel):
+            files[rel] = prev
+
+    manifest = {"snapshot": timestamp, "files": files}
+    tmp = root / f"{SESSIONS_MANIFEST}.tmp"
+    tmp.write_text(json.dumps(manifest))
+    tmp.replace(root / SESSIONS_MANIFEST)
+
+    latest = root / LATEST_LINK
+    latest.unlink(missing_ok=True)
+    latest.symlink_to(timestamp)
+
+    os.chmod(snapshot, 0o555)
+    os.chmod(root, 0o555)
+
+    def count(entries: dict, provider: str) -> int:
+        return sum(1 for rel in entries if rel.startswith(f"{provider}/"))
+
+    before = {p: count(prev_files, p) for p in providers.PROVIDER_NAMES}
+    after = {p: count(files, p) for p in providers.PROVIDER_NAMES}
     return {
+        "snapshot": str(snapshot),
         "before": before,
         "after": after,
         "added": {p: after[p] - before[p] for p in providers.PROVIDER_NAMES},
+        "copied": copied,
+        "linked": linked,
     }
 
 
+ARCHIVE_COMPRESSION = {"xz": "xz", "gz": "gz"}
+_ARCHIVE_DATA = "data"
+_ARCHIVE_SESSIONS = "sessions"
+
+
+def write_archive(
+    dest: Path,
+    compression: str = "xz",
+    on_progress: ProgressCallback | None = None,
+) -> dict:
+    """Stream database snapshots and session files into one compressed tar.
+
+    The tar is written in stream mode ("w|xz"/"w|gz"): one pass, nothing buffered
+    beyond a block, and each database snapshot lives on disk only until it is
+    added. Databases are snapshotted online through the backup API.
+
+    Returns:
+        Counts of archived databases and session files, and the archive size
+    """
+    if compression not in ARCHIVE_COMPRESSION:
+        raise ValueError(f"Unknown compression '{compression}' (use: xz, gz)")
+
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    counts = {"databases": 0, "sessions": 0}
+    tmp_dest = dest.with_name(f".{dest.name}.tmp")
+    with tarfile.open(str(tmp_dest), f"w|{ARCHIVE_COMPRESSION[compression]}") as tar:
+        src = paths.dot_space()
+        with tempfile.TemporaryDirectory(dir=dest.parent) as scratch:
+            for db_file in sorted(src.glob("*.db")) if src.exists() else []:
+                snapshot = Path(scratch) / db_file.name
+                _snapshot_db(db_file, snapshot, on_progress)
+                tar.add(snapshot, arcname=f"{_ARCHIVE_DATA}/{db_file.name}")
+                snapshot.unlink()
+                counts["databases"] += 1
+
+        sessions = paths.sessions_dir()
+        if sessions.exists():
+            for provider_dir in sorted(sessions.iterdir()):
+                if not provider_dir.is_dir():
+                    continue
+                for session_file in sorted(provider_dir.iterdir()):
+                    if session_file.is_file():
+                        arcname = f"{_ARCHIVE_SESSIONS}/{provider_dir.name}/{session_file.name}"
+                        tar.add(session_file, arcname=arcname)
+                        counts["sessions"] += 1
+    tmp_dest.replace(dest)
+    return {**counts, "bytes": dest.stat().st_size}
+
+
+def _restore_target(name: str) -> Path | None:
+    """Map an archive member to its destination; None for anything unexpected."""
+    parts = Path(name).parts
+    if any(part in ("", ".", "..") for part in parts) or Path(name).is_absolute():
+        return None
+    if len(parts) == 2 and parts[0] == _ARCHIVE_DATA and parts[1].endswith(".db"):
+        return paths.dot_space() / parts[1]
+    if len(parts) == 3 and parts[0] == _ARCHIVE_SESSIONS:
+        return paths.sessions_dir() / parts[1] / parts[2]
+    return None
+
+
+def restore_archive(archive: Path) -> dict:
+    """Stream a `space backup --archive` tar back into ~/.space.
+
+    Members are extracted one at a time (compression is auto-detected). Databases
+    replace the live files atomically; the current ones are kept as
+    `<name>.pre-restore` and stale WAL/SHM files are removed first.
+    """
+    from space.lib import store
+
+    store.close_all()
+    counts = {"databases": 0, "sessions": 0, "skipped": 0}
+    with tarfile.open(archive, "r|*") as tar:
+        for member in tar:
+            target = _restore_target(member.name)
+            if target is None or not member.isfile():
+                counts["skipped"] += 1
+                continue
+
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f".{target.name}.restore")
+            with tar.extractfile(member) as fin, open(tmp, "wb") as fout:
+                shutil.copyfileobj(fin, fout, _COPY_CHUNK)
+            os.utime(tmp, (member.mtime, member.mtime))
+
+            if member.name.startswith(f"{_ARCHIVE_DATA}/"):
+                if target.exists():
+                    target.replace(target.with_name(f"{target.name}.pre-restore"))
+                for suffix in ("-wal", "-shm"):
+                    target.with_name(target.name + suffix).unlink(missing_ok=True)
+                counts["databases"] += 1
+            else:
+                counts["sessions"] += 1
+            tmp.replace(target)
+    return counts
+
+
+def _get_db_stats(db_file: Path, verify: bool = False) -> dict:
+    """Table and approximate row counts for a backup copy.
+
+    Counts come from health's quick tier (sqlite_stat1, else MAX(rowid)), so no
+    table is scanned. The full quick_check only runs with verify=True.
+    """
+    from space.workspace import health
+
+    try:
+        with sqlite3.connect(str(db_file), timeout=2, check_same_thread=False) as conn:
+            if verify:
+                result = conn.execute("PRAGMA quick_check").fetchone()[0]
+                if result != "ok":
+                    logger.error(f"Backup integrity check failed for {db_file.name}: {result}")
+            tables = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT name FROM sqlite_master WHERE type='table' "
+                    "AND name NOT LIKE 'sqlite_%' AND name != '_migrations'"
+                )
+            ]
+            counts = health.approximate_counts(conn, tables)
+            return {"tables": len(tables), "rows": sum(n or 0 for n in counts.values())}
+    except sqlite3.DatabaseError as e:
+        logger.debug(f"Could not read stats from {db_file.name}: {e}")
+        return {"tables": 0, "rows": 0}
+
+
 def _get_backup_stats(backup_path: Path) -> dict:
     stats = {}
     for db_file in backup_path.glob("*.db"):
-        try:
-            db_file.chmod(0o644)
-            with sqlite3.connect(str(db_file), timeout=2, check_same_thread=False) as conn:
-                cursor = conn.execute(
-                    "SELECT name FROM sqlite_master WHERE type='table' AND name != '_migrations'"
-                )
-                tables = [row[0] for row in cursor.fetchall()]
-
-                total = (
-                    sum(
-                        conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
-                        for table in tables
-                    )
-                    if tables
-                    else 0
-                )
+        db_file.chmod(0o644)
+        stats[db_file.name] = _get_db_stats(db_file)
+    return stats
 
-                stats[db_file.name] = {
-                    "tables": len(tables),
-                    "rows": total,
-                }
-        except sqlite3.DatabaseError as e:
-            logger.debug(f"Could not read stats from {db_file.name}: {e}")
-            stats[db_file.name] = {"tables": 0, "rows": 0}
 
-    return stats
+def _echo_progress(db_name: str, done: int, total: int) -> None:
+    end = "\n" if done >= total else ""
+    typer.echo(f"\r  {db_name}: {done}/{total} pages{end}", nl=False)
+
+
+_INCREMENTAL = typer.Option(
+    False, "--incremental", "-i", help="Store only pages changed since the last snapshot."
+)
+_ARCHIVE = typer.Option(
+    False, "--archive", "-a", help="Write one compressed tar instead of snapshot directories."
+)
+_COMPRESSION = typer.Option("xz", "--compression", help="Archive compression: xz or gz.")
+_OUTPUT = typer.Option(
+    None, "--output", "-o", help="Archive path (default: ~/.space_backups/archives/)."
+)
+_VERIFY = typer.Option(False, "--verify", help="Run a full quick_check on each database copy.")
 
 
 @app.callback(invoke_without_command=True)
-def callback(ctx: typer.Context):
+def callback(
+    ctx: typer.Context,
+    incremental: bool = _INCREMENTAL,
+    archive: bool = _ARCHIVE,
+    compression: str = _COMPRESSION,
+    output_path: Path | None = _OUTPUT,
+    verify: bool = _VERIFY,
+):
     if ctx.invoked_subcommand is None:
-        _do_backup(quiet_output=False)
+        _do_backup(
+            quiet_output=False,
+            incremental=incremental,
+            archive=archive,
+            compression=compression,
+            output_path=output_path,
+            verify=verify,
+        )
 
 
 @app.command()
@@ -137,31 +529,102 @@ def backup(
     quiet_output: bool = typer.Option(
         False, "--quiet", "-q", help="Suppress non-essential output."
     ),
+    incremental: bool = _INCREMENTAL,
+    archive: bool = _ARCHIVE,
+    compression: str = _COMPRESSION,
+    output_path: Path | None = _OUTPUT,
+    verify: bool = _VERIFY,
 ):
     """Backup ~/.space/data and ~/.space/sessions to ~/.space_backups/.
 
     Data backups are immutable and timestamped: ~/.space_backups/data/{timestamp}/
-    Session backups mirror structure: ~/.space_backups/sessions/{provider}/*.jsonl (additive)
+    They are taken online, so agents keep writing while a backup runs.
+    Session backups are timestamped too: ~/.space_backups/sessions/{timestamp}/{provider}/
+    Unchanged files are hardlinked from the previous snapshot (additive; `latest` symlink)
+    With --archive, everything streams into one tar.xz (or tar.gz); see `space restore`.
+    Row counts are approximate; --verify adds a full quick_check of each copy.
     """
-    _do_backup(quiet_output)
+    _do_backup(quiet_output, incremental, archive, compression, output_path, verify)
 
 
-def _do_backup(quiet_output: bool = False):
+def restore(
+    archive: Annotated[Path, typer.Argument(help="Archive written by `space backup --archive`.")],
+    quiet_output: bool = typer.Option(
+        False, "--quiet", "-q", help="Suppress non-essential output."
+    ),
+):
+    """Restore databases and sessions from a backup archive into ~/.space."""
+    if not archive.is_file():
+        typer.echo(f"Archive not found: {archive}", err=True)
+        raise typer.Exit(1)
+    try:
+        counts = restore_archive(archive)
+    except (tarfile.TarError, OSError) as e:
+        typer.echo(f"Restore failed: {e}", err=True)
+        raise typer.Exit(1) from e
+    if not quiet_output:
+        typer.echo(
+            f"✓ Restored {counts['databases']} databases, {counts['sessions']} session files"
+        )
+        if counts["skipped"]:
+            typer.echo(f"  skipped {counts['skipped']} unexpected entries")
+
+
+def _do_archive(quiet_output: bool, timestamp: str, compression: str, output_path: Path | None):
+    dest = output_path or paths.backup_archives_dir() / f"space-{timestamp}.tar.{compression}"
+    try:
+        result = write_archive(
+            dest, compression, on_progress=None if quiet_output else _echo_progress
+        )
+    except ValueError as e:
+        typer.echo(str(e), err=True)
+        raise typer.Exit(1) from e
+    if not quiet_output:
+        typer.echo(f"✓ Archive: {dest} ({result['bytes'] / 1024 / 1024:.1f} MiB)")
+        typer.echo(f"  {result['databases']} databases, {result['sessions']} session files")
+
+
+def _do_backup(
+    quiet_output: bool = False,
+    incremental: bool = False,
+    archive: bool = False,
+    compression: str = "xz",
+    output_path: Path | None = None,
+    verify: bool = False,
+):
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    data_stats = _backup_data_snapshot(timestamp, quiet_output)
-    session_stats = _backup_sessions(quiet_output)
+    if archive:
+        _do_archive(quiet_output, timestamp, compression, output_path)
+        return
+
+    data_stats = _backup_data_snapshot(
+        timestamp,
+        quiet_output,
+        incremental=incremental,
+        on_progress=None if quiet_output else _echo_progress,
+        verify=verify,
+    )
+    session_stats = _backup_sessions(quiet_output, timestamp)
 
     if not quiet_output:
         typer.echo(f"✓ Data: {paths.backup_snapshot(timestamp)}")
+        manifest = _read_manifest(paths.backup_snapshot(timestamp)).get("databases", {})
         for db, info in data_stats.items():
             if "error" in info:
                 typer.echo(f"  {db}: {info['error']}")
-            else:
-                typer.echo(f"  {db}: {info['tables']} tables, {info['rows']} rows")
+                continue
+            line = f"  {db}: {info['tables']} tables, ~{info['rows']} rows"
+            entry = manifest.get(db, {})
+            if entry.get("mode") == "delta":
+                line += f" (delta: {entry['changed']}/{entry['pages']} pages)"
+            typer.echo(line)
 
         added = session_stats.get("added", {})
         total_added = sum(added.values())
-        typer.echo(f"✓ Sessions: +{total_added} files")
+        typer.echo(
+            f"✓ Sessions: +{total_added} files "
+            f"({session_stats.get('copied', 0)} copied, {session_stats.get('linked', 0)} linked)"
+        )
 
 
 def main() -> None:
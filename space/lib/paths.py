@@ -48,6 +48,10 @@ def backup_sessions_dir() -> Path:
     return backups_dir() / "sessions"
 
 
+def backup_archives_dir() -> Path:
+    return backups_dir() / "archives"
+
+
 def validate_domain_path(domain: str) -> tuple[bool, str]:
     if not domain:
         return False, "Domain/topic cannot be empty"
@@ -1,13 +1,21 @@
 """Database connection management and utilities."""
 
 from space.lib.store.connection import (
+    Pool,
     Row,
     _reset_for_testing,
     close_all,
     database_exists,
     ensure,
     from_row,
+    from_rows,
+    mapper,
+    pool,
+    read,
     set_test_db_path,
+    transaction,
+    write,
+    write_batched,
 )
 from space.lib.store.health import (
     check_backup_has_data,
@@ -18,7 +26,15 @@ from space.lib.store.sqlite import connect, resolve
 
 __all__ = [
     "ensure",
+    "read",
+    "write",
+    "write_batched",
+    "transaction",
+    "pool",
+    "Pool",
     "from_row",
+    "from_rows",
+    "mapper",
     "Row",
     "database_exists",
     "_reset_for_testing",
@@ -0,0 +1,136 @@
+"""Async store access for the API layer, on aiosqlite.
+
+Mirrors `store.read()` / `store.write_batched()` for code running on an event
+loop. Reader connections come from the same `sqlite.connect()` (pragmas,
+`query_only`, tracing) and each runs its queries on its own aiosqlite thread,
+so a slow query never blocks the loop. Migrations run once through the sync
+pool before the first async connection opens. Writes still go through the
+sync pool's single writer, off-loop, so there is never a second writer.
+
+Usage:
+    async with store.aio.read() as conn:
+        rows = await conn.execute_fetchall("SELECT ...", params)
+"""
+
+import asyncio
+import sqlite3
+import threading
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import Any
+
+import aiosqlite
+
+from space.lib.store import connection
+from space.lib.store.batch import WriteJob
+from space.lib.store.sqlite import connect
+
+_pools: dict[str, "AsyncPool"] = {}
+
+
+class _Connection(aiosqlite.Connection):
+    def __init__(self, db_path: Path):
+        super().__init__(lambda: connect(db_path, query_only=True), iter_chunk_size=64)
+        # Worker threads must not keep the process alive if a pool is never closed.
+        # aiosqlite < 0.22 runs the connection itself as the thread; later wraps one.
+        thread = self if isinstance(self, threading.Thread) else self._thread
+        thread.daemon = True
+
+
+class AsyncPool:
+    """Bounded read-only aiosqlite connections for one database on one event loop."""
+
+    def __init__(self, db_path: Path, max_readers: int):
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self.loop = asyncio.get_running_loop()
+        self._slots = asyncio.Semaphore(max_readers)
+        self._idle: list[aiosqlite.Connection] = []
+        self._closed = False
+
+    @asynccontextmanager
+    async def read(self) -> AsyncIterator[aiosqlite.Connection]:
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else await _Connection(self.db_path)
+            try:
+                yield conn
+            finally:
+                if conn.in_transaction:
+                    await conn.rollback()
+                if self._closed:
+                    await conn.close()
+                else:
+                    self._idle.append(conn)
+
+    def stats(self) -> dict[str, int]:
+        return {"max_readers": self.max_readers, "idle_readers": len(self._idle)}
+
+    async def close(self) -> None:
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await conn.close()
+
+    def stop(self) -> None:
+        """Close idle connections without awaiting (for sync teardown)."""
+        self._closed = True
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.stop()
+
+
+async def pool() -> AsyncPool:
+    """Return the async pool for the active database on the running loop."""
+    sync_pool = connection._pools.get(str(connection._db_path()))
+    if sync_pool is None:
+        # First touch applies migrations; keep the file I/O off the loop.
+        sync_pool = await asyncio.to_thread(connection.pool)
+
+    key = str(sync_pool.db_path)
+    existing = _pools.get(key)
+    if existing is not None and existing.loop is asyncio.get_running_loop():
+        return existing
+    if existing is not None:
+        existing.stop()
+
+    created = AsyncPool(sync_pool.db_path, sync_pool.max_readers)
+    _pools[key] = created
+    return created
+
+
+@asynccontextmanager
+async def read() -> AsyncIterator[aiosqlite.Connection]:
+    """Async read intent: pooled `query_only` connection whose queries run off-loop."""
+    async with (await pool()).read() as conn:
+        yield conn
+
+
+async def write(job: WriteJob) -> Any:
+    """Async write intent: run `job(conn)` on the shared writer via group commit."""
+    return await asyncio.to_thread(connection.write_batched, job)
+
+
+async def fetchall(sql: str, params: Any = ()) -> list[sqlite3.Row]:
+    async with read() as conn:
+        return list(await conn.execute_fetchall(sql, params))
+
+
+async def fetchone(sql: str, params: Any = ()) -> sqlite3.Row | None:
+    async with read() as conn, conn.execute(sql, params) as cursor:
+        return await cursor.fetchone()
+
+
+async def close_all() -> None:
+    pools = list(_pools.values())
+    _pools.clear()
+    for p in pools:
+        await p.close()
+
+
+def stop_all() -> None:
+    """Sync counterpart of close_all(), used by store.close_all()."""
+    pools = list(_pools.values())
+    _pools.clear()
+    for p in pools:
+        p.stop()
@@ -0,0 +1,257 @@
+"""Cold tier: old messages and transcripts moved out of space.db.
+
+`space-archive.db` sits next to `space.db` and holds rows that reads almost
+never touch: messages older than a cutoff or in archived channels, and
+transcripts of sessions that went quiet before it. Moving them keeps the hot
+database (and its FTS indexes, page cache and backups) small.
+
+Reads opt in with `attached(conn)`, which ATTACHes the archive as schema
+`archive` so queries can UNION `main.*` with `archive.*`. Nothing attaches it
+by default.
+"""
+
+import logging
+import sqlite3
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager, nullcontext
+from datetime import datetime, timedelta
+
+from space.lib.store import connection
+
+logger = logging.getLogger(__name__)
+
+ARCHIVE_FILE = "space-archive.db"
+SCHEMA = "archive"
+DEFAULT_BATCH = 5000
+
+_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS archive.messages (
+    message_id TEXT PRIMARY KEY,
+    channel_id TEXT NOT NULL,
+    agent_id TEXT NOT NULL,
+    content TEXT NOT NULL,
+    created_at TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS archive.idx_messages_channel_created
+    ON messages(channel_id, created_at);
+
+CREATE TABLE IF NOT EXISTS archive.transcripts (
+    id INTEGER PRIMARY KEY,
+    session_id TEXT NOT NULL,
+    message_index INTEGER NOT NULL,
+    provider TEXT NOT NULL,
+    type TEXT NOT NULL,
+    identity TEXT,
+    content TEXT NOT NULL,
+    timestamp INTEGER NOT NULL,
+    UNIQUE (session_id, message_index)
+);
+
+CREATE VIRTUAL TABLE IF NOT EXISTS archive.messages_fts USING fts5(
+    content,
+    content='messages',
+    content_rowid='rowid'
+);
+CREATE VIRTUAL TABLE IF NOT EXISTS archive.transcripts_fts USING fts5(
+    content,
+    type UNINDEXED,
+    provider UNINDEXED,
+    content='transcripts',
+    content_rowid='id'
+);
+
+CREATE TRIGGER IF NOT EXISTS archive.messages_ai AFTER INSERT ON messages BEGIN
+    INSERT INTO messages_fts(rowid, content) VALUES (new.rowid, new.content);
+END;
+CREATE TRIGGER IF NOT EXISTS archive.messages_ad AFTER DELETE ON messages BEGIN
+    INSERT INTO messages_fts(messages_fts, rowid, content)
+    VALUES ('delete', old.rowid, old.content);
+END;
+CREATE TRIGGER IF NOT EXISTS archive.transcripts_ai AFTER INSERT ON transcripts BEGIN
+    INSERT INTO transcripts_fts(rowid, content, type, provider)
+    VALUES (new.id, new.content, new.type, new.provider);
+END;
+CREATE TRIGGER IF NOT EXISTS archive.transcripts_ad AFTER DELETE ON transcripts BEGIN
+    INSERT INTO transcripts_fts(transcripts_fts, rowid, content, type, provider)
+    VALUES ('delete', old.id, old.content, old.type, old.provider);
+END;
+"""
+
+_MESSAGE_COLUMNS = "message_id, channel_id, agent_id, content, created_at"
+_TRANSCRIPT_COLUMNS = "session_id, message_index, provider, type, identity, content, timestamp"
+
+
+def path():
+    return connection._db_path().parent / ARCHIVE_FILE
+
+
+def exists() -> bool:
+    return path().exists()
+
+
+def is_attached(conn: sqlite3.Connection) -> bool:
+    return any(row[1] == SCHEMA for row in conn.execute("PRAGMA database_list"))
+
+
+@contextmanager
+def attached(conn: sqlite3.Connection, create: bool = False) -> Iterator[bool]:
+    """ATTACH the archive as `archive` for the scope.
+
+    Yields False (attaching nothing) when there is no archive yet and `create`
+    is not set. Already-attached connections are left attached.
+    """
+    if is_attached(conn):
+        yield True
+        return
+    if not create and not exists():
+        yield False
+        return
+
+    conn.execute(f"ATTACH DATABASE ? AS {SCHEMA}", (str(path()),))
+    try:
+        if create:
+            conn.executescript(_SCHEMA_SQL)
+        yield True
+    finally:
+        try:
+            conn.execute(f"DETACH DATABASE {SCHEMA}")
+        except sqlite3.OperationalError as e:
+            logger.warning(f"Failed to detach archive: {e}")
+
+
+def attached_if(conn: sqlite3.Connection, wanted: bool):
+    """`attached(conn)` when the caller asked for archived rows, else a no-op yielding False."""
+    return attached(conn) if wanted else nullcontext(False)
+
+
+def _cutoff(older_than_days: int) -> datetime:
+    return datetime.now() - timedelta(days=older_than_days)
+
+
+def _move_batch(
+    conn: sqlite3.Connection,
+    table: str,
+    key: str,
+    columns: str,
+    select_keys: str,
+    archived: str,
+    params: tuple,
+) -> int:
+    """Copy one batch into the archive, then delete it from main.
+
+    Two transactions: the copy commits before the delete, so a crash in between
+    leaves rows in both tiers (skipped as duplicates next run), never in neither.
+    Main rows are deleted only once `archived` confirms their copy exists.
+    Moved messages stay in their channel, so the delete pauses the channel
+    counter trigger (see migration 009) and channel_stats/channel_members keep
+    counting both tiers.
+    """
+    conn.execute("BEGIN IMMEDIATE")
+    conn.execute("DELETE FROM temp._archive_batch")
+    conn.execute(f"INSERT INTO temp._archive_batch (key) {select_keys}", params)
+    if not conn.execute("SELECT 1 FROM temp._archive_batch LIMIT 1").fetchone():
+        conn.execute("COMMIT")
+        return 0
+    conn.execute(
+        f"INSERT OR IGNORE INTO archive.{table} ({columns}) "
+        f"SELECT {columns} FROM main.{table} WHERE {key} IN (SELECT key FROM temp._archive_batch)"
+    )
+    conn.execute("COMMIT")
+
+    conn.execute("BEGIN IMMEDIATE")
+    if table == "messages":
+        conn.execute("INSERT OR IGNORE INTO main.paused_triggers VALUES ('channel_stats_ad')")
+    moved = conn.execute(
+        f"DELETE FROM main.{table} AS m "
+        f"WHERE m.{key} IN (SELECT key FROM temp._archive_batch) AND {archived}"
+    ).rowcount
+    conn.execute("DELETE FROM main.paused_triggers")
+    conn.execute("COMMIT")
+    return moved
+
+
+def move(
+    older_than_days: int,
+    batch_size: int = DEFAULT_BATCH,
+    archived_channels: bool = True,
+    on_batch: Callable[[str, int], None] | None = None,
+) -> dict[str, int]:
+    """Move cold rows from space.db into space-archive.db in batches.
+
+    Messages move if older than the cutoff or (with `archived_channels`) in an
+    archived channel; a message still referenced by a channel timer stays.
+    Transcripts move per session, once the session's last message is older
+    than the cutoff. Each batch takes the writer briefly, so live traffic
+    interleaves with a long move.
+
+    Args:
+        older_than_days: Age cutoff in days
+        batch_size: Rows per batch
+        archived_channels: Also move every message of archived channels
+        on_batch: Called with (table, rows_moved) after each batch
+
+    Returns:
+        Rows moved per table
+    """
+    cutoff = _cutoff(older_than_days).isoformat()
+    message_filter = "created_at < ?"
+    if archived_channels:
+        message_filter = (
+            f"({message_filter} OR channel_id IN "
+            "(SELECT channel_id FROM main.channels WHERE archived_at IS NOT NULL))"
+        )
+    plan = [
+        (
+            "messages",
+            "message_id",
+            _MESSAGE_COLUMNS,
+            f"SELECT message_id FROM main.messages WHERE {message_filter} "
+            "AND message_id NOT IN (SELECT timer_set_by_message_id FROM main.channels "
+            "WHERE timer_set_by_message_id IS NOT NULL) LIMIT ?",
+            "EXISTS (SELECT 1 FROM archive.messages a WHERE a.message_id = m.message_id)",
+        ),
+        (
+            # Archive ids are its own: main reuses rowids once its tail has moved out.
+            "transcripts",
+            "id",
+            _TRANSCRIPT_COLUMNS,
+            "SELECT t.id FROM main.transcripts t "
+            "JOIN main.sessions s ON s.session_id = t.session_id "
+            "WHERE s.last_message_at < ? LIMIT ?",
+            "EXISTS (SELECT 1 FROM archive.transcripts a "
+            "WHERE a.session_id = m.session_id AND a.message_index = m.message_index)",
+        ),
+    ]
+
+    totals = dict.fromkeys((table for table, *_ in plan), 0)
+    for table, key, columns, select_keys, archived in plan:
+        while True:
+            # One write scope per batch: the writer is released between batches.
+            with connection.write() as conn, attached(conn, create=True):
+                conn.execute("CREATE TEMP TABLE IF NOT EXISTS _archive_batch (key PRIMARY KEY)")
+                moved = _move_batch(
+                    conn, table, key, columns, select_keys, archived, (cutoff, batch_size)
+                )
+            if not moved:
+                break
+            totals[table] += moved
+            if on_batch:
+                on_batch(table, moved)
+    return totals
+
+
+def stats() -> dict[str, int]:
+    """Row counts in the archive (empty if there is none)."""
+    with connection.read() as conn, attached(conn) as present:
+        if not present:
+            return {}
+        return {
+            table: conn.execute(f"SELECT COUNT(*) FROM archive.{table}").fetchone()[0]
+            for table in ("messages", "transcripts")
+        }
+
+
+def forget_session(conn: sqlite3.Connection, session_id: str) -> None:
+    """Drop a session's archived transcripts (it is being re-indexed into main)."""
+    if is_attached(conn):
+        conn.execute("DELETE FROM archive.transcripts WHERE session_id = ?", (session_id,))
@@ -0,0 +1,175 @@
+"""Group commit: coalesce concurrent small writes into one transaction.
+
+Every autocommit write costs a WAL fsync. Under a swarm of `bridge send` /
+`bridge recv` callers that fsync is the ceiling, not SQLite itself. The
+committer queues write jobs, drains whatever arrived within the commit
+window (or up to the batch size), and runs them in a single transaction.
+Each job gets its own SAVEPOINT, so one failing job rolls back alone and
+its caller receives the exception while the rest of the batch commits.
+"""
+
+import logging
+import os
+import queue
+import sqlite3
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from space.lib.store.connection import Pool
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_WINDOW_MS = 0.0
+DEFAULT_MAX_BATCH = 256
+
+WriteJob = Callable[[sqlite3.Connection], Any]
+
+_STOP = object()
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.environ.get(name, default))
+    except ValueError:
+        return default
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return max(1, int(os.environ.get(name, default)))
+    except ValueError:
+        return default
+
+
+class GroupCommitter:
+    """Background flusher that commits queued write jobs in batches.
+
+    Args:
+        pool: Pool whose writer connection executes the batches
+        window_ms: How long to keep collecting after the first job arrives.
+            0 commits whatever queued up while the previous batch was committing.
+        max_batch: Upper bound on jobs per transaction
+    """
+
+    def __init__(
+        self,
+        pool: "Pool",
+        window_ms: float | None = None,
+        max_batch: int | None = None,
+    ):
+        self.pool = pool
+        self.window_ms = (
+            window_ms
+            if window_ms is not None
+            else _env_float("SPACE_DB_COMMIT_WINDOW_MS", DEFAULT_WINDOW_MS)
+        )
+        self.max_batch = (
+            max_batch
+            if max_batch is not None
+            else _env_int("SPACE_DB_COMMIT_BATCH", DEFAULT_MAX_BATCH)
+        )
+        self.batches = 0
+        self.jobs = 0
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._thread: threading.Thread | None = None
+        self._start_lock = threading.Lock()
+
+    def submit(self, job: WriteJob) -> Future:
+        """Queue a write job; the future resolves once its batch commits."""
+        self._ensure_started()
+        future: Future = Future()
+        self._queue.put((job, future))
+        return future
+
+    def run(self, job: WriteJob) -> Any:
+        """Queue a write job and block until it commits. Returns the job's result."""
+        if self.pool.holds_writer():
+            # Caller already owns the writer (nested write scope): run inline.
+            with self.pool.write() as conn:
+                return job(conn)
+        return self.submit(job).result()
+
+    def stop(self) -> None:
+        with self._start_lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._start_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._loop, name="store-group-commit", daemon=True
+                )
+                self._thread.start()
+
+    def _loop(self) -> None:
+        while True:
+            first = self._queue.get()
+            if first is _STOP:
+                return
+
+            batch = [first]
+            stopping = self._collect(batch)
+            self._commit(batch)
+            if stopping:
+                return
+
+    def _collect(self, batch: list) -> bool:
+        deadline = time.monotonic() + self.window_ms / 1000
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            try:
+                item = (
+                    self._queue.get(timeout=remaining)
+                    if remaining > 0
+                    else self._queue.get_nowait()
+                )
+            except queue.Empty:
+                return False
+            if item is _STOP:
+                return True
+            batch.append(item)
+        return False
+
+    def _commit(self, batch: list) -> None:
+        outcomes: list[tuple[Future, Any, BaseException | None]] = []
+        try:
+            with self.pool.write() as conn:
+                conn.execute("BEGIN IMMEDIATE")
+                for job, future in batch:
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    conn.execute("SAVEPOINT job")
+                    try:
+                        result = job(conn)
+                    except BaseException as e:
+                        conn.execute("ROLLBACK TO job")
+                        conn.execute("RELEASE job")
+                        outcomes.append((future, None, e))
+                        continue
+                    conn.execute("RELEASE job")
+                    outcomes.append((future, result, None))
+        except BaseException as e:
+            logger.error(f"Group commit of {len(batch)} writes failed: {e}")
+            for _, future in batch:
+                if future.done():
+                    continue
+                if future.running() or future.set_running_or_notify_cancel():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.jobs += len(outcomes)
+        for future, result, error in outcomes:
+            if error is not None:
+                future.set_exception(error)
+            else:
+                future.set_result(result)
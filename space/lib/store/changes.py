@@ -0,0 +1,74 @@
+"""Cheap change detection for blocking readers (bridge wait).
+
+`PRAGMA data_version` on a connection changes whenever another connection
+(in this process or any other) commits to the database. Reading it touches only
+the shared-memory WAL index, so a watcher can check it every millisecond or so
+for far less than one indexed query. Waiters check it with exponential backoff
+and run their real query only after a commit has landed.
+"""
+
+import os
+import sqlite3
+import time
+from pathlib import Path
+
+from space.lib.store import connection
+from space.lib.store.sqlite import connect
+
+MIN_INTERVAL_S = 0.001
+# Ceiling for the backoff: worst-case latency from a commit to a waiter noticing it.
+MAX_INTERVAL_S = float(os.environ.get("SPACE_WAIT_MAX_MS", "50")) / 1000
+
+
+class Watcher:
+    """Detects commits through a private connection's data_version.
+
+    The connection must stay the same for the counter to mean anything, so the
+    watcher holds its own rather than borrowing from the reader pool.
+    """
+
+    def __init__(self, db_path: Path | None = None):
+        self._conn: sqlite3.Connection = connect(
+            db_path or connection.pool().db_path, query_only=True
+        )
+        self._version = self._read()
+
+    def _read(self) -> int:
+        return self._conn.execute("PRAGMA data_version").fetchone()[0]
+
+    def changed(self) -> bool:
+        """True once per batch of commits made since the last call."""
+        version = self._read()
+        if version == self._version:
+            return False
+        self._version = version
+        return True
+
+    def wait(self, timeout: float | None = None, max_interval: float | None = None) -> bool:
+        """Block until a commit lands (True) or `timeout` seconds pass (False).
+
+        Sleeps start at MIN_INTERVAL_S and double up to `max_interval`, so a
+        busy database is noticed within milliseconds and an idle one costs a
+        handful of pragma reads per second.
+        """
+        ceiling = MAX_INTERVAL_S if max_interval is None else max_interval
+        deadline = None if timeout is None else time.monotonic() + timeout
+        interval = MIN_INTERVAL_S
+        while not self.changed():
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                interval = min(interval, remaining)
+            time.sleep(interval)
+            interval = min(interval * 2, ceiling)
+        return True
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "Watcher":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
@@ -1,12 +1,18 @@
+import collections
 import contextvars
+import os
 import sqlite3
+import sys
 import threading
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from dataclasses import fields
 from pathlib import Path
 from typing import Any, TypeVar
 
 from space.lib import paths
 from space.lib.store import migrations
+from space.lib.store.batch import GroupCommitter, WriteJob
 from space.lib.store.sqlite import connect
 
 T = TypeVar("T")
@@ -14,8 +20,8 @@ T = TypeVar("T")
 Row = sqlite3.Row
 
 _DB_FILE = "space.db"
-_connections = threading.local()
-_migrations_loaded = threading.local()
+_pools: dict[str, "Pool"] = {}
+_pools_lock = threading.Lock()
 
 # Context variable for test isolation - overrides paths.dot_space()
 _db_path_override: contextvars.ContextVar[Path | None] = contextvars.ContextVar(
@@ -28,55 +34,321 @@ def database_exists() -> bool:
     return (paths.dot_space() / _DB_FILE).exists()
 
 
+_mappers: dict[tuple[type, tuple[str, ...]], Callable[[Any], Any]] = {}
+
+
+def _compile_mapper(dataclass_type: type[T], columns: tuple[str, ...]) -> Callable[[Any], T]:
+    field_names = {f.name for f in fields(dataclass_type)}
+    # Last occurrence wins for duplicate column names, as with dict(row).
+    positions = {name: i for i, name in enumerate(columns) if name in field_names}
+    args = ", ".join(f"{name}=row[{i}]" for name, i in positions.items())
+    namespace: dict[str, Any] = {"cls": dataclass_type}
+    exec(f"def build(row):\n    return cls({args})", namespace)  # noqa: S102
+    return namespace["build"]
+
+
+def mapper(dataclass_type: type[T], columns: Iterable[str]) -> Callable[[Any], T]:
+    """Return a cached row -> dataclass builder for a column layout.
+
+    The builder indexes rows positionally, so it works for sqlite3.Row and plain
+    tuples alike. Compiled once per (dataclass, columns) pair.
+    """
+    key = (dataclass_type, tuple(columns))
+    build = _mappers.get(key)
+    if build is None:
+        build = _mappers[key] = _compile_mapper(dataclass_type, key[1])
+    return build
+
+
+def from_rows(cursor: sqlite3.Cursor, dataclass_type: type[T]) -> list[T]:
+    """Fetch all remaining rows from cursor as dataclass instances."""
+    rows = cursor.fetchall()
+    if not rows:
+        return []
+    build = mapper(dataclass_type, (d[0] for d in cursor.description))
+    return [build(row) for row in rows]
+
+
 def from_row(row: dict[str, Any] | Any, dataclass_type: type[T]) -> T:
     """Convert dict-like row to dataclass instance.
 
     Backend-agnostic: works with sqlite3.Row, dict, or any dict-like object.
+    Prefer from_rows() for result sets.
     """
-    field_names = {f.name for f in fields(dataclass_type)}
+    if isinstance(row, sqlite3.Row):
+        return mapper(dataclass_type, row.keys())(row)
     row_dict = dict(row) if not isinstance(row, dict) else row
-    kwargs = {key: row_dict[key] for key in field_names if key in row_dict}
-    return dataclass_type(**kwargs)
+    return mapper(dataclass_type, row_dict.keys())(tuple(row_dict.values()))
 
 
-def ensure() -> sqlite3.Connection:
-    """Ensure space.db exists with schema/migrations applied.
+class _WriteQueue:
+    """Reentrant FIFO lock: writers get the connection in arrival order."""
 
-    Returns cached connection via threading.local().
-    Uses _db_path_override context var if set (for test isolation).
+    def __init__(self) -> None:
+        self._cond = threading.Condition()
+        self._waiting: collections.deque[int] = collections.deque()
+        self._owner: int | None = None
+        self._depth = 0
+
+    def acquire(self) -> None:
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return
+            self._waiting.append(me)
+            while self._owner is not None or self._waiting[0] != me:
+                self._cond.wait()
+            self._waiting.popleft()
+            self._owner = me
+            self._depth = 1
+
+    def release(self) -> None:
+        with self._cond:
+            self._depth -= 1
+            if self._depth == 0:
+                self._owner = None
+                self._cond.notify_all()
+
+    def held(self) -> bool:
+        return self._owner == threading.get_ident()
+
+    def depth(self) -> int:
+        with self._cond:
+            return len(self._waiting)
+
+
+class Pool:
+    """Bounded read-only connections plus one serialized writer for a database file.
+
+    Readers are `query_only` and never touch the WAL write lock, so they proceed
+    while a write is in flight. All writes go through the single writer connection,
+    handed out in FIFO order, so SQLite never sees two writers contend for the lock.
     """
+
+    def __init__(self, db_path: Path, max_readers: int, writer: sqlite3.Connection | None = None):
+        self.db_path = db_path
+        self.max_readers = max_readers
+        self._slots = threading.BoundedSemaphore(max_readers)
+        self._idle: list[sqlite3.Connection] = []
+        self._idle_lock = threading.Lock()
+        self._local = threading.local()
+        self._writes = _WriteQueue()
+        self._writer = writer
+        self._closed = False
+        self.committer = GroupCommitter(self)
+
+    @contextmanager
+    def read(self) -> Iterator[sqlite3.Connection]:
+        """Borrow a read-only connection. Nested reads on one thread share it."""
+        if self._writes.held():
+            # Read-your-writes: inside a write scope, reads see the writer's state.
+            yield self._writer
+            return
+
+        held = getattr(self._local, "reader", None)
+        if held is not None:
+            yield held
+            return
+
+        self._slots.acquire()
+        try:
+            conn = self._checkout()
+        except BaseException:
+            self._slots.release()
+            raise
+
+        self._local.reader = conn
+        try:
+            yield conn
+        finally:
+            self._local.reader = None
+            if conn.in_transaction:
+                conn.rollback()
+            self._checkin(conn)
+            self._slots.release()
+
+    @contextmanager
+    def write(self) -> Iterator[sqlite3.Connection]:
+        """Take the writer connection for the scope.
+
+        The writer autocommits each statement (see `transaction()` to group
+        several). A transaction left open by the scope is committed on exit, or
+        rolled back on error. Nested write scopes on the same thread reuse it.
+        """
+        if self._writes.held():
+            yield self._writer
+            return
+
+        self._writes.acquire()
+        try:
+            if self._writer is None:
+                self._writer = connect(self.db_path)
+            with self._writer:
+                yield self._writer
+        finally:
+            self._writes.release()
+
+    def holds_writer(self) -> bool:
+        """True if the calling thread is inside a write scope."""
+        return self._writes.held()
+
+    def stats(self) -> dict[str, int]:
+        with self._idle_lock:
+            idle = len(self._idle)
+        return {
+            "max_readers": self.max_readers,
+            "idle_readers": idle,
+            "queued_writers": self._writes.depth(),
+            "group_commits": self.committer.batches,
+            "group_committed_writes": self.committer.jobs,
+        }
+
+    def close(self) -> None:
+        self.committer.stop()
+        self._writes.acquire()
+        try:
+            self._closed = True
+            if self._writer is not None:
+                self._writer.close()
+                self._writer = None
+        finally:
+            self._writes.release()
+
+        with self._idle_lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+    def _checkout(self) -> sqlite3.Connection:
+        with self._idle_lock:
+            if self._idle:
+                return self._idle.pop()
+        return connect(self.db_path, query_only=True)
+
+    def _checkin(self, conn: sqlite3.Connection) -> None:
+        with self._idle_lock:
+            if not self._closed:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+
+def _max_readers() -> int:
+    configured = os.environ.get("SPACE_DB_READERS")
+    if configured and configured.isdigit() and int(configured) > 0:
+        return int(configured)
+    return max(2, os.cpu_count() or 1)
+
+
+def _db_path() -> Path:
     override = _db_path_override.get()
     if override:
-        db_path = override / _DB_FILE
-        cache_key = str(db_path)
-    else:
-        db_path = paths.dot_space() / _DB_FILE
-        cache_key = "space"
+        return override / _DB_FILE
+    return paths.dot_space() / _DB_FILE
+
+
+def pool() -> Pool:
+    """Return the pool for the active database, applying migrations on first use.
+
+    Migrations are checked on the pool's writer connection; a matching schema
+    fingerprint skips them entirely (see migrations.ensure_current).
+    Uses _db_path_override context var if set (for test isolation).
+    """
+    db_path = _db_path()
+    key = str(db_path)
+
+    existing = _pools.get(key)
+    if existing is not None:
+        return existing
+
+    with _pools_lock:
+        existing = _pools.get(key)
+        if existing is not None:
+            return existing
 
-    conn = getattr(_connections, cache_key, None)
-    if conn is not None:
-        return conn
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        writer = connect(db_path)
+        try:
+            migrations.ensure_current(writer, "space.core")
+        except BaseException:
+            writer.close()
+            raise
 
-    db_path.parent.mkdir(parents=True, exist_ok=True)
+        created = Pool(db_path, _max_readers(), writer=writer)
+        _pools[key] = created
+        return created
 
-    migrations_loaded = getattr(_migrations_loaded, cache_key, False)
-    if not migrations_loaded:
-        migs = migrations.load_migrations("space.core")
-        migrations.ensure_schema(db_path, migs)
-        setattr(_migrations_loaded, cache_key, True)
 
-    conn = connect(db_path)
-    setattr(_connections, cache_key, conn)
+def read() -> Any:
+    """Read intent: pooled `query_only` connection that never waits on writers.
+
+    Usage: `with store.read() as conn: conn.execute("SELECT ...")`
+    """
+    return pool().read()
 
-    return conn
+
+def write() -> Any:
+    """Write intent: exclusive use of the serialized writer connection.
+
+    Statements autocommit one by one; wrap dependent ones in `transaction(conn)`.
+
+    Usage: `with store.write() as conn: conn.execute("INSERT ...")`
+    """
+    return pool().write()
+
+
+@contextmanager
+def transaction(conn: sqlite3.Connection) -> Iterator[sqlite3.Connection]:
+    """Make the statements in the scope one transaction (BEGIN IMMEDIATE ... COMMIT).
+
+    For write scopes whose statements must land together. Joins a transaction
+    that is already open; its owner commits.
+
+    Usage: `with store.write() as conn, store.transaction(conn): ...`
+    """
+    if conn.in_transaction:
+        yield conn
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    conn.commit()
+
+
+def write_batched(job: WriteJob) -> Any:
+    """Write intent for small, frequent writes: group-committed with concurrent callers.
+
+    `job(conn)` runs inside a shared transaction under its own SAVEPOINT. Blocks
+    until the batch commits and returns the job's result, or raises its error.
+
+    Usage: `store.write_batched(lambda conn: conn.execute("UPDATE ...", params))`
+    """
+    return pool().committer.run(job)
+
+
+def ensure() -> Any:
+    """Ensure space.db exists with schema/migrations applied.
+
+    Returns a write-intent connection context (see `write()`). Prefer `read()`
+    for pure queries so they are served from the reader pool.
+    """
+    return write()
 
 
 def close_all() -> None:
-    """Close all cached connections."""
-    if hasattr(_connections, "__dict__"):
-        for conn in _connections.__dict__.values():
-            conn.close()
-        _connections.__dict__.clear()
+    """Close all pooled connections, including async pools (see store.aio)."""
+    with _pools_lock:
+        pools = list(_pools.values())
+        _pools.clear()
+    for p in pools:
+        p.close()
+
+    if "space.lib.store.aio" in sys.modules:
+        sys.modules["space.lib.store.aio"].stop_all()
 
 
 def set_test_db_path(db_dir: Path | None) -> None:
@@ -91,5 +363,3 @@ def set_test_db_path(db_dir: Path | None) -> None:
 def _reset_for_testing() -> None:
     _db_path_override.set(None)
     close_all()
-    if hasattr(_migrations_loaded, "__dict__"):
-        _migrations_loaded.__dict__.clear()
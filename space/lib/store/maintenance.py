@@ -0,0 +1,249 @@
+"""Background upkeep for space.db: checkpoints, FTS merges, statistics, vacuum.
+
+Long read transactions (SSE streams, exports) hold back auto-checkpoints, so
+the WAL keeps growing and every reader pays for it; FTS5 indexes fragment into
+many small segments as messages trickle in. `run()` loops alongside the timer
+daemon and runs each task when its interval is due:
+
+- `checkpoint`: `wal_checkpoint(PASSIVE)`, or `TRUNCATE` once the WAL is large
+- `fts`: incremental FTS5 `merge` steps, `optimize` on a longer interval once
+  merges settle
+- `optimize`: `PRAGMA optimize` (ANALYZE where the planner wants it)
+- `vacuum`: `incremental_vacuum` in small steps (only with auto_vacuum=INCREMENTAL)
+
+Every step runs in its own short write scope and stops at its time budget, so
+live writes interleave. A single SQLite statement can't be interrupted, though:
+an FTS5 'optimize' or `PRAGMA optimize` that starts inside the budget runs to
+completion, so those only start when nothing else is left to do. Results of the
+last run per task persist to `maintenance.json` next to the database.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import sqlite3
+import time
+from collections.abc import Callable
+from pathlib import Path
+from typing import Any
+
+from space.lib.store import connection
+
+logger = logging.getLogger(__name__)
+
+STATE_FILE = "maintenance.json"
+POLL_INTERVAL_SECONDS = 30
+TRUNCATE_WAL_BYTES = 64 * 1024 * 1024
+FTS_TABLES = ("messages_fts", "transcripts_fts", "memory_fts", "knowledge_fts")
+FTS_MERGE_PAGES = 500
+FTS_OPTIMIZE_EVERY_S = 24 * 3600
+VACUUM_STEP_PAGES = 256
+ANALYSIS_LIMIT = 1000
+
+# task -> (interval seconds, time budget seconds)
+SCHEDULE: dict[str, tuple[float, float]] = {
+    "checkpoint": (60, 5),
+    "fts": (600, 10),
+    "optimize": (3600, 10),
+    "vacuum": (3600, 5),
+}
+
+
+def _state_path() -> Path:
+    return connection.pool().db_path.parent / STATE_FILE
+
+
+def load_state() -> dict[str, Any]:
+    """Last-run stats per task (empty if maintenance never ran)."""
+    path = _state_path()
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state: dict[str, Any]) -> None:
+    path = _state_path()
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    tmp.replace(path)
+
+
+def _wal_bytes() -> int:
+    db_path = connection.pool().db_path
+    wal = db_path.with_name(db_path.name + "-wal")
+    return wal.stat().st_size if wal.exists() else 0
+
+
+def checkpoint(budget_s: float) -> dict[str, Any]:
+    """PASSIVE checkpoint; TRUNCATE (resetting the file) once the WAL passes the threshold."""
+    before = _wal_bytes()
+    mode = "TRUNCATE" if before > TRUNCATE_WAL_BYTES else "PASSIVE"
+    with connection.write() as conn:
+        # TRUNCATE waits for readers to move off the WAL; wait no longer than the budget.
+        timeout_ms = conn.execute("PRAGMA busy_timeout").fetchone()[0]
+        conn.execute(f"PRAGMA busy_timeout = {int(budget_s * 1000)}")
+        try:
+            busy, log_frames, done = conn.execute(f"PRAGMA wal_checkpoint({mode})").fetchone()
+        finally:
+            conn.execute(f"PRAGMA busy_timeout = {timeout_ms}")
+    return {
+        "mode": mode,
+        "busy": bool(busy),
+        "wal_frames": log_frames,
+        "checkpointed": done,
+        "wal_bytes_before": before,
+        "wal_bytes_after": _wal_bytes(),
+    }
+
+
+def _fts_tables(conn: sqlite3.Connection) -> list[str]:
+    present = {
+        row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type = 'table'")
+    }
+    return [t for t in FTS_TABLES if t in present]
+
+
+def fts(budget_s: float, optimize: bool = False) -> dict[str, Any]:
+    """Merge FTS5 segments in bounded steps until each index is settled or time runs out.
+
+    A 'merge' step that changes fewer than two rows did nothing, so the index is
+    done. With `optimize`, a settled index is then rebuilt into a single segment
+    if the budget has time left; that one statement is not bounded by it.
+    """
+    deadline = time.monotonic() + budget_s
+    with connection.read() as conn:
+        tables = _fts_tables(conn)
+
+    result: dict[str, Any] = {"optimized": [], "steps": {}, "complete": True}
+    for table in tables:
+        steps = 0
+        settled = False
+        while time.monotonic() < deadline:
+            with connection.write() as conn:
+                before = conn.total_changes
+                conn.execute(
+                    f"INSERT INTO {table}({table}, rank) VALUES ('merge', ?)",
+                    (FTS_MERGE_PAGES,),
+                )
+                changed = conn.total_changes - before
+            steps += 1
+            if changed < 2:
+                settled = True
+                break
+        result["steps"][table] = steps
+
+        if settled and optimize and time.monotonic() < deadline:
+            with connection.write() as conn:
+                conn.execute(f"INSERT INTO {table}({table}) VALUES ('optimize')")
+            result["optimized"].append(table)
+        elif not settled or optimize:
+            result["complete"] = False
+    return result
+
+
+def optimize(budget_s: float) -> dict[str, Any]:
+    """PRAGMA optimize with a bounded analysis_limit, so ANALYZE samples instead of scans.
+
+    One statement: `budget_s` does not apply; analysis_limit is what bounds it.
+    """
+    with connection.write() as conn:
+        conn.execute(f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}")
+        conn.execute("PRAGMA optimize")
+    return {"analysis_limit": ANALYSIS_LIMIT}
+
+
+def vacuum(budget_s: float) -> dict[str, Any]:
+    """Return free pages to the filesystem a few at a time.
+
+    Only databases in auto_vacuum=INCREMENTAL mode keep the bookkeeping for this;
+    switching an existing file needs `PRAGMA auto_vacuum = INCREMENTAL; VACUUM`.
+    """
+    deadline = time.monotonic() + budget_s
+    with connection.read() as conn:
+        mode = conn.execute("PRAGMA auto_vacuum").fetchone()[0]
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    if mode != 2:
+        return {"skipped": "auto_vacuum is not INCREMENTAL", "freelist_pages": free_before}
+
+    free = free_before
+    while free and time.monotonic() < deadline:
+        with connection.write() as conn:
+            conn.execute(f"PRAGMA incremental_vacuum({VACUUM_STEP_PAGES})").fetchall()
+            free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+    return {"freed_pages": free_before - free, "freelist_pages": free}
+
+
+def _fts_task(budget_s: float) -> dict[str, Any]:
+    """Merge every run; optimize once a day, counted from the first run (not at startup).
+
+    The optimize clock only resets once every index was optimized.
+    """
+    now = time.time()
+    last_optimize = load_state().get("fts", {}).get("last_optimize_at")
+    if last_optimize is None:
+        last_optimize = now
+    due = now - last_optimize >= FTS_OPTIMIZE_EVERY_S
+    result = fts(budget_s, optimize=due)
+    result["last_optimize_at"] = now if due and result["complete"] else last_optimize
+    return result
+
+
+TASKS: dict[str, Callable[[float], dict[str, Any]]] = {
+    "checkpoint": checkpoint,
+    "fts": _fts_task,
+    "optimize": optimize,
+    "vacuum": vacuum,
+}
+
+
+def run_task(name: str, budget_s: float | None = None) -> dict[str, Any]:
+    """Run one task now and persist its stats under state[name]."""
+    budget = SCHEDULE[name][1] if budget_s is None else budget_s
+    started = time.perf_counter()
+    try:
+        result = TASKS[name](budget)
+        result["ok"] = True
+    except sqlite3.Error as e:
+        logger.warning(f"Maintenance task {name} failed: {e}")
+        result = {"ok": False, "error": str(e)}
+    result["at"] = time.time()
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+
+    state = load_state()
+    state[name] = result
+    _save_state(state)
+    return result
+
+
+def due(now: float | None = None) -> list[str]:
+    """Tasks whose interval has elapsed since their last run."""
+    now = time.time() if now is None else now
+    state = load_state()
+    return [
+        name
+        for name, (interval, _) in SCHEDULE.items()
+        if now - state.get(name, {}).get("at", 0) >= interval
+    ]
+
+
+def run_due() -> dict[str, dict[str, Any]]:
+    if not connection.database_exists():
+        return {}
+    return {name: run_task(name) for name in due()}
+
+
+def run() -> None:
+    """Run due maintenance tasks forever."""
+    logger.info("Maintenance started")
+
+    while True:
+        try:
+            run_due()
+        except Exception as e:
+            logger.error(f"Maintenance error: {e}", exc_info=True)
+
+        time.sleep(POLL_INTERVAL_SECONDS)
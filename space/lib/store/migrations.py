@@ -1,5 +1,9 @@
+import functools
 import logging
+import os
+import re
 import sqlite3
+import zlib
 from collections.abc import Callable
 from pathlib import Path
 
@@ -7,6 +11,78 @@ from space.lib.store.sqlite import connect
 
 logger = logging.getLogger(__name__)
 
+# "SPAC": marks a database whose user_version holds a schema fingerprint.
+APPLICATION_ID = 0x53504143
+
+
+def _migrations_dir(module_path: str) -> Path:
+    parts = module_path.split(".")
+    module_dir = Path(__file__).parent.parent.parent
+    for part in parts[1:]:
+        module_dir = module_dir / part
+    return module_dir / "migrations"
+
+
+def _installed(path: Path) -> bool:
+    return any(part in ("site-packages", "dist-packages") for part in path.parts)
+
+
+@functools.cache
+def fingerprint(module_path: str) -> int:
+    """Fingerprint of the bundled migrations, computed once per process.
+
+    In an installed package it comes from one directory scan: names, sizes and
+    mtimes, which an install writes once and an upgrade changes. In a source
+    checkout, where migrations are edited in place and checkouts touch mtimes,
+    it hashes names and contents instead. Fits in PRAGMA user_version (signed
+    32-bit), never 0.
+    """
+    migrations_dir = _migrations_dir(module_path)
+    if not migrations_dir.exists():
+        return 1
+
+    with os.scandir(migrations_dir) as entries:
+        files = sorted((e.name, e) for e in entries if e.name.endswith(".sql"))
+    digest = 0
+    if _installed(migrations_dir):
+        keys = [(name, e.stat().st_size, e.stat().st_mtime_ns) for name, e in files]
+        digest = zlib.crc32(repr(keys).encode())
+    else:
+        for name, entry in files:
+            digest = zlib.crc32(name.encode(), digest)
+            digest = zlib.crc32(Path(entry.path).read_bytes(), digest)
+    digest &= 0x7FFFFFFF
+    return digest or 1
+
+
+def is_current(conn: sqlite3.Connection, expected: int) -> bool:
+    """Check the schema stamp written by stamp(). One read, no table scans."""
+    row = conn.execute("SELECT * FROM pragma_application_id(), pragma_user_version()").fetchone()
+    return row is not None and row[0] == APPLICATION_ID and row[1] == expected
+
+
+def stamp(conn: sqlite3.Connection, value: int) -> None:
+    conn.execute(f"PRAGMA application_id = {APPLICATION_ID}")
+    conn.execute(f"PRAGMA user_version = {int(value)}")
+
+
+def ensure_current(conn: sqlite3.Connection, module_path: str) -> bool:
+    """Apply module migrations on conn unless its schema stamp already matches.
+
+    Fast path for short-lived CLI processes: a matching fingerprint skips
+    loading migration files and checking _migrations entirely.
+
+    Returns:
+        True if the migration path ran, False if skipped
+    """
+    expected = fingerprint(module_path)
+    if is_current(conn, expected):
+        return False
+
+    migrate(conn, load_migrations(module_path))
+    stamp(conn, expected)
+    return True
+
 
 def load_migrations(module_path: str) -> list[tuple[str, str]]:
     """Load migrations from migrations/ directory.
@@ -20,11 +96,7 @@ def load_migrations(module_path: str) -> list[tuple[str, str]]:
     Returns:
         List of (migration_name, sql_content) tuples
     """
-    parts = module_path.split(".")
-    module_dir = Path(__file__).parent.parent.parent
-    for part in parts[1:]:
-        module_dir = module_dir / part
-    migrations_dir = module_dir / "migrations"
+    migrations_dir = _migrations_dir(module_path)
 
     if not migrations_dir.exists():
         return []
@@ -46,12 +118,18 @@ def ensure_schema(
         conn.execute("PRAGMA journal_mode=WAL")
         if migs:
             migrate(conn, migs)
-        conn.execute("PRAGMA user_version = 1")
+        # Ad-hoc migrations: clear the stamp so the next ensure_current() verifies.
+        stamp(conn, 0)
         conn.commit()
 
 
 def migrate(conn: sqlite3.Connection, migs: list[tuple[str, str | Callable]]) -> None:
-    """Apply migrations to connection with data loss safeguards."""
+    """Apply migrations to connection with data loss safeguards.
+
+    Row counts are compared before and after each migration, but only for the
+    tables it can shrink (see _guarded_tables), so the guard does not scale
+    with database size.
+    """
     conn.execute("CREATE TABLE IF NOT EXISTS _migrations (name TEXT PRIMARY KEY)")
     conn.commit()
 
@@ -60,11 +138,7 @@ def migrate(conn: sqlite3.Connection, migs: list[tuple[str, str | Callable]]) ->
         if applied:
             continue
         try:
-            cursor = conn.execute(
-                "SELECT name FROM sqlite_master WHERE type='table' AND name != '_migrations' AND name != 'sqlite_sequence'"
-            )
-            tables = [row[0] for row in cursor.fetchall()]
-            before = {t: _get_table_count(conn, t) for t in tables}
+            before = {t: _get_table_count(conn, t) for t in _guarded_tables(conn, migration)}
 
             if callable(migration):
                 migration(conn)
@@ -89,6 +163,78 @@ def migrate(conn: sqlite3.Connection, migs: list[tuple[str, str | Callable]]) ->
             raise
 
 
+_IDENT = r"""(?:\w+\.)?["'`\[]?(\w+)["'`\]]?"""
+_ROW_REMOVING = re.compile(
+    r"\b(?:DELETE\s+FROM|DROP\s+TABLE(?:\s+IF\s+EXISTS)?"
+    r"|(?:INSERT|UPDATE)\s+OR\s+REPLACE(?:\s+INTO)?|REPLACE\s+INTO)\s+" + _IDENT,
+    re.IGNORECASE,
+)
+_RENAME = re.compile(r"\bALTER\s+TABLE\s+" + _IDENT + r"\s+RENAME\s+TO\b", re.IGNORECASE)
+_WRITE_TARGET = re.compile(
+    r"\b(?:INSERT(?:\s+OR\s+\w+)?\s+INTO|REPLACE\s+INTO|DELETE\s+FROM|UPDATE(?:\s+OR\s+\w+)?)\s+"
+    + _IDENT,
+    re.IGNORECASE,
+)
+_COMMENT = re.compile(r"--[^\n]*|/\*.*?\*/", re.DOTALL)
+# Trigger bodies created by a migration do not run during it.
+_TRIGGER_BODY = re.compile(r"\bCREATE\s+(?:TEMP\w*\s+)?TRIGGER\b.*?\bEND\b", re.I | re.DOTALL)
+
+
+def _all_tables(conn: sqlite3.Connection) -> set[str]:
+    cursor = conn.execute(
+        "SELECT name FROM sqlite_master WHERE type='table' AND name != '_migrations' AND name != 'sqlite_sequence'"
+    )
+    return {row[0] for row in cursor.fetchall()}
+
+
+def _guarded_tables(conn: sqlite3.Connection, migration: str | Callable) -> set[str]:
+    """Tables whose row counts a migration could reduce.
+
+    SQL migrations are scanned for row-removing statements (DELETE, DROP TABLE,
+    RENAME TO, REPLACE); the set is then widened through ON DELETE CASCADE
+    foreign keys and triggers on those tables. Only schema is read, so the
+    guard costs nothing for tables the migration leaves alone. Callables can
+    declare `migration.tables`; undeclared callables are opaque and get every
+    table checked.
+    """
+    if callable(migration):
+        declared = getattr(migration, "tables", None)
+        if declared is None:
+            return _all_tables(conn)
+        touched = {t.lower() for t in declared}
+    else:
+        sql = _TRIGGER_BODY.sub("", _COMMENT.sub("", migration))
+        touched = {m.lower() for m in _ROW_REMOVING.findall(sql) + _RENAME.findall(sql)}
+
+    if not touched:
+        return set()
+
+    existing = {t.lower(): t for t in _all_tables(conn)}
+    triggers: dict[str, list[str]] = {}
+    for tbl_name, sql in conn.execute(
+        "SELECT tbl_name, sql FROM sqlite_master WHERE type='trigger' AND sql IS NOT NULL"
+    ):
+        triggers.setdefault(tbl_name.lower(), []).append(sql)
+    cascades: dict[str, set[str]] = {}
+    for child in existing.values():
+        for fk in conn.execute(f"PRAGMA foreign_key_list('{child}')"):
+            # (id, seq, table, from, to, on_update, on_delete, match)
+            if fk[6].upper() == "CASCADE":
+                cascades.setdefault(str(fk[2]).lower(), set()).add(child.lower())
+
+    pending = list(touched)
+    while pending:
+        table = pending.pop()
+        reached = set(cascades.get(table, ()))
+        for sql in triggers.get(table, ()):
+            reached.update(m.lower() for m in _WRITE_TARGET.findall(_COMMENT.sub("", sql)))
+        for other in reached - touched:
+            touched.add(other)
+            pending.append(other)
+
+    return {existing[t] for t in touched if t in existing}
+
+
 def _get_table_count(conn: sqlite3.Connection, table: str) -> int:
     try:
         cursor = conn.execute(
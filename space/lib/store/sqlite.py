@@ -1,22 +1,122 @@
 import logging
+import os
 import sqlite3
 import time
+from collections.abc import Iterator
+from contextlib import contextmanager
 from pathlib import Path
 
+from space.lib.store import trace
+
 logger = logging.getLogger(__name__)
 
+# Connection tunables applied together. cache_size < 0 is KiB; sizes are bytes.
+PROFILES: dict[str, dict[str, int | str]] = {
+    # Default for the writer: durable enough under WAL, modest memory.
+    "interactive": {
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -16_000,
+        "temp_store": "MEMORY",
+        "synchronous": "NORMAL",
+        "wal_autocheckpoint": 1000,
+        "journal_size_limit": 64 * 1024 * 1024,
+    },
+    # Large imports/reindexing: no fsync per commit, fewer checkpoints.
+    "bulk-load": {
+        "mmap_size": 256 * 1024 * 1024,
+        "cache_size": -64_000,
+        "temp_store": "MEMORY",
+        "synchronous": "OFF",
+        "wal_autocheckpoint": 10_000,
+        "journal_size_limit": 256 * 1024 * 1024,
+    },
+    # Default for query_only readers: map the file, big cache, never checkpoint.
+    "read-replica": {
+        "mmap_size": 1024 * 1024 * 1024,
+        "cache_size": -32_000,
+        "temp_store": "MEMORY",
+        "synchronous": "NORMAL",
+        "wal_autocheckpoint": 0,
+        "journal_size_limit": 64 * 1024 * 1024,
+    },
+    # Constrained hosts: no mmap, small cache, temp tables on disk.
+    "low-memory": {
+        "mmap_size": 0,
+        "cache_size": -2_000,
+        "temp_store": "FILE",
+        "synchronous": "NORMAL",
+        "wal_autocheckpoint": 500,
+        "journal_size_limit": 16 * 1024 * 1024,
+    },
+}
+DEFAULT_PROFILE = "interactive"
+DEFAULT_READ_PROFILE = "read-replica"
+
+
+def profile_name(query_only: bool = False) -> str:
+    """Profile for a new connection: SPACE_DB_PROFILE / SPACE_DB_READ_PROFILE, else defaults."""
+    if query_only:
+        name = os.environ.get("SPACE_DB_READ_PROFILE") or os.environ.get("SPACE_DB_PROFILE")
+        name = name or DEFAULT_READ_PROFILE
+    else:
+        name = os.environ.get("SPACE_DB_PROFILE") or DEFAULT_PROFILE
+    if name not in PROFILES:
+        logger.warning(f"Unknown SQLite profile '{name}', using {DEFAULT_PROFILE}")
+        return DEFAULT_PROFILE
+    return name
+
+
+def apply_profile(conn: sqlite3.Connection, name: str) -> dict[str, int | str]:
+    """Set a profile's pragmas on conn; returns the values they replaced.
+
+    `synchronous` cannot change inside a transaction and is skipped there.
+    """
+    previous: dict[str, int | str] = {}
+    for pragma, value in PROFILES[name].items():
+        if pragma == "synchronous" and conn.in_transaction:
+            logger.debug(f"Skipping synchronous={value} inside a transaction")
+            continue
+        previous[pragma] = conn.execute(f"PRAGMA {pragma}").fetchone()[0]
+        conn.execute(f"PRAGMA {pragma} = {value}")
+    return previous
+
 
-def connect(db_path: Path) -> sqlite3.Connection:
+@contextmanager
+def profile_scope(conn: sqlite3.Connection, name: str) -> Iterator[sqlite3.Connection]:
+    """Run a scope under another profile, restoring the connection's settings after.
+
+    Meant for a held write scope (e.g. `with store.write() as conn, profile_scope(conn,
+    "bulk-load")`), which owns the writer so nothing else sees the change.
+    """
+    previous = apply_profile(conn, name)
+    try:
+        yield conn
+    finally:
+        for pragma, value in previous.items():
+            if pragma == "synchronous" and conn.in_transaction:
+                continue
+            conn.execute(f"PRAGMA {pragma} = {value}")
+
+
+def connect(
+    db_path: Path, query_only: bool = False, profile: str | None = None
+) -> sqlite3.Connection:
     """Connect to SQLite with write contention monitoring.
 
     Uses WAL mode + 5s busy timeout to handle concurrent writes.
     SQLite write ceiling: ~1000 writes/sec on SSD.
+    With SPACE_DB_TRACE set, statements are recorded by store.trace.
+
+    Args:
+        db_path: Database file
+        query_only: Reject writes on this connection (reader pool)
+        profile: PROFILES entry; default from profile_name()
     """
     start = time.perf_counter()
     last_error: sqlite3.OperationalError | None = None
 
     for attempt in range(5):
-        conn = sqlite3.connect(db_path, check_same_thread=False)
+        conn = sqlite3.connect(db_path, check_same_thread=False, factory=trace.connection_factory())
         conn.row_factory = sqlite3.Row
         conn.isolation_level = None
 
@@ -24,6 +124,9 @@ def connect(db_path: Path) -> sqlite3.Connection:
             conn.execute("PRAGMA foreign_keys = ON")
             conn.execute("PRAGMA busy_timeout = 5000")  # 5s timeout for lock contention
             conn.execute("PRAGMA journal_mode = WAL")
+            apply_profile(conn, profile or profile_name(query_only))
+            if query_only:
+                conn.execute("PRAGMA query_only = ON")
             break
         except sqlite3.OperationalError as err:
             last_error = err
@@ -40,6 +143,8 @@ def connect(db_path: Path) -> sqlite3.Connection:
     if elapsed > 0.1:
         logger.warning(f"SQLite connection took {elapsed:.3f}s (possible lock contention)")
 
+    trace.attach(conn, db_path)
+
     return conn
 
 
@@ -0,0 +1,361 @@
+"""Opt-in SQL tracing: per-call-site latency histograms and a slow-query log.
+
+Enable with SPACE_DB_TRACE=1. Connections are then created with a traced
+cursor that times execute + fetch, counts rows, and attributes each statement
+to the first caller outside the store (e.g. `bridge.channels.list_channels`).
+Statements are grouped by shape: literals become `?` and IN-lists collapse.
+
+Stats accumulate in memory and are merged into `query_stats.json` next to the
+database when the process exits, so short-lived CLI calls add up across runs.
+Statements slower than SPACE_DB_SLOW_MS (default 100) are appended to
+`slow_queries.jsonl` together with their EXPLAIN QUERY PLAN.
+"""
+
+import atexit
+import bisect
+import contextlib
+import fcntl
+import json
+import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+STATS_FILE = "query_stats.json"
+SLOW_LOG_FILE = "slow_queries.jsonl"
+DEFAULT_SLOW_MS = 100.0
+
+# Histogram bucket upper bounds in milliseconds; the last bucket is unbounded.
+BUCKETS_MS = (0.1, 0.5, 1.0, 5.0, 10.0, 50.0, 100.0, 500.0, 1000.0)
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_IN_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_SPACE = re.compile(r"\s+")
+
+_STORE_DIR = str(Path(__file__).parent)
+
+
+def enabled() -> bool:
+    return os.environ.get("SPACE_DB_TRACE", "").lower() in {"1", "true", "yes", "on"}
+
+
+def slow_ms() -> float:
+    try:
+        return float(os.environ.get("SPACE_DB_SLOW_MS", DEFAULT_SLOW_MS))
+    except ValueError:
+        return DEFAULT_SLOW_MS
+
+
+def shape(sql: str) -> str:
+    """Normalize a statement so calls differing only in literals group together."""
+    normalized = _STRING.sub("?", sql)
+    normalized = _NUMBER.sub("?", normalized)
+    normalized = _SPACE.sub(" ", normalized).strip()
+    return _IN_LIST.sub("(...)", normalized)
+
+
+def _caller() -> str:
+    frame = sys._getframe(2)
+    while frame is not None and frame.f_code.co_filename.startswith(_STORE_DIR):
+        frame = frame.f_back
+    if frame is None:
+        return "?"
+    module = frame.f_globals.get("__name__", "?")
+    for prefix in ("space.os.", "space."):
+        if module.startswith(prefix):
+            module = module[len(prefix) :]
+            break
+    return f"{module}.{frame.f_code.co_name}"
+
+
+class Tracer:
+    """In-memory aggregate of traced statements, keyed by database directory."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._stats: dict[Path, dict[tuple[str, str], dict[str, Any]]] = {}
+
+    def record(
+        self,
+        db_dir: Path,
+        caller: str,
+        sql: str,
+        elapsed_ms: float,
+        rows: int,
+    ) -> None:
+        key = (caller, shape(sql))
+        with self._lock:
+            entries = self._stats.setdefault(db_dir, {})
+            entry = entries.get(key)
+            if entry is None:
+                entry = entries[key] = _empty_entry(*key)
+            _add(entry, elapsed_ms, rows)
+
+    def snapshot(self, db_dir: Path) -> list[dict[str, Any]]:
+        with self._lock:
+            return [
+                dict(e, histogram=list(e["histogram"]))
+                for e in self._stats.get(db_dir, {}).values()
+            ]
+
+    def flush(self) -> None:
+        """Merge accumulated stats into each database's stats file and reset."""
+        with self._lock:
+            pending, self._stats = self._stats, {}
+        for db_dir, entries in pending.items():
+            if not db_dir.is_dir():
+                continue
+            try:
+                merge(db_dir, list(entries.values()))
+            except OSError as e:
+                logger.warning(f"Failed to write query stats to {db_dir}: {e}")
+
+
+def _empty_entry(caller: str, statement: str) -> dict[str, Any]:
+    return {
+        "caller": caller,
+        "shape": statement,
+        "calls": 0,
+        "rows": 0,
+        "total_ms": 0.0,
+        "max_ms": 0.0,
+        "histogram": [0] * (len(BUCKETS_MS) + 1),
+    }
+
+
+def _add(entry: dict[str, Any], elapsed_ms: float, rows: int) -> None:
+    entry["calls"] += 1
+    entry["rows"] += rows
+    entry["total_ms"] += elapsed_ms
+    entry["max_ms"] = max(entry["max_ms"], elapsed_ms)
+    entry["histogram"][bisect.bisect_left(BUCKETS_MS, elapsed_ms)] += 1
+
+
+def _merge_entry(into: dict[str, Any], entry: dict[str, Any]) -> None:
+    into["calls"] += entry["calls"]
+    into["rows"] += entry["rows"]
+    into["total_ms"] += entry["total_ms"]
+    into["max_ms"] = max(into["max_ms"], entry["max_ms"])
+    into["histogram"] = [a + b for a, b in zip(into["histogram"], entry["histogram"], strict=True)]
+
+
+def merge(db_dir: Path, entries: list[dict[str, Any]]) -> None:
+    """Fold entries into db_dir's stats file under an exclusive file lock."""
+    if not entries:
+        return
+    path = db_dir / STATS_FILE
+    with open(db_dir / f"{STATS_FILE}.lock", "w") as lock:
+        fcntl.flock(lock, fcntl.LOCK_EX)
+        merged = {(e["caller"], e["shape"]): e for e in load(db_dir)}
+        for entry in entries:
+            key = (entry["caller"], entry["shape"])
+            if key in merged:
+                _merge_entry(merged[key], entry)
+            else:
+                merged[key] = dict(entry)
+        tmp = path.with_suffix(".tmp")
+        tmp.write_text(
+            json.dumps({"buckets_ms": list(BUCKETS_MS), "queries": list(merged.values())})
+        )
+        tmp.replace(path)
+
+
+def load(db_dir: Path) -> list[dict[str, Any]]:
+    """Read persisted stats entries for a database directory."""
+    path = db_dir / STATS_FILE
+    if not path.exists():
+        return []
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return []
+    if data.get("buckets_ms") != list(BUCKETS_MS):
+        return []
+    return data.get("queries", [])
+
+
+def load_slow(db_dir: Path, limit: int | None = None) -> list[dict[str, Any]]:
+    path = db_dir / SLOW_LOG_FILE
+    if not path.exists():
+        return []
+    entries = []
+    for line in path.read_text().splitlines():
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue
+    return entries[-limit:] if limit else entries
+
+
+def reset(db_dir: Path) -> None:
+    for name in (STATS_FILE, SLOW_LOG_FILE):
+        (db_dir / name).unlink(missing_ok=True)
+
+
+def percentile(entry: dict[str, Any], pct: float) -> float:
+    """Upper bound of the histogram bucket containing the pct-th call."""
+    target = entry["calls"] * pct / 100
+    seen = 0
+    for i, count in enumerate(entry["histogram"]):
+        seen += count
+        if count and seen >= target:
+            return min(BUCKETS_MS[i], entry["max_ms"]) if i < len(BUCKETS_MS) else entry["max_ms"]
+    return entry["max_ms"]
+
+
+def _log_slow(
+    conn: sqlite3.Connection, db_dir: Path, caller: str, sql: str, params: Any, elapsed_ms: float
+) -> None:
+    plan = None
+    verb = sql.split(None, 1)[0].upper() if sql.strip() else ""
+    if verb in {"SELECT", "UPDATE", "DELETE", "INSERT", "REPLACE", "WITH"}:
+        try:
+            rows = sqlite3.Connection.execute(conn, f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+            plan = [row[3] for row in rows]
+        except sqlite3.Error:
+            plan = None
+    record = {
+        "at": time.time(),
+        "caller": caller,
+        "sql": _SPACE.sub(" ", sql).strip(),
+        "ms": round(elapsed_ms, 3),
+        "plan": plan,
+    }
+    try:
+        with open(db_dir / SLOW_LOG_FILE, "a") as f:
+            f.write(json.dumps(record) + "\n")
+    except OSError as e:
+        logger.warning(f"Failed to write slow query log: {e}")
+
+
+_tracer = Tracer()
+atexit.register(_tracer.flush)
+
+
+def tracer() -> Tracer:
+    return _tracer
+
+
+class TracedCursor(sqlite3.Cursor):
+    """Cursor that times execute + fetch and reports once the statement is done."""
+
+    _sql: str | None = None
+
+    def execute(self, sql: str, parameters: Any = (), /) -> "TracedCursor":
+        self._finish()
+        self._begin(sql, parameters)
+        start = time.perf_counter()
+        try:
+            return super().execute(sql, parameters)
+        finally:
+            self._elapsed += time.perf_counter() - start
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> "TracedCursor":
+        self._finish()
+        self._begin(sql, ())
+        start = time.perf_counter()
+        try:
+            return super().executemany(sql, seq_of_parameters)
+        finally:
+            self._elapsed += time.perf_counter() - start
+
+    def fetchone(self) -> Any:
+        start = time.perf_counter()
+        row = super().fetchone()
+        self._elapsed += time.perf_counter() - start
+        if row is None:
+            self._finish()
+        else:
+            self._rows += 1
+        return row
+
+    def fetchmany(self, size: int | None = None) -> list:
+        start = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._elapsed += time.perf_counter() - start
+        self._rows += len(rows)
+        return rows
+
+    def fetchall(self) -> list:
+        start = time.perf_counter()
+        rows = super().fetchall()
+        self._elapsed += time.perf_counter() - start
+        self._rows += len(rows)
+        self._finish()
+        return rows
+
+    def __next__(self) -> Any:
+        start = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._elapsed += time.perf_counter() - start
+            self._finish()
+            raise
+        self._elapsed += time.perf_counter() - start
+        self._rows += 1
+        return row
+
+    def close(self) -> None:
+        self._finish()
+        super().close()
+
+    def __del__(self) -> None:
+        with contextlib.suppress(Exception):
+            self._finish()
+
+    def _begin(self, sql: str, parameters: Any) -> None:
+        self._sql = sql
+        self._params = parameters
+        self._caller = _caller()
+        self._elapsed = 0.0
+        self._rows = 0
+
+    def _finish(self) -> None:
+        sql, self._sql = self._sql, None
+        if sql is None:
+            return
+        conn = self.connection
+        db_dir = getattr(conn, "db_dir", None)
+        if db_dir is None:
+            return
+        rows = self._rows if self.description is not None else max(self.rowcount, 0)
+        elapsed_ms = self._elapsed * 1000
+        _tracer.record(db_dir, self._caller, sql, elapsed_ms, rows)
+        if elapsed_ms >= conn.slow_ms:
+            _log_slow(conn, db_dir, self._caller, sql, self._params, elapsed_ms)
+
+
+class TracedConnection(sqlite3.Connection):
+    """Connection whose execute helpers hand out TracedCursors."""
+
+    db_dir: Path | None = None
+    slow_ms: float = DEFAULT_SLOW_MS
+
+    def cursor(self, factory: Any = TracedCursor) -> sqlite3.Cursor:
+        return super().cursor(factory)
+
+    def execute(self, sql: str, parameters: Any = (), /) -> TracedCursor:
+        return self.cursor().execute(sql, parameters)
+
+    def executemany(self, sql: str, seq_of_parameters: Any, /) -> TracedCursor:
+        return self.cursor().executemany(sql, seq_of_parameters)
+
+
+def connection_factory() -> type[sqlite3.Connection]:
+    return TracedConnection if enabled() else sqlite3.Connection
+
+
+def attach(conn: sqlite3.Connection, db_path: Path) -> None:
+    """Bind a traced connection to the stats directory of its database."""
+    if isinstance(conn, TracedConnection):
+        conn.db_dir = Path(db_path).parent
+        conn.slow_ms = slow_ms()
@@ -0,0 +1,107 @@
+"""Benchmark the PRAGMA profiles against a copy of the live database.
+
+`space db tune` snapshots space.db into a temp directory (SQLite backup API,
+so agents keep writing), then opens the copy under each profile in
+`sqlite.PROFILES` and times a representative read mix and a stream of small
+committed writes. The live database is never touched.
+"""
+
+import sqlite3
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from space.lib.store import connection, sqlite
+
+# (label, sql): skipped when the table they read is missing from the copy.
+READ_WORKLOAD = [
+    ("count_messages", "SELECT COUNT(*) FROM messages"),
+    (
+        "recent_channel",
+        "SELECT * FROM messages WHERE channel_id = "
+        "(SELECT channel_id FROM channel_stats ORDER BY last_activity DESC LIMIT 1) "
+        "ORDER BY created_at DESC LIMIT 200",
+    ),
+    ("list_channels", "SELECT * FROM channels c LEFT JOIN channel_stats s USING (channel_id)"),
+    ("fts_messages", "SELECT rowid FROM messages_fts WHERE messages_fts MATCH 'the' LIMIT 100"),
+    (
+        "fts_transcripts",
+        "SELECT rowid FROM transcripts_fts WHERE transcripts_fts MATCH 'the' LIMIT 100",
+    ),
+]
+SCRATCH_TABLE = "_tune_scratch"
+
+
+def _snapshot(dest: Path) -> None:
+    with connection.read() as src:
+        target = sqlite3.connect(dest)
+        try:
+            src.backup(target)
+        finally:
+            target.close()
+
+
+def _time_reads(conn: sqlite3.Connection) -> float:
+    start = time.perf_counter()
+    for _, sql in READ_WORKLOAD:
+        try:
+            conn.execute(sql).fetchall()
+        except sqlite3.OperationalError:
+            continue
+    return (time.perf_counter() - start) * 1000
+
+
+def _time_writes(conn: sqlite3.Connection, writes: int) -> float:
+    conn.execute(f"CREATE TABLE IF NOT EXISTS {SCRATCH_TABLE} (id INTEGER PRIMARY KEY, body TEXT)")
+    start = time.perf_counter()
+    for i in range(writes):
+        conn.execute(f"INSERT INTO {SCRATCH_TABLE} (body) VALUES (?)", (f"row {i}" * 8,))
+    return (time.perf_counter() - start) * 1000
+
+
+def run(rounds: int = 5, writes: int = 200, profiles: list[str] | None = None) -> dict:
+    """Time each profile on a snapshot of space.db.
+
+    Args:
+        rounds: Timed repetitions per profile (median reported)
+        writes: Autocommitted inserts per write round
+        profiles: Subset of PROFILES to run (default: all)
+
+    Returns:
+        {"db_bytes", "rounds", "writes", "profiles": {name: {"read_ms", "write_ms"}},
+         "best_read", "best_write"}
+    """
+    names = profiles or list(sqlite.PROFILES)
+    unknown = [n for n in names if n not in sqlite.PROFILES]
+    if unknown:
+        raise ValueError(f"Unknown profile(s): {', '.join(unknown)}")
+
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="space-tune-") as tmp:
+        db_copy = Path(tmp) / "space.db"
+        _snapshot(db_copy)
+        db_bytes = db_copy.stat().st_size
+
+        for name in names:
+            conn = sqlite.connect(db_copy, profile=name)
+            try:
+                _time_reads(conn)  # warm up: every profile starts from a hot page cache
+                reads = [_time_reads(conn) for _ in range(rounds)]
+                writes_ms = [_time_writes(conn, writes) for _ in range(rounds)]
+                conn.execute(f"DROP TABLE IF EXISTS {SCRATCH_TABLE}")
+            finally:
+                conn.close()
+            results[name] = {
+                "read_ms": round(statistics.median(reads), 3),
+                "write_ms": round(statistics.median(writes_ms), 3),
+            }
+
+    return {
+        "db_bytes": db_bytes,
+        "rounds": rounds,
+        "writes": writes,
+        "profiles": results,
+        "best_read": min(results, key=lambda n: results[n]["read_ms"]),
+        "best_write": min(results, key=lambda n: results[n]["write_ms"]),
+    }
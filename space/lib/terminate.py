@@ -0,0 +1,124 @@
+"""Parallel process-group termination with a single escalation deadline.
+
+Signals every target at once, waits for all of them together, and escalates
+SIGTERM -> SIGKILL at one shared grace point, so stopping twenty spawns takes
+as long as stopping one. A target that leads its own process group (spawns
+start their provider with `start_new_session`) is signalled as a group, which
+reaches the provider's own subprocesses too; anything else gets a plain kill.
+
+Exits are awaited through pidfds where the platform has them (Linux), so the
+wait works for processes that are not our children and wakes the moment the
+last one exits. Elsewhere it polls with a short backoff.
+"""
+
+import contextlib
+import os
+import select
+import signal
+import time
+
+GRACE_SECONDS = 3.0
+DEADLINE_SECONDS = 5.0
+_POLL_MIN_S = 0.005
+_POLL_MAX_S = 0.1
+
+
+def _is_group_leader(pid: int) -> bool:
+    try:
+        return os.getpgid(pid) == pid and pid != os.getpgrp()
+    except OSError:
+        return False
+
+
+def _signal(pid: int, group: bool, sig: int) -> bool:
+    """Send `sig`; False if there was nothing left to signal."""
+    try:
+        if group:
+            os.killpg(pid, sig)
+        else:
+            os.kill(pid, sig)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _alive(pid: int, group: bool) -> bool:
+    # A group stays alive while any member (the provider's subprocesses) does.
+    # Never reap here: the thread that launched it owns the exit status.
+    return _signal(pid, group, 0)
+
+
+def _open_pidfd(pid: int) -> int | None:
+    if not hasattr(os, "pidfd_open"):
+        return None
+    try:
+        return os.pidfd_open(pid)
+    except OSError:
+        return None
+
+
+def _wait(targets: dict[int, bool], until: float) -> set[int]:
+    """Wait until every target has exited or `until` passes; returns those still alive.
+
+    A pidfd only reports the leader's exit. Once it fires (or if there is
+    none), a target is polled instead, which also covers group members that
+    outlive their leader.
+    """
+    pending = {pid for pid, group in targets.items() if _alive(pid, group)}
+    pidfds = {pid: fd for pid in pending if (fd := _open_pidfd(pid)) is not None}
+    poller = select.poll()
+    for fd in pidfds.values():
+        poller.register(fd, select.POLLIN)
+
+    interval = _POLL_MIN_S
+    try:
+        while pending:
+            remaining = until - time.monotonic()
+            if remaining <= 0:
+                break
+            if len(pidfds) == len(pending):
+                fired = {fd for fd, _ in poller.poll(remaining * 1000)}
+            else:
+                fired = {fd for fd, _ in poller.poll(min(interval, remaining) * 1000)}
+                interval = min(interval * 2, _POLL_MAX_S)
+
+            for pid, fd in list(pidfds.items()):
+                if fd in fired:
+                    poller.unregister(fd)
+                    os.close(pidfds.pop(pid))
+            pending = {pid for pid in pending if _alive(pid, targets[pid])}
+    finally:
+        for fd in pidfds.values():
+            with contextlib.suppress(OSError):
+                os.close(fd)
+    return pending
+
+
+def terminate(
+    pids: list[int], grace: float = GRACE_SECONDS, deadline: float = DEADLINE_SECONDS
+) -> dict[int, str]:
+    """Stop all `pids` together: SIGTERM now, SIGKILL at `grace`, give up at `deadline`.
+
+    Returns {pid: outcome} with outcome "gone" (already dead), "terminated"
+    (exited after SIGTERM), "killed" (needed SIGKILL) or "survived".
+    """
+    start = time.monotonic()
+    targets = {pid: _is_group_leader(pid) for pid in dict.fromkeys(pids)}
+    outcome = dict.fromkeys(targets, "gone")
+
+    signalled = {
+        pid: group for pid, group in targets.items() if _signal(pid, group, signal.SIGTERM)
+    }
+    for pid in signalled:
+        outcome[pid] = "terminated"
+
+    stubborn = _wait(signalled, start + min(grace, deadline))
+    for pid in stubborn:
+        _signal(pid, signalled[pid], signal.SIGKILL)
+        outcome[pid] = "killed"
+
+    for pid in _wait({pid: signalled[pid] for pid in stubborn}, start + deadline):
+        outcome[pid] = "survived"
+    return outcome
@@ -61,8 +61,25 @@ def short_id(full_uuid: str) -> str:
     return full_uuid[-8:]
 
 
+SUFFIX_KEY_LEN = 8
+_AMBIGUOUS_SHOWN = 20
+
+
+def suffix_key(col: str) -> str:
+    """SQL for the column's last 8 chars reversed; indexed by migration 003.
+
+    Reversing turns a suffix match into a prefix match, which an index can range-scan.
+    """
+    return " || ".join(f"substr({col}, -{i}, 1)" for i in range(1, SUFFIX_KEY_LEN + 1))
+
+
+def prefix_range(prefix: str) -> tuple[str, str]:
+    """Half-open [lo, hi) bounds matching every string that starts with prefix."""
+    return prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)
+
+
 def resolve_id(table: str, id_col: str, partial_id: str, *, error_context: str = "") -> str:
-    """Resolve partial/suffix ID to full ID via fuzzy suffix matching.
+    """Resolve partial/suffix ID to full ID via indexed suffix matching.
 
     Args:
         table: Table name to query
@@ -82,11 +99,20 @@ def resolve_id(table: str, id_col: str, partial_id: str, *, error_context: str =
     if not partial_id or not isinstance(partial_id, str):
         raise ValueError("partial_id must be a non-empty string")
 
-    with store.ensure() as conn:
-        rows = conn.execute(
-            f"SELECT {id_col} FROM {table} WHERE {id_col} LIKE ?",
-            (f"%{partial_id}",),
-        ).fetchall()
+    key = suffix_key(id_col)
+    sql = (
+        f"SELECT {id_col} FROM {table} "
+        f"WHERE {key} >= ? AND {key} < ? AND substr({id_col}, -?) = ? LIMIT ?"
+    )
+    rows = []
+    with store.read() as conn:
+        # IDs are lowercase; the old LIKE lookup tolerated uppercase input.
+        for candidate in dict.fromkeys((partial_id, partial_id.lower())):
+            lo, hi = prefix_range(candidate[::-1][:SUFFIX_KEY_LEN])
+            params = (lo, hi, len(candidate), candidate, _AMBIGUOUS_SHOWN + 1)
+            rows = conn.execute(sql, params).fetchall()
+            if rows:
+                break
 
     if not rows:
         msg = f"No entry found with ID ending in '{partial_id}'"
@@ -95,7 +121,7 @@ def resolve_id(table: str, id_col: str, partial_id: str, *, error_context: str =
         raise ValueError(msg)
 
     if len(rows) > 1:
-        ambiguous_ids = [row[0] for row in rows]
+        ambiguous_ids = [row[0] for row in rows[:_AMBIGUOUS_SHOWN]]
         msg = f"Ambiguous ID: '{partial_id}' matches multiple entries: {ambiguous_ids}"
         if error_context:
             msg += f" ({error_context})"
@@ -124,4 +150,4 @@ def _validate_identifier(name: str, kind: str) -> None:
         raise ValueError(f"Invalid {kind}: '{name}' must be lowercase")
 
 
-__all__ = ["uuid7", "short_id", "resolve_id"]
+__all__ = ["uuid7", "short_id", "resolve_id", "suffix_key", "prefix_range"]
@@ -1,4 +1,4 @@
-from . import channels
+from . import channels, outbox
 from .channels import (
     archive_channel,
     create_channel,
@@ -34,6 +34,7 @@ __all__ = [
     "get_messages",
     "get_sender_history",
     "list_channels",
+    "outbox",
     "process_delimiters",
     "recv_messages",
     "rename_channel",
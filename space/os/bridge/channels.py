@@ -120,7 +120,7 @@ def toggle_pin_channel(name: str) -> bool:
 
 def delete_channel(name: str) -> None:
     """Hard delete channel and all messages. Raises ValueError if not found."""
-    with store.ensure() as conn:
+    with store.ensure() as conn, store.transaction(conn):
         row = conn.execute(
             "SELECT channel_id FROM channels WHERE name = ?",
             (name,),
@@ -133,98 +133,113 @@ def delete_channel(name: str) -> None:
         conn.execute("DELETE FROM channels WHERE channel_id = ?", (channel_id,))
 
 
-def _compute_unread_count(conn: sqlite3.Connection, channel_id: str, reader_id: str) -> int:
-    bookmark_row = conn.execute(
-        "SELECT last_read_id FROM bookmarks WHERE reader_id = ? AND channel_id = ?",
-        (reader_id, channel_id),
-    ).fetchone()
-    last_read_id = bookmark_row[0] if bookmark_row else None
+_CHANNEL_SQL = """
+    SELECT
+        c.channel_id, c.name, c.topic, c.created_at, c.archived_at, c.pinned_at,
+        c.timer_expires_at, c.timer_set_by_message_id,
+        COALESCE(s.message_count, 0) as message_count,
+        s.last_activity
+    FROM channels c
+    LEFT JOIN channel_stats s ON s.channel_id = c.channel_id
+    WHERE c.channel_id = ? OR c.name = ?
+"""
+_MEMBERS_SQL = "SELECT agent_id FROM channel_members WHERE channel_id = ? ORDER BY agent_id"
+
+# Unread = messages after the reader's bookmark in recv's (created_at, message_id)
+# order: an index-only range count per channel. Without a bookmark (or with one on a
+# message no longer in main, e.g. archived) recv reads every message still in main,
+# which channel_stats.hot_count knows; message_count also includes the archive.
+_UNREAD_COLUMN = """
+    CASE
+        WHEN bm.message_id IS NULL THEN COALESCE(s.hot_count, 0)
+        ELSE (
+            SELECT COUNT(*) FROM messages m
+            WHERE m.channel_id = c.channel_id
+              AND (m.created_at, m.message_id) > (bm.created_at, bm.message_id)
+        )
+    END as unread_count"""
+_UNREAD_JOINS = """
+        LEFT JOIN bookmarks b ON b.channel_id = c.channel_id AND b.reader_id = ?
+        LEFT JOIN messages bm ON bm.message_id = b.last_read_id AND bm.channel_id = c.channel_id"""
+
+
+def _list_channels_query(archived: bool, with_unread: bool = False) -> str:
+    archived_filter = (
+        "WHERE c.archived_at IS NOT NULL" if archived else "WHERE c.archived_at IS NULL"
+    )
+    order_clause = (
+        "c.name"
+        if archived
+        else "c.pinned_at DESC NULLS LAST, COALESCE(s.last_activity, c.created_at) DESC"
+    )
+    unread_column = _UNREAD_COLUMN if with_unread else "0 as unread_count"
+    unread_joins = _UNREAD_JOINS if with_unread else ""
+    return f"""
+        SELECT
+            c.channel_id,
+            c.name,
+            c.topic,
+            c.created_at,
+            c.archived_at,
+            c.pinned_at,
+            c.timer_expires_at,
+            c.timer_set_by_message_id,
+            COALESCE(s.message_count, 0) as message_count,
+            s.last_activity,
+            {unread_column}
+        FROM channels c
+        LEFT JOIN channel_stats s ON s.channel_id = c.channel_id{unread_joins}
+        {archived_filter}
+        ORDER BY {order_clause}
+    """
+
 
-    if last_read_id:
-        unread_messages = conn.execute(
-            """
-            SELECT content FROM messages
-            WHERE channel_id = ? AND created_at > (
-                SELECT created_at FROM messages WHERE message_id = ?
-            )
-            """,
-            (channel_id, last_read_id),
-        ).fetchall()
-    else:
-        unread_messages = conn.execute(
-            "SELECT content FROM messages WHERE channel_id = ?",
-            (channel_id,),
-        ).fetchall()
+def list_channels(archived: bool = False, reader_id: str | None = None) -> list[Channel]:
+    """Channels in listing order; with `reader_id`, unread counts in the same query."""
+    query = _list_channels_query(archived, with_unread=bool(reader_id))
+    params = (reader_id,) if reader_id else ()
+    with store.read() as conn:
+        rows = conn.execute(query, params).fetchall()
+        return [_row_to_channel(row) for row in rows]
 
-    return len(unread_messages)
 
+async def alist_channels(archived: bool = False, reader_id: str | None = None) -> list[Channel]:
+    """Async list_channels(): queries run off the event loop (see store.aio)."""
+    from space.lib.store import aio
 
-def list_channels(archived: bool = False, reader_id: str | None = None) -> list[Channel]:
-    with store.ensure() as conn:
-        archived_filter = (
-            "WHERE c.archived_at IS NOT NULL" if archived else "WHERE c.archived_at IS NULL"
-        )
-        order_clause = (
-            "c.name"
-            if archived
-            else "c.pinned_at DESC NULLS LAST, COALESCE(MAX(m.created_at), c.created_at) DESC"
-        )
-        query = f"""
-            SELECT
-                c.channel_id,
-                c.name,
-                c.topic,
-                c.created_at,
-                c.archived_at,
-                c.pinned_at,
-                c.timer_expires_at,
-                c.timer_set_by_message_id,
-                COUNT(m.message_id) as message_count,
-                MAX(m.created_at) as last_activity,
-                0 as unread_count
-            FROM channels c
-            LEFT JOIN messages m ON c.channel_id = m.channel_id
-            {archived_filter}
-            GROUP BY c.channel_id
-            ORDER BY {order_clause}
-        """
-        channels = [_row_to_channel(row) for row in conn.execute(query).fetchall()]
-
-        if reader_id:
-            for channel in channels:
-                channel.unread_count = _compute_unread_count(conn, channel.channel_id, reader_id)
-
-        return channels
+    query = _list_channels_query(archived, with_unread=bool(reader_id))
+    params = (reader_id,) if reader_id else ()
+    async with aio.read() as conn:
+        rows = await conn.execute_fetchall(query, params)
+        return [_row_to_channel(row) for row in rows]
 
 
 def get_channel(channel: str | Channel) -> Channel | None:
     """Get a channel by its ID or name, including members."""
     channel_id = _to_channel_id(channel)
-    with store.ensure() as conn:
-        row = conn.execute(
-            """
-            SELECT
-                c.channel_id, c.name, c.topic, c.created_at, c.archived_at, c.pinned_at,
-                c.timer_expires_at, c.timer_set_by_message_id,
-                COUNT(m.message_id) as message_count,
-                MAX(m.created_at) as last_activity
-            FROM channels c
-            LEFT JOIN messages m ON c.channel_id = m.channel_id
-            WHERE c.channel_id = ? OR c.name = ?
-            GROUP BY c.channel_id
-            """,
-            (channel_id, channel_id),
-        ).fetchone()
-
+    with store.read() as conn:
+        row = conn.execute(_CHANNEL_SQL, (channel_id, channel_id)).fetchone()
         if not row:
             return None
 
         channel = _row_to_channel(row)
+        member_rows = conn.execute(_MEMBERS_SQL, (channel.channel_id,)).fetchall()
+        channel.members = [row["agent_id"] for row in member_rows]
+        return channel
+
 
-        member_rows = conn.execute(
-            "SELECT DISTINCT agent_id FROM messages WHERE channel_id = ? ORDER BY agent_id",
-            (channel.channel_id,),
-        ).fetchall()
+async def aget_channel(channel: str | Channel) -> Channel | None:
+    """Async get_channel()."""
+    from space.lib.store import aio
+
+    channel_id = _to_channel_id(channel)
+    async with aio.read() as conn:
+        rows = list(await conn.execute_fetchall(_CHANNEL_SQL, (channel_id, channel_id)))
+        if not rows:
+            return None
+
+        channel = _row_to_channel(rows[0])
+        member_rows = await conn.execute_fetchall(_MEMBERS_SQL, (channel.channel_id,))
         channel.members = [row["agent_id"] for row in member_rows]
         return channel
 
@@ -249,7 +264,7 @@ def clear_timer(channel_id: str) -> None:
 
 def count_channels() -> tuple[int, int, int]:
     """Return (distinct_in_messages, active, archived)."""
-    with store.ensure() as conn:
+    with store.read() as conn:
         distinct = conn.execute("SELECT COUNT(DISTINCT channel_id) FROM messages").fetchone()[0]
         active = conn.execute("SELECT COUNT(*) FROM channels WHERE archived_at IS NULL").fetchone()[
             0
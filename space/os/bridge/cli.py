@@ -231,10 +231,15 @@ def export(
     json_output: bool = typer.Option(
         False, "--json", "-j", help="Output as JSON instead of markdown"
     ),
+    include_archive: bool = typer.Option(
+        False, "--include-archive", help="Include messages moved to the archive database"
+    ),
 ):
     """Export full channel history (no bookmark tracking)."""
     try:
-        result = bridge.export_messages(channel, as_json=json_output)
+        result = bridge.export_messages(
+            channel, as_json=json_output, include_archive=include_archive
+        )
         typer.echo(result)
     except (ValueError, Exception) as e:
         output.respond(ctx, {"status": "error", "message": str(e)}, f"❌ {e}")
@@ -248,6 +253,9 @@ def recv(
     channel: str = typer.Argument(..., help="Channel to read from"),
     ago: str = typer.Option(None, "--ago", help="Time window (e.g., 1h, 30m)"),
     reader: str = typer.Option(None, "--reader", help="Explicit reader ID for bookmark tracking"),
+    limit: int = typer.Option(None, "--limit", "-n", help="Max messages (oldest unread first)"),
+    before: str = typer.Option(None, "--before", help="Only messages before this message ID"),
+    after: str = typer.Option(None, "--after", help="Only messages after this message ID"),
     json_output: bool = typer.Option(
         False, "--json", "-j", help="Output as JSON instead of markdown"
     ),
@@ -277,7 +285,9 @@ def recv(
                             err=True,
                         )
 
-        msgs, count, context, participants = bridge.recv_messages(channel, ago, reader_id)
+        msgs, count, context, participants = bridge.recv_messages(
+            channel, ago, reader_id, limit=limit, before=before, after=after
+        )
         result = bridge.format_messages(msgs, context or "Messages", as_json=json_output)
         output.echo_text(result, ctx)
     except (ValueError, Exception) as e:
@@ -376,9 +386,15 @@ def topic(
 def wait(
     ctx: typer.Context,
     channel: str = typer.Argument(..., help="Channel to monitor"),
-    poll_interval: float = typer.Option(0.1, "--interval", help="Poll interval in seconds"),
+    poll_interval: float = typer.Option(
+        None, "--interval", help="Max seconds between commit checks (default 0.05)"
+    ),
+    reader: str = typer.Option(None, "--reader", help="Resume from and advance this bookmark"),
+    timeout: float = typer.Option(None, "--timeout", help="Give up after N seconds"),
 ):
     """Block until new message arrives."""
+    import os
+
     try:
         identity = _resolve_identity(ctx)
         if not identity:
@@ -387,7 +403,11 @@ def wait(
         if not agent:
             raise ValueError(f"Identity '{identity}' not registered.")
         other_messages, count, context, participants = bridge.wait_for_message(
-            channel, identity, poll_interval
+            channel,
+            identity,
+            poll_interval,
+            reader_id=reader or os.environ.get("SPACE_SPAWN_ID"),
+            timeout=timeout,
         )
 
         if output.is_json_mode(ctx):
@@ -94,10 +94,20 @@ def _cancel_timer(channel_id: str) -> None:
 
 def _stop_all_agents_in_channel(channel_id: str) -> None:
     """Emergency brake: stop all spawns in channel."""
-    for spawn in spawns.get_channel_spawns(channel_id):
-        if spawn.status in SPAWN_LIVE_STATUSES:
-            spawns.terminate_spawn(spawn.id, "killed")
-    log.info(f"Stopped all agents in channel {channel_id}")
+    _stop_all_agents_in_channels([channel_id])
+
+
+def _stop_all_agents_in_channels(channel_ids: list[str]) -> None:
+    """Stop every live spawn in these channels in one parallel termination pass."""
+    live = [
+        spawn.id
+        for channel_id in channel_ids
+        for spawn in spawns.get_channel_spawns(channel_id)
+        if spawn.status in SPAWN_LIVE_STATUSES
+    ]
+    spawns.terminate_spawns(live, "killed")
+    for channel_id in channel_ids:
+        log.info(f"Stopped all agents in channel {channel_id}")
 
 
 def _stop_agent_in_channel(channel_id: str, identity: str) -> None:
@@ -113,7 +123,7 @@ def _stop_agent_in_channel(channel_id: str, identity: str) -> None:
 
 def _compact_agent_in_channel(channel_id: str, identity: str) -> None:
     """Human-initiated agent compaction: force fresh session."""
-    from space.lib.detach import detach
+    from space.os.spawn import scheduler, supervisor
 
     agent = spawn_agents.get_agent(identity)
     if not agent:
@@ -123,17 +133,12 @@ def _compact_agent_in_channel(channel_id: str, identity: str) -> None:
     if not current_spawn:
         return
 
-    detach(
-        [
-            "spawn",
-            "run",
-            agent.identity,
-            "Human-initiated compact, continue work",
-            "--channel",
-            channel_id,
-            "--parent-spawn",
-            current_spawn.id,
-        ]
+    supervisor.submit(
+        agent.identity,
+        "Human-initiated compact, continue work",
+        channel_id=channel_id,
+        parent_spawn_id=current_spawn.id,
+        priority=scheduler.PRIORITY_HUMAN,
     )
 
     spawns.terminate_spawn(current_spawn.id, "completed")
@@ -1,6 +1,7 @@
 """Bridge delimiter parsing: @spawn, !agent-signals, /human-control."""
 
 import logging
+from collections.abc import Callable, Collection
 
 from .control import process_control_commands
 from .mentions import process_mentions
@@ -9,8 +10,19 @@ from .signals import process_signals
 log = logging.getLogger(__name__)
 
 
-async def process_delimiters(channel_id: str, content: str, agent_id: str | None = None) -> None:
-    """Fire-and-forget: parse @mentions and !control commands."""
+def dispatch(
+    channel_id: str,
+    content: str,
+    agent_id: str | None = None,
+    done: Collection[str] = (),
+    mark: Callable[[str], None] | None = None,
+) -> None:
+    """Run control commands, signals and mentions for one message; errors propagate.
+
+    Steps named in `done` are skipped and `mark(step)` is called as each one
+    finishes, so a caller that records them (the outbox) can retry without
+    repeating work that already happened.
+    """
     from . import channels
 
     channel = channels.get_channel(channel_id)
@@ -18,9 +30,18 @@ async def process_delimiters(channel_id: str, content: str, agent_id: str | None
         log.error(f"Channel {channel_id} not found")
         return
 
+    for step, handler in (("control", process_control_commands), ("signals", process_signals)):
+        if step in done:
+            continue
+        handler(channel_id, content, agent_id)
+        if mark:
+            mark(step)
+    process_mentions(channel_id, content, agent_id, done=done, mark=mark)
+
+
+async def process_delimiters(channel_id: str, content: str, agent_id: str | None = None) -> None:
+    """Fire-and-forget: parse @mentions and !control commands."""
     try:
-        process_control_commands(channel_id, content, agent_id)
-        process_signals(channel_id, content, agent_id)
-        process_mentions(channel_id, content, agent_id)
+        dispatch(channel_id, content, agent_id)
     except Exception as e:
         log.error(f"Failed to process delimiters: {e}", exc_info=True)
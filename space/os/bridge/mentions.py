@@ -2,6 +2,7 @@
 
 import logging
 import re
+from collections.abc import Callable, Collection
 
 from space.os.spawn import agents as spawn_agents
 from space.os.spawn import spawns
@@ -13,49 +14,70 @@ def extract_mentions(content: str) -> list[str]:
     return list(set(re.findall(r"@([\w-]+)", content)))
 
 
-def process_mentions(channel_id: str, content: str, sender_agent_id: str | None = None) -> None:
+def process_mentions(
+    channel_id: str,
+    content: str,
+    sender_agent_id: str | None = None,
+    done: Collection[str] = (),
+    mark: Callable[[str], None] | None = None,
+) -> None:
     """Process @mentions: reuse active spawn or create new one.
 
     Spawn lifecycle:
     - First @mention: create spawn, CLI runs, spawn becomes ACTIVE
     - Subsequent @mentions: reuse ACTIVE spawn, CLI runs, spawn stays ACTIVE
     - !compact: spawn COMPLETED, successor created
+
+    Each identity is a step `mention:<identity>` (see delimiters.dispatch).
     """
-    from space.lib.detach import detach
+    from space.os.spawn import scheduler
 
     mentions = extract_mentions(content)
     if not mentions:
         return
 
+    sender = spawn_agents.get_agent(sender_agent_id) if sender_agent_id else None
+    priority = (
+        scheduler.PRIORITY_HUMAN if sender and not sender.model else scheduler.PRIORITY_DEFAULT
+    )
+
     for identity in mentions:
-        agent = spawn_agents.get_agent(identity)
-        if not agent or agent.agent_id == sender_agent_id:
-            continue
-        if not agent.model:
+        step = f"mention:{identity}"
+        if step in done:
             continue
+        _mention(identity, channel_id, content, sender_agent_id, priority)
+        if mark:
+            mark(step)
 
-        existing_spawn = spawns.get_active_spawn_in_channel(agent.agent_id, channel_id)
 
-        if existing_spawn and existing_spawn.status == "running":
-            continue
+def _mention(
+    identity: str, channel_id: str, content: str, sender_agent_id: str | None, priority: int
+) -> None:
+    from space.os.spawn import supervisor
+
+    agent = spawn_agents.get_agent(identity)
+    if not agent or agent.agent_id == sender_agent_id:
+        return
+    if not agent.model:
+        return
+
+    existing_spawn = spawns.get_active_spawn_in_channel(agent.agent_id, channel_id)
+
+    # Running: it reads the channel itself. Pending: queued, reads it when it starts.
+    if existing_spawn and existing_spawn.status in ("running", "pending"):
+        return
 
-        if existing_spawn and existing_spawn.status == "active":
-            cmd = [
-                "spawn",
-                "run",
-                identity,
-                content,
-                "--channel",
-                channel_id,
-                "--spawn-id",
-                existing_spawn.id,
-            ]
-            if existing_spawn.session_id:
-                cmd.extend(["--resume", existing_spawn.session_id])
-            detach(cmd)
-        else:
-            cmd = ["spawn", "run", identity, content, "--channel", channel_id]
-            detach(cmd)
+    if existing_spawn and existing_spawn.status == "active":
+        supervisor.submit(
+            identity,
+            content,
+            channel_id=channel_id,
+            spawn_id=existing_spawn.id,
+            resume=existing_spawn.session_id,
+            priority=priority,
+        )
+    else:
+        supervisor.submit(identity, content, channel_id=channel_id, priority=priority)
 
 
 def attempt_relink_for_agent(agent_id: str) -> None:
@@ -71,7 +93,7 @@ def attempt_relink_for_agent(agent_id: str) -> None:
     if provider not in ("claude", "codex", "gemini"):
         return
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         unlinked = conn.execute(
             """SELECT id, created_at FROM spawns
             WHERE agent_id = ? AND session_id IS NULL AND status = 'completed'
@@ -1,33 +1,23 @@
 """Message operations: send, receive, format, history."""
 
-import asyncio
 import re
 import time
-from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 
 from space.core.models import Channel, Message
 from space.lib import store
 from space.lib.codec import decode_base64 as decode_base64_content
-from space.lib.store import from_row
+from space.lib.store import archive, from_row, from_rows
 from space.lib.uuid7 import uuid7
 
-from . import channels
+from . import channels, outbox
 from .channels import _to_channel_id
 
-_delimiter_executor = ThreadPoolExecutor(max_workers=10, thread_name_prefix="delimiter-")
-
 
 def _row_to_message(row: store.Row) -> Message:
     return from_row(row, Message)
 
 
-def _run_delimiter_processing(channel_id: str, content: str, agent_id: str | None) -> None:
-    from . import delimiters
-
-    asyncio.run(delimiters.process_delimiters(channel_id, content, agent_id))
-
-
 async def send_message(
     channel: str | Channel, identity: str, content: str, decode_base64: bool = False
 ) -> str:
@@ -52,37 +42,114 @@ async def send_message(
         raise ValueError(f"Channel '{channel_id}' not found. Create it first with 'bridge create'.")
 
     message_id = uuid7()
-    with store.ensure() as conn:
+    queue = outbox.needs_processing(content)
+
+    def insert(conn) -> int | None:
         conn.execute(
             "INSERT INTO messages (message_id, channel_id, agent_id, content) VALUES (?, ?, ?, ?)",
             (message_id, channel_obj.channel_id, agent.agent_id, content),
         )
+        # Same transaction: the message never commits without its delimiter work.
+        return outbox.enqueue(conn, message_id) if queue else None
+
+    entry_id = store.write_batched(insert)
     spawn.touch_agent(agent.agent_id)
 
-    _delimiter_executor.submit(
-        _run_delimiter_processing, channel_obj.channel_id, content, agent.agent_id
-    )
+    if entry_id is not None:
+        outbox.kick(entry_id)
 
     return agent.agent_id
 
 
-def get_messages(channel: str | Channel) -> list[Message]:
+_CHANNEL_MESSAGES_SQL = """
+    SELECT message_id, channel_id, agent_id, content, created_at
+    FROM messages
+    WHERE channel_id = ?
+    ORDER BY created_at, message_id
+"""
+
+
+_ARCHIVED_CHANNEL_MESSAGES_SQL = """
+    SELECT message_id, channel_id, agent_id, content, created_at
+    FROM main.messages WHERE channel_id = ?
+    UNION ALL
+    SELECT message_id, channel_id, agent_id, content, created_at
+    FROM archive.messages WHERE channel_id = ?
+    ORDER BY created_at, message_id
+"""
+
+
+def get_messages(channel: str | Channel, include_archive: bool = False) -> list[Message]:
     channel_id = _to_channel_id(channel)
     channel_obj = channels.get_channel(channel_id)
     if not channel_obj:
         raise ValueError(f"Channel {channel_id} not found")
 
-    with store.ensure() as conn:
-        rows = conn.execute(
-            """
-            SELECT message_id, channel_id, agent_id, content, created_at
-            FROM messages
-            WHERE channel_id = ?
-            ORDER BY created_at
-            """,
-            (channel_obj.channel_id,),
+    with store.read() as conn, archive.attached_if(conn, include_archive) as has_archive:
+        if has_archive:
+            rows = conn.execute(
+                _ARCHIVED_CHANNEL_MESSAGES_SQL, (channel_obj.channel_id, channel_obj.channel_id)
+            )
+        else:
+            rows = conn.execute(_CHANNEL_MESSAGES_SQL, (channel_obj.channel_id,))
+        return from_rows(rows, Message)
+
+
+async def aget_messages(
+    channel: str | Channel,
+    after: str | None = None,
+    before: str | None = None,
+    limit: int | None = None,
+) -> list[Message]:
+    """Async get_messages(), paged like recv_messages(): queries run off the event loop.
+
+    `after` / `before` are message ids. With `limit` and no `after`, returns the
+    newest `limit` messages (before `before`, if given); the bookmark is untouched.
+    """
+    from space.lib.store import aio
+
+    channel_id = _to_channel_id(channel)
+    channel_obj = await channels.aget_channel(channel_id)
+    if not channel_obj:
+        raise ValueError(f"Channel {channel_id} not found")
+    channel_id = channel_obj.channel_id
+
+    async with aio.read() as conn:
+        keys = {}
+        for name, message_id in (("after", after), ("before", before)):
+            if message_id:
+                rows = await conn.execute_fetchall(_CURSOR_SQL, (message_id, channel_id))
+                if not rows:
+                    raise ValueError(f"Message {message_id} not found in channel")
+                keys[name] = (rows[0][0], rows[0][1])
+
+        newest_first = limit is not None and not after
+        sql, params = _page_query(
+            channel_id, keys.get("after"), keys.get("before"), None, limit, newest_first
         )
-        return [_row_to_message(row) for row in rows.fetchall()]
+        rows = await conn.execute_fetchall(sql, params)
+
+    messages = [_row_to_message(row) for row in rows]
+    if newest_first:
+        messages.reverse()
+    return messages
+
+
+async def aget_previous_message_id(channel_id: str, created_at: str, message_id: str) -> str | None:
+    """Id of the newest message before a (created_at, message_id) position still in main.
+
+    Lets a cursor-following reader resume after its cursor message was deleted
+    or archived.
+    """
+    from space.lib.store import aio
+
+    row = await aio.fetchone(
+        "SELECT message_id FROM messages "
+        "WHERE channel_id = ? AND (created_at, message_id) < (?, ?) "
+        "ORDER BY created_at DESC, message_id DESC LIMIT 1",
+        (channel_id, created_at, message_id),
+    )
+    return row[0] if row else None
 
 
 def get_sender_history(identity: str, limit: int = 5) -> list[Message]:
@@ -92,7 +159,7 @@ def get_sender_history(identity: str, limit: int = 5) -> list[Message]:
     if not agent:
         raise ValueError(f"Identity '{identity}' not registered.")
     agent_id = agent.agent_id
-    with store.ensure() as conn:
+    with store.read() as conn:
         cursor = conn.execute(
             """
             SELECT m.message_id, m.channel_id, m.agent_id, m.content, m.created_at
@@ -103,7 +170,7 @@ def get_sender_history(identity: str, limit: int = 5) -> list[Message]:
             """,
             (agent_id, limit),
         )
-        return [_row_to_message(row) for row in cursor.fetchall()]
+        return from_rows(cursor, Message)
 
 
 def get_messages_before(channel: str | Channel, timestamp: str, limit: int = 1) -> list[Message]:
@@ -112,7 +179,7 @@ def get_messages_before(channel: str | Channel, timestamp: str, limit: int = 1)
     if not channel_obj:
         raise ValueError(f"Channel {channel_id} not found")
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             """
             SELECT m.message_id, m.channel_id, m.agent_id, m.content, m.created_at
@@ -123,55 +190,143 @@ def get_messages_before(channel: str | Channel, timestamp: str, limit: int = 1)
             """,
             (channel_obj.channel_id, timestamp, limit),
         )
-        return [_row_to_message(row) for row in rows.fetchall()]
-
-
-def _filter_after_bookmark(messages: list[Message], last_read_id: str) -> list[Message]:
-    """Return messages after bookmark (exclusive)."""
-    try:
-        bookmark_idx = next(i for i, m in enumerate(messages) if m.message_id == last_read_id)
-        return messages[bookmark_idx + 1 :]
-    except StopIteration:
-        return messages
+        return from_rows(rows, Message)
 
 
-def _filter_by_time(messages: list[Message], ago: str) -> list[Message]:
-    """Filter messages by time window (e.g., '1h', '30m')."""
+def _parse_ago(ago: str) -> str:
+    """Cutoff timestamp for a time window (e.g., '1h', '30m')."""
     match = re.match(r"(\d+)([hm])", ago)
     if not match:
         raise ValueError("Invalid time format. Use '1h' or '30m'")
 
     val, unit = int(match.group(1)), match.group(2)
     delta = timedelta(hours=val) if unit == "h" else timedelta(minutes=val)
-    cutoff = (datetime.now() - delta).isoformat()
-    return [m for m in messages if m.created_at > cutoff]
+    return (datetime.now() - delta).isoformat()
+
+
+_CURSOR_SQL = "SELECT created_at, message_id FROM messages WHERE message_id = ? AND channel_id = ?"
+
+
+def _cursor(conn, channel_id: str, message_id: str) -> tuple[str, str] | None:
+    """Keyset position (created_at, message_id) of a message in this channel."""
+    row = conn.execute(_CURSOR_SQL, (message_id, channel_id)).fetchone()
+    return (row[0], row[1]) if row else None
+
+
+def _page_query(
+    channel_id: str,
+    after: tuple[str, str] | None,
+    before: tuple[str, str] | None,
+    since: str | None,
+    limit: int | None,
+    newest_first: bool,
+) -> tuple[str, list]:
+    clauses = ["channel_id = ?"]
+    params: list = [channel_id]
+    if after:
+        clauses.append("(created_at, message_id) > (?, ?)")
+        params.extend(after)
+    if before:
+        clauses.append("(created_at, message_id) < (?, ?)")
+        params.extend(before)
+    if since:
+        clauses.append("created_at > ?")
+        params.append(since)
+
+    direction = "DESC" if newest_first else "ASC"
+    sql = (
+        "SELECT message_id, channel_id, agent_id, content, created_at FROM messages "
+        f"WHERE {' AND '.join(clauses)} "
+        f"ORDER BY created_at {direction}, message_id {direction}"
+    )
+    if limit is not None:
+        sql += " LIMIT ?"
+        params.append(limit)
+    return sql, params
+
+
+def _page_messages(
+    conn,
+    channel_id: str,
+    after: tuple[str, str] | None = None,
+    before: tuple[str, str] | None = None,
+    since: str | None = None,
+    limit: int | None = None,
+) -> list[Message]:
+    """Channel messages in (created_at, message_id) order, filtered in SQL.
+
+    With `before` and `limit` the page is the newest `limit` rows before the
+    cursor (paging back through history); otherwise the oldest after it.
+    """
+    newest_first = before is not None and limit is not None
+    sql, params = _page_query(channel_id, after, before, since, limit, newest_first)
+    messages = from_rows(conn.execute(sql, params), Message)
+    if newest_first:
+        messages.reverse()
+    return messages
 
 
 def recv_messages(
-    channel: str | Channel, ago: str | None = None, reader_id: str | None = None
+    channel: str | Channel,
+    ago: str | None = None,
+    reader_id: str | None = None,
+    limit: int | None = None,
+    before: str | None = None,
+    after: str | None = None,
 ) -> tuple[list[Message], int, str | None, list[str]]:
+    """Read a channel from the reader's bookmark (or a window/cursor), advancing it.
+
+    Args:
+        channel: Channel name, id or object
+        ago: Only messages newer than this window ('1h', '30m'); ignores the bookmark
+        reader_id: Bookmark owner; without a window or cursor, reads start after its bookmark
+        limit: Max messages (oldest unread first, so the bookmark catches up page by page)
+        before: Message id; only messages before it (newest page when `limit` is set)
+        after: Message id; only messages after it, instead of the bookmark
+
+    Reads cost the size of the page, not of the channel history. Paging back with
+    `before` never moves the bookmark.
+    """
     channel_id = _to_channel_id(channel)
     channel_obj = channels.get_channel(channel_id)
     if not channel_obj:
         raise ValueError(f"Channel {channel_id} not found")
-
-    messages = get_messages(channel_id)
-
-    if ago:
-        messages = _filter_by_time(messages, ago)
-    elif reader_id:
-        last_read_id = get_bookmark(reader_id, channel_obj.channel_id)
-        if last_read_id:
-            messages = _filter_after_bookmark(messages, last_read_id)
-
-    if reader_id and messages:
-        update_bookmark(reader_id, channel_obj.channel_id, messages[-1].message_id)
+    channel_id = channel_obj.channel_id
+
+    with store.read() as conn:
+        after_key = before_key = since = None
+        if after:
+            after_key = _cursor(conn, channel_id, after)
+            if not after_key:
+                raise ValueError(f"Message {after} not found in channel")
+        if before:
+            before_key = _cursor(conn, channel_id, before)
+            if not before_key:
+                raise ValueError(f"Message {before} not found in channel")
+
+        if ago:
+            since = _parse_ago(ago)
+        elif reader_id and not (after or before):
+            # A bookmark on a deleted or archived message reads the whole channel.
+            row = conn.execute(
+                "SELECT m.created_at, m.message_id FROM bookmarks b "
+                "JOIN messages m ON m.message_id = b.last_read_id AND m.channel_id = b.channel_id "
+                "WHERE b.reader_id = ? AND b.channel_id = ?",
+                (reader_id, channel_id),
+            ).fetchone()
+            if row:
+                after_key = (row[0], row[1])
+
+        messages = _page_messages(conn, channel_id, after_key, before_key, since, limit)
+
+    if reader_id and messages and not before:
+        update_bookmark(reader_id, channel_id, messages[-1].message_id)
 
     return messages, len(messages), channel_obj.topic, channel_obj.members
 
 
 def get_bookmark(reader_id: str, channel_id: str) -> str | None:
-    with store.ensure() as conn:
+    with store.read() as conn:
         row = conn.execute(
             "SELECT last_read_id FROM bookmarks WHERE reader_id = ? AND channel_id = ?",
             (reader_id, channel_id),
@@ -181,8 +336,8 @@ def get_bookmark(reader_id: str, channel_id: str) -> str | None:
 
 def update_bookmark(reader_id: str, channel_id: str, last_read_id: str) -> None:
     now = datetime.now().isoformat()
-    with store.ensure() as conn:
-        conn.execute(
+    store.write_batched(
+        lambda conn: conn.execute(
             """
             INSERT INTO bookmarks (reader_id, channel_id, last_read_id, updated_at)
             VALUES (?, ?, ?, ?)
@@ -192,6 +347,7 @@ def update_bookmark(reader_id: str, channel_id: str, last_read_id: str) -> None:
             """,
             (reader_id, channel_id, last_read_id, now),
         )
+    )
 
 
 def copy_bookmarks(from_reader_id: str, to_reader_id: str) -> None:
@@ -211,8 +367,10 @@ def copy_bookmarks(from_reader_id: str, to_reader_id: str) -> None:
         )
 
 
-def export_messages(channel: str | Channel, as_json: bool = False) -> str:
-    msgs = get_messages(channel)
+def export_messages(
+    channel: str | Channel, as_json: bool = False, include_archive: bool = False
+) -> str:
+    msgs = get_messages(channel, include_archive=include_archive)
     channel_obj = channels.get_channel(_to_channel_id(channel))
     title = f"Export: {channel_obj.name}" if channel_obj else "Messages"
     return format_messages(msgs, title=title, as_json=as_json)
@@ -248,29 +406,76 @@ def format_messages(messages: list[Message], title: str = "Messages", as_json: b
     return "\n".join(lines)
 
 
+def _tail_key(conn, channel_id: str) -> tuple[str, str] | None:
+    row = conn.execute(
+        "SELECT created_at, message_id FROM messages WHERE channel_id = ? "
+        "ORDER BY created_at DESC, message_id DESC LIMIT 1",
+        (channel_id,),
+    ).fetchone()
+    return (row[0], row[1]) if row else None
+
+
 def wait_for_message(
-    channel: str | Channel, identity: str, poll_interval: float = 0.1
+    channel: str | Channel,
+    identity: str,
+    poll_interval: float | None = None,
+    reader_id: str | None = None,
+    timeout: float | None = None,
 ) -> tuple[list[Message], int, str | None, list[str]]:
+    """Block until someone other than `identity` posts to the channel.
+
+    Waits on commits (store.changes) rather than re-reading the channel, and
+    reads only past its cursor when one lands. The cursor starts at the
+    reader's bookmark (advanced on return), else at the current tail.
+
+    Args:
+        poll_interval: Backoff ceiling between commit checks (default SPACE_WAIT_MAX_MS)
+        reader_id: Bookmark to resume from and advance
+        timeout: Give up after this many seconds, returning no messages
+    """
+    from space.lib.store import changes
     from space.os import spawn
 
     agent = spawn.get_agent(identity)
     if not agent:
         raise ValueError(f"Identity '{identity}' not registered.")
     agent_id = agent.agent_id
-    channel_id = _to_channel_id(channel)
-
-    while True:
-        msgs, count, context, participants = recv_messages(channel_id)
-        other_messages = [msg for msg in msgs if msg.agent_id != agent_id]
-
-        if other_messages:
-            return other_messages, len(other_messages), context, participants
-
-        time.sleep(poll_interval)
+    channel_obj = channels.get_channel(_to_channel_id(channel))
+    if not channel_obj:
+        raise ValueError(f"Channel {_to_channel_id(channel)} not found")
+    channel_id = channel_obj.channel_id
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    # Watch before taking the cursor so a commit in between still wakes us.
+    with changes.Watcher() as watcher:
+        with store.read() as conn:
+            cursor = None
+            if reader_id:
+                last_read_id = get_bookmark(reader_id, channel_id)
+                cursor = _cursor(conn, channel_id, last_read_id) if last_read_id else None
+            if cursor is None:
+                cursor = _tail_key(conn, channel_id)
+
+        while True:
+            with store.read() as conn:
+                new = _page_messages(conn, channel_id, after=cursor)
+            if new:
+                cursor = (new[-1].created_at, new[-1].message_id)
+                other_messages = [msg for msg in new if msg.agent_id != agent_id]
+                if other_messages:
+                    if reader_id:
+                        update_bookmark(reader_id, channel_id, new[-1].message_id)
+                    current = channels.get_channel(channel_id) or channel_obj
+                    return other_messages, len(other_messages), current.topic, current.members
+
+            remaining = None if deadline is None else deadline - time.monotonic()
+            if remaining is not None and remaining <= 0:
+                return [], 0, channel_obj.topic, channel_obj.members
+            watcher.wait(timeout=remaining, max_interval=poll_interval)
 
 
 def count_messages() -> tuple[int, int, int]:
-    with store.ensure() as conn:
+    with store.read() as conn:
         total = conn.execute("SELECT COUNT(*) FROM messages").fetchone()[0]
         archived = conn.execute(
             "SELECT COUNT(*) FROM messages m WHERE m.channel_id IN "
@@ -283,11 +488,12 @@ def count_messages() -> tuple[int, int, int]:
 def create_message(channel_id: str, agent_id: str, content: str) -> str:
     """Create message without agent validation (for system messages)."""
     message_id = uuid7()
-    with store.ensure() as conn:
-        conn.execute(
+    store.write_batched(
+        lambda conn: conn.execute(
             "INSERT INTO messages (message_id, channel_id, agent_id, content) VALUES (?, ?, ?, ?)",
             (message_id, channel_id, agent_id, content),
         )
+    )
     return message_id
 
 
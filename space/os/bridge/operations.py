@@ -2,10 +2,28 @@
 
 from space.core.models import SearchResult
 from space.lib import store
+from space.lib.store import archive
 from space.os import spawn
 
 
-def search(query: str, identity: str | None = None, all_agents: bool = False) -> list[SearchResult]:
+def _message_search_sql(schema: str, with_agent: bool) -> str:
+    sql = (
+        "SELECT m.message_id, m.channel_id, m.agent_id, m.content, m.created_at AS created_at, "
+        "c.name AS channel_name "
+        f"FROM {schema}.messages m JOIN main.channels c ON m.channel_id = c.channel_id "
+        f"WHERE m.rowid IN (SELECT rowid FROM {schema}.messages_fts f WHERE f.messages_fts MATCH ?)"
+    )
+    if with_agent:
+        sql += " AND m.agent_id = ?"
+    return sql
+
+
+def search(
+    query: str,
+    identity: str | None = None,
+    all_agents: bool = False,
+    include_archive: bool = False,
+) -> list[SearchResult]:
     results = []
 
     agent_id = None
@@ -15,19 +33,14 @@ def search(query: str, identity: str | None = None, all_agents: bool = False) ->
             raise ValueError(f"Agent '{identity}' not found")
         agent_id = agent.agent_id
 
-    with store.ensure() as conn:
-        sql_query = (
-            "SELECT m.message_id, m.channel_id, m.agent_id, m.content, m.created_at, c.name as channel_name "
-            "FROM messages m JOIN channels c ON m.channel_id = c.channel_id "
-            "WHERE m.rowid IN (SELECT rowid FROM messages_fts WHERE messages_fts MATCH ?)"
-        )
-        params = [query]
-
-        if agent_id:
-            sql_query += " AND m.agent_id = ?"
-            params.append(agent_id)
-
-        sql_query += " ORDER BY m.created_at ASC"
+    with store.read() as conn, archive.attached_if(conn, include_archive) as has_archive:
+        sql_query = _message_search_sql("main", bool(agent_id))
+        params = [query, agent_id] if agent_id else [query]
+        if has_archive:
+            archived = _message_search_sql("archive", bool(agent_id))
+            sql_query = f"SELECT * FROM ({sql_query} UNION ALL {archived})"
+            params *= 2
+        sql_query += " ORDER BY created_at ASC"
         try:
             rows = conn.execute(sql_query, params).fetchall()
         except Exception:
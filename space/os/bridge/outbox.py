@@ -0,0 +1,216 @@
+"""Outbox: durable delimiter processing for sent messages.
+
+`send_message` writes an outbox row in the same transaction as the message,
+so a `bridge send` process that exits early (or crashes) cannot lose an
+@mention, /stop or !compact. Rows are handled at least once:
+
+- the sender kicks its own row on a bounded thread pool for low latency;
+- `run()` (the API server runs it next to the timer daemon) claims whatever is
+  ready in batches, wakes on commits, and picks up anything the sender didn't.
+
+Claims are leases (`claimed_until`), so a worker that dies mid-batch only
+delays its rows. Failures retry with exponential backoff; after MAX_ATTEMPTS
+the row is marked dead and kept for inspection. Each delimiter step that
+finishes is recorded on the row (`steps_done`), so a retry resumes after it
+rather than re-running a /stop, !compact or @mention spawn.
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from space.lib import store
+
+log = logging.getLogger(__name__)
+
+BATCH_SIZE = 50
+LEASE_SECONDS = 120
+MAX_ATTEMPTS = 6
+BACKOFF_BASE_SECONDS = 2
+BACKOFF_MAX_SECONDS = 300
+IDLE_WAIT_SECONDS = 5
+DELIMITER_CHARS = "@!/"
+KICK_WORKERS = 10
+
+_kick_executor = ThreadPoolExecutor(max_workers=KICK_WORKERS, thread_name_prefix="outbox-")
+# In-flight kicks; beyond this the worker drains the backlog instead of the pool queue.
+_kick_slots = threading.BoundedSemaphore(KICK_WORKERS * 2)
+
+
+def needs_processing(content: str) -> bool:
+    """Whether a message could carry a delimiter at all."""
+    return any(ch in content for ch in DELIMITER_CHARS)
+
+
+def enqueue(conn: sqlite3.Connection, message_id: str) -> int:
+    """Add a message to the outbox inside the caller's transaction; returns the row id."""
+    now = time.time()
+    return conn.execute(
+        "INSERT INTO outbox (message_id, enqueued_at, next_attempt_at) VALUES (?, ?, ?) "
+        "ON CONFLICT (message_id) DO UPDATE SET next_attempt_at = next_attempt_at "
+        "RETURNING id",
+        (message_id, now, now),
+    ).fetchone()[0]
+
+
+def _claim(where: str, params: tuple, limit: int) -> list[store.Row]:
+    now = time.time()
+    with store.write() as conn:
+        return conn.execute(
+            f"""
+            UPDATE outbox SET claimed_until = ?, attempts = attempts + 1
+            WHERE id IN (
+                SELECT id FROM outbox
+                WHERE dead_at IS NULL AND next_attempt_at <= ?
+                  AND (claimed_until IS NULL OR claimed_until < ?) {where}
+                ORDER BY id LIMIT ?
+            )
+            RETURNING id, message_id, attempts, steps_done
+            """,
+            (now + LEASE_SECONDS, now, now, *params, limit),
+        ).fetchall()
+
+
+def claim(limit: int = BATCH_SIZE) -> list[store.Row]:
+    """Lease up to `limit` ready rows, oldest first."""
+    return _claim("", (), limit)
+
+
+def _complete(entry_id: int) -> None:
+    with store.write() as conn:
+        conn.execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+
+
+def _mark_done(entry_id: int, step: str) -> None:
+    with store.write() as conn:
+        conn.execute(
+            "UPDATE outbox SET steps_done = json_insert(steps_done, '$[#]', ?) WHERE id = ?",
+            (step, entry_id),
+        )
+
+
+def _fail(entry_id: int, attempts: int, error: str) -> None:
+    now = time.time()
+    with store.write() as conn:
+        if attempts >= MAX_ATTEMPTS:
+            log.error(f"Outbox entry {entry_id} failed {attempts} times, giving up: {error}")
+            conn.execute(
+                "UPDATE outbox SET dead_at = ?, claimed_until = NULL, last_error = ? WHERE id = ?",
+                (now, error, entry_id),
+            )
+            return
+        delay = min(BACKOFF_BASE_SECONDS * 2 ** (attempts - 1), BACKOFF_MAX_SECONDS)
+        conn.execute(
+            "UPDATE outbox SET next_attempt_at = ?, claimed_until = NULL, last_error = ? "
+            "WHERE id = ?",
+            (now + delay, error, entry_id),
+        )
+
+
+def _process(entry: store.Row) -> bool:
+    from . import delimiters
+
+    with store.read() as conn:
+        message = conn.execute(
+            "SELECT channel_id, agent_id, content FROM messages WHERE message_id = ?",
+            (entry["message_id"],),
+        ).fetchone()
+    if not message:
+        # Deleted (or archived) before it was handled: nothing left to do.
+        _complete(entry["id"])
+        return True
+
+    try:
+        delimiters.dispatch(
+            message["channel_id"],
+            message["content"],
+            message["agent_id"],
+            done=set(json.loads(entry["steps_done"])),
+            mark=lambda step: _mark_done(entry["id"], step),
+        )
+    except Exception as e:
+        log.warning(f"Outbox entry {entry['id']} failed (attempt {entry['attempts']}): {e}")
+        _fail(entry["id"], entry["attempts"], str(e))
+        return False
+    _complete(entry["id"])
+    return True
+
+
+def process_entry(entry_id: int) -> bool:
+    """Claim and handle one row now; False if it is not ready or someone else has it."""
+    rows = _claim("AND id = ?", (entry_id,), 1)
+    return bool(rows) and _process(rows[0])
+
+
+def kick(entry_id: int) -> None:
+    """Handle a fresh row on the sender's thread pool, leaving it to the worker when busy."""
+    if not _kick_slots.acquire(blocking=False):
+        return
+
+    def _run() -> None:
+        try:
+            process_entry(entry_id)
+        except Exception as e:
+            log.warning(f"Outbox kick for {entry_id} failed: {e}")
+        finally:
+            _kick_slots.release()
+
+    _kick_executor.submit(_run)
+
+
+def drain(limit: int = BATCH_SIZE) -> int:
+    """Claim and handle one batch; returns how many rows were claimed."""
+    rows = claim(limit)
+    for row in rows:
+        _process(row)
+    return len(rows)
+
+
+def stats() -> dict:
+    """Queue depth, in-flight leases, dead rows and the age of the oldest pending row."""
+    now = time.time()
+    with store.read() as conn:
+        row = conn.execute(
+            """
+            SELECT
+                COUNT(*) FILTER (WHERE dead_at IS NULL),
+                COUNT(*) FILTER (WHERE dead_at IS NULL AND claimed_until >= ?),
+                COUNT(*) FILTER (WHERE dead_at IS NOT NULL),
+                MIN(enqueued_at) FILTER (WHERE dead_at IS NULL)
+            FROM outbox
+            """,
+            (now,),
+        ).fetchone()
+    pending, in_flight, dead, oldest = row
+    return {
+        "pending": pending,
+        "in_flight": in_flight,
+        "dead": dead,
+        "lag_seconds": round(now - oldest, 3) if oldest else 0.0,
+    }
+
+
+def run() -> None:
+    """Drain the outbox forever, waking on commits."""
+    from space.lib.store import changes
+
+    log.info("Outbox worker started")
+
+    with changes.Watcher() as watcher:
+        while True:
+            try:
+                while drain():
+                    pass
+            except Exception as e:
+                log.error(f"Outbox error: {e}", exc_info=True)
+
+            # New rows arrive with a commit; retries come due on their own, so cap the wait.
+            watcher.wait(timeout=IDLE_WAIT_SECONDS, max_interval=0.25)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    run()
@@ -102,7 +102,7 @@ def _get_agents_in_channel(channel_id: str) -> list[str]:
 
 def _process_compact(channel_id: str, content: str, sender_agent_id: str | None) -> None:
     """Parse !compact summary and spawn successor with parent link."""
-    from space.lib.detach import detach
+    from space.os.spawn import scheduler, supervisor
 
     if not sender_agent_id:
         return
@@ -123,17 +123,12 @@ def _process_compact(channel_id: str, content: str, sender_agent_id: str | None)
     if not current_spawn:
         return
 
-    detach(
-        [
-            "spawn",
-            "run",
-            sender_agent.identity,
-            "Continue from compact",
-            "--channel",
-            channel_id,
-            "--parent-spawn",
-            current_spawn.id,
-        ]
+    supervisor.submit(
+        sender_agent.identity,
+        "Continue from compact",
+        channel_id=channel_id,
+        parent_spawn_id=current_spawn.id,
+        priority=scheduler.PRIORITY_CONTINUATION,
     )
 
     spawns.terminate_spawn(current_spawn.id, "completed")
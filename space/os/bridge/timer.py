@@ -6,7 +6,7 @@ from datetime import datetime
 
 from space.lib import store
 from space.os.bridge import channels, messaging
-from space.os.bridge.control import _stop_all_agents_in_channel
+from space.os.bridge.control import _stop_all_agents_in_channels
 
 log = logging.getLogger(__name__)
 
@@ -28,7 +28,7 @@ def run() -> None:
 
 def _check_and_expire_timers() -> None:
     """Check all channels with timers and expire those past deadline."""
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             """
             SELECT channel_id, name, timer_expires_at
@@ -38,9 +38,9 @@ def _check_and_expire_timers() -> None:
         ).fetchall()
 
     now = datetime.utcnow()
+    expired = []
 
     for row in rows:
-        channel_id = row["channel_id"]
         channel_name = row["name"]
         expires_at_str = row["timer_expires_at"]
 
@@ -52,12 +52,19 @@ def _check_and_expire_timers() -> None:
 
         if now >= expires_at:
             log.info(f"Timer expired for channel {channel_name}, stopping all agents")
-            _stop_all_agents_in_channel(channel_id)
+            expired.append(row["channel_id"])
 
-            messaging.create_message(
-                channel_id=channel_id,
-                agent_id="system",
-                content="⏱️ Timer expired. All agents stopped.",
-            )
+    if not expired:
+        return
 
-            channels.clear_timer(channel_id)
+    # One termination pass for every expired channel, bounded by a single deadline.
+    _stop_all_agents_in_channels(expired)
+
+    for channel_id in expired:
+        messaging.create_message(
+            channel_id=channel_id,
+            agent_id="system",
+            content="⏱️ Timer expired. All agents stopped.",
+        )
+
+        channels.clear_timer(channel_id)
@@ -24,6 +24,10 @@ def search(
     all_agents: Annotated[
         bool, typer.Option("--all", help="Include all agents' memories (requires --as)")
     ] = False,
+    include_archive: Annotated[
+        bool,
+        typer.Option("--include-archive", help="Also search archived messages and transcripts"),
+    ] = False,
     json_output: Annotated[
         bool, typer.Option("--json", "-j", help="Output in JSON format.")
     ] = False,
@@ -37,6 +41,7 @@ def search(
       context search "pause"                             # Search all sources for "pause"
       context search "my observations" --as agent        # Search agent's private memory
       context search "architecture" --scope knowledge    # Search knowledge domain only
+      context search "migration" --include-archive       # Include archived history
 
     Scope options: all (default), memory, knowledge, canon, bridge, sessions
     """
@@ -47,8 +52,8 @@ def search(
         raise typer.Exit(1)
 
     resolved_identity = resolve_identity(identity)
-    timeline = collect_timeline(query, resolved_identity, all_agents)
-    current_state = collect_current_state(query, resolved_identity, all_agents)
+    timeline = collect_timeline(query, resolved_identity, all_agents, include_archive)
+    current_state = collect_current_state(query, resolved_identity, all_agents, include_archive)
 
     if scope != "all":
         timeline = [item for item in timeline if item["source"].lower() == scope.lower()]
@@ -8,10 +8,13 @@ def _validate_search_term(term: str, max_len: int = 256) -> None:
         raise ValueError(f"Search term too long (max {max_len} chars, got {len(term)})")
 
 
-def collect_timeline(query: str, identity: str | None, all_agents: bool) -> list[dict]:
+def collect_timeline(
+    query: str, identity: str | None, all_agents: bool, include_archive: bool = False
+) -> list[dict]:
     """Unified timeline: evolution across all sources.
 
     Memory is only included if --as <identity> is specified (private working memory).
+    Archived bridge messages and transcripts are searched only with include_archive.
     """
     _validate_search_term(query, max_len=256)
     seen = set()
@@ -48,7 +51,7 @@ def collect_timeline(query: str, identity: str | None, all_agents: bool) -> list
                 }
             )
 
-    for result in bridge.search(query, identity, all_agents):
+    for result in bridge.search(query, identity, all_agents, include_archive):
         key = (result.source, result.metadata.get("message_id"))
         if key not in seen:
             seen.add(key)
@@ -63,7 +66,7 @@ def collect_timeline(query: str, identity: str | None, all_agents: bool) -> list
                 }
             )
 
-    for result in sessions.search(query, identity, all_agents):
+    for result in sessions.search(query, identity, all_agents, include_archive):
         key = (result["source"], result.get("session_id"))
         if key not in seen:
             seen.add(key)
@@ -111,10 +114,13 @@ def collect_timeline(query: str, identity: str | None, all_agents: bool) -> list
     return timeline[-10:]
 
 
-def collect_current_state(query: str, identity: str | None, all_agents: bool) -> dict:
+def collect_current_state(
+    query: str, identity: str | None, all_agents: bool, include_archive: bool = False
+) -> dict:
     """Unified state: current entries across all sources.
 
     Memory is only included if --as <identity> is specified (private working memory).
+    Archived bridge messages and transcripts are searched only with include_archive.
     """
     results = {"memory": [], "knowledge": [], "bridge": [], "sessions": [], "canon": []}
 
@@ -146,7 +152,7 @@ def collect_current_state(query: str, identity: str | None, all_agents: bool) ->
             "content": r.content,
             "reference": r.reference,
         }
-        for r in bridge.search(query, identity, all_agents)
+        for r in bridge.search(query, identity, all_agents, include_archive)
     ]
 
     results["sessions"] = [
@@ -159,7 +165,7 @@ def collect_current_state(query: str, identity: str | None, all_agents: bool) ->
             "reference": r["reference"],
             "score": r.get("score"),
         }
-        for r in sessions.search(query, identity, all_agents)
+        for r in sessions.search(query, identity, all_agents, include_archive)
     ]
 
     results["canon"] = [
@@ -44,7 +44,7 @@ def add_knowledge(domain: str, agent_id: str, content: str) -> str:
 
 def list_knowledge(show_all: bool = False) -> list[Knowledge]:
     archive = archive_filter(show_all)
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             f"SELECT knowledge_id, domain, agent_id, content, created_at, archived_at FROM knowledge {archive} ORDER BY created_at DESC"
         ).fetchall()
@@ -62,7 +62,7 @@ def query_knowledge(domain: str, show_all: bool = False) -> list[Knowledge]:
         where_clause = f"WHERE domain = ? {archive}"
         params = (domain,)
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             f"SELECT knowledge_id, domain, agent_id, content, created_at, archived_at FROM knowledge {where_clause} ORDER BY created_at DESC",
             params,
@@ -72,7 +72,7 @@ def query_knowledge(domain: str, show_all: bool = False) -> list[Knowledge]:
 
 def query_knowledge_by_agent(agent_id: str, show_all: bool = False) -> list[Knowledge]:
     archive = archive_filter(show_all, prefix="AND")
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             f"SELECT knowledge_id, domain, agent_id, content, created_at, archived_at FROM knowledge WHERE agent_id = ? {archive} ORDER BY created_at DESC",
             (agent_id,),
@@ -81,7 +81,7 @@ def query_knowledge_by_agent(agent_id: str, show_all: bool = False) -> list[Know
 
 
 def get_knowledge(entry_id: str) -> Knowledge | None:
-    with store.ensure() as conn:
+    with store.read() as conn:
         row = conn.execute(
             "SELECT knowledge_id, domain, agent_id, content, created_at, archived_at FROM knowledge WHERE knowledge_id = ?",
             (entry_id,),
@@ -100,7 +100,7 @@ def find_related_knowledge(
         return []
 
     archive = archive_filter(show_all, prefix="AND")
-    with store.ensure() as conn:
+    with store.read() as conn:
         fts_query = " OR ".join(keywords)
         try:
             query = f"""
@@ -139,7 +139,7 @@ def archive_knowledge(entry_id: str, restore: bool = False) -> None:
 def get_domain_tree(parent_domain: str | None = None, show_all: bool = False) -> dict:
     from space.lib.uuid7 import short_id
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         if parent_domain:
             query = "SELECT domain, knowledge_id FROM knowledge WHERE domain LIKE ?"
             params = [f"{parent_domain}/%"]
@@ -172,7 +172,7 @@ def get_domain_tree(parent_domain: str | None = None, show_all: bool = False) ->
 
 
 def count_knowledge() -> tuple[int, int, int]:
-    with store.ensure() as conn:
+    with store.read() as conn:
         total = conn.execute("SELECT COUNT(*) FROM knowledge").fetchone()[0]
         active = conn.execute(
             "SELECT COUNT(*) FROM knowledge WHERE archived_at IS NULL"
@@ -208,7 +208,7 @@ def search(query: str, identity: str | None = None, all_agents: bool = False) ->
             raise ValueError(f"Agent '{identity}' not found")
         agent_id = agent.agent_id
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows: list[store.Row]
         fts_terms = _fts_terms(query)
         if fts_terms:
@@ -252,7 +252,7 @@ def stats() -> "KnowledgeStats":
     from space.core.models import KnowledgeStats
 
     total, active, archived = count_knowledge()
-    with store.ensure() as conn:
+    with store.read() as conn:
         domains = conn.execute(
             "SELECT COUNT(DISTINCT domain) FROM knowledge WHERE archived_at IS NULL"
         ).fetchone()[0]
@@ -10,10 +10,9 @@ from space.os import spawn
 
 
 def _row_to_memory(row: store.Row) -> Memory:
-    data = dict(row)
-    data["core"] = bool(data["core"])
-    data["topic"] = data.get("topic")
-    return from_row(data, Memory)
+    memory = from_row(row, Memory)
+    memory.core = bool(memory.core)
+    return memory
 
 
 def add_memory(
@@ -49,7 +48,7 @@ def list_memories(
         raise ValueError(f"Agent '{identity}' not found")
     agent_id = agent.agent_id
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         params = [agent_id]
         query = "SELECT memory_id, agent_id, message, topic, created_at, archived_at, core, source FROM memories WHERE agent_id = ?"
 
@@ -90,7 +89,7 @@ def search_memories(
 
     archive_filter = "" if show_all else "AND archived_at IS NULL"
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         sql = f"""
             SELECT m.memory_id, m.agent_id, m.message, m.topic, m.created_at,
                    m.archived_at, m.core, m.source
@@ -187,7 +186,7 @@ def find_related_memories(
         return []
 
     archive_filter = "" if show_all else "AND archived_at IS NULL"
-    with store.ensure() as conn:
+    with store.read() as conn:
         fts_query = " OR ".join(keywords)
         try:
             query = f"""
@@ -214,7 +213,7 @@ def get_memory(memory_id: str) -> Memory | None:
     except ValueError:
         return None
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         row = conn.execute(
             "SELECT memory_id, agent_id, message, topic, created_at, archived_at, core, source FROM memories WHERE memory_id = ?",
             (full_id,),
@@ -230,7 +229,7 @@ def get_agent_memories(
     after_timestamp: str | None = None,
     limit: int | None = None,
 ) -> list[Memory]:
-    with store.ensure() as conn:
+    with store.read() as conn:
         query = "SELECT memory_id, agent_id, message, topic, created_at, archived_at, core, source FROM memories WHERE agent_id = ? AND archived_at IS NULL"
         params = [agent_id]
 
@@ -248,7 +247,7 @@ def get_agent_memories(
 
 
 def count_memories() -> tuple[int, int, int]:
-    with store.ensure() as conn:
+    with store.read() as conn:
         total = conn.execute("SELECT COUNT(*) FROM memories").fetchone()[0]
         active = conn.execute("SELECT COUNT(*) FROM memories WHERE archived_at IS NULL").fetchone()[
             0
@@ -260,7 +259,7 @@ def count_memories() -> tuple[int, int, int]:
 def stats(agent_id: str | None = None) -> "MemoryStats":
     from space.core.models import MemoryStats
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         if agent_id:
             total = conn.execute(
                 "SELECT COUNT(*) FROM memories WHERE agent_id = ?", (agent_id,)
@@ -300,7 +299,7 @@ def search(query: str, identity: str | None = None, all_agents: bool = False) ->
             raise ValueError(f"Agent '{identity}' not found")
         agent_id = agent.agent_id
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         try:
             fts_query = """
                 SELECT m.memory_id, m.agent_id, m.topic, m.message, m.created_at
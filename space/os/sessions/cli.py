@@ -98,12 +98,18 @@ def show_session(query: str):
     from space.core.models import Spawn
     from space.lib import store
     from space.lib.store import from_row
+    from space.lib.uuid7 import prefix_range
 
-    # Try as spawn_id first (partial match supported)
-    with store.ensure() as conn:
+    if not query.strip():
+        typer.echo("Spawn ID or agent identity required", err=True)
+        raise typer.Exit(1)
+
+    # Try as spawn_id first (partial match supported); exact IDs sort first in the range.
+    # Ids are lowercase hex, so the prefix is too.
+    with store.read() as conn:
         row = conn.execute(
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns WHERE id = ? OR id LIKE ? LIMIT 1",
-            (query, f"{query}%"),
+            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns WHERE id >= ? AND id < ? ORDER BY id LIMIT 1",
+            prefix_range(query.lower()),
         ).fetchone()
         if row:
             spawn = from_row(row, Spawn)
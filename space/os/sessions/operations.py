@@ -4,17 +4,37 @@ import logging
 
 from space.core.models import SessionStats
 from space.lib import store, uuid7
+from space.lib.store import archive
 
 logger = logging.getLogger(__name__)
 
 
-def search(query: str, identity: str | None = None, all_agents: bool = False) -> list[dict]:
+def _transcript_search_sql(schema: str, with_identity: bool) -> str:
+    sql = f"""
+        SELECT t.session_id, t.provider, t.type, t.identity, t.content, t.timestamp,
+               fts.rank AS rank
+        FROM {schema}.transcripts t
+        JOIN {schema}.transcripts_fts fts ON t.id = fts.rowid
+        WHERE fts.transcripts_fts MATCH ?
+    """
+    if with_identity:
+        sql += " AND t.identity = ?"
+    return sql
+
+
+def search(
+    query: str,
+    identity: str | None = None,
+    all_agents: bool = False,
+    include_archive: bool = False,
+) -> list[dict]:
     """Search transcripts via FTS5 (implicit episodic memory).
 
     Args:
         query: Search query (supports FTS5 syntax: phrase, boolean, wildcards, NEAR)
         identity: Filter results to specific agent identity
         all_agents: Reserved for future multi-agent filtering
+        include_archive: Also search transcripts moved to the archive database
 
     Returns:
         List of results matching the query, sorted by BM25 relevance + recency.
@@ -23,32 +43,14 @@ def search(query: str, identity: str | None = None, all_agents: bool = False) ->
     results = []
 
     try:
-        with store.ensure() as conn:
-            where_clause = "WHERE fts.transcripts_fts MATCH ?"
-            params = [query]
-
-            if identity:
-                where_clause += " AND t.identity = ?"
-                params.append(identity)
-
-            rows = conn.execute(
-                f"""
-                SELECT
-                    t.session_id,
-                    t.provider,
-                    t.type,
-                    t.identity,
-                    t.content,
-                    t.timestamp,
-                    fts.rank
-                FROM transcripts t
-                JOIN transcripts_fts fts ON t.id = fts.rowid
-                {where_clause}
-                ORDER BY fts.rank, t.timestamp DESC
-                LIMIT 100
-                """,
-                params,
-            ).fetchall()
+        with store.read() as conn, archive.attached_if(conn, include_archive) as has_archive:
+            params = [query, identity] if identity else [query]
+            sql = _transcript_search_sql("main", bool(identity))
+            if has_archive:
+                archived = _transcript_search_sql("archive", bool(identity))
+                sql = f"SELECT * FROM ({sql} UNION ALL {archived})"
+                params *= 2
+            rows = conn.execute(f"{sql} ORDER BY rank, timestamp DESC LIMIT 100", params).fetchall()
 
             for row in rows:
                 session_id, provider, message_type, identity, content, timestamp, rank = row
@@ -79,7 +81,7 @@ def get_stats() -> dict:
 
     Returns aggregated session metrics by provider and agent.
     """
-    with store.ensure() as conn:
+    with store.read() as conn:
         total_sessions = conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0]
         totals = conn.execute(
             "SELECT COALESCE(SUM(message_count), 0), COALESCE(SUM(tool_count), 0), "
@@ -182,7 +184,9 @@ def resolve_session_id(
 
     # Try short session ID lookup
     try:
-        resolved = uuid7.resolve_id("sessions", "id", resume, error_context="resume session")
+        resolved = uuid7.resolve_id(
+            "sessions", "session_id", resume, error_context="resume session"
+        )
         return validate_session(resolved)
     except ValueError as e:
         raise ValueError(f"Cannot resolve session or spawn: {e}") from e
@@ -4,6 +4,8 @@ import logging
 from dataclasses import dataclass
 
 from space.lib import paths, providers, store
+from space.lib.store import archive
+from space.lib.store.sqlite import profile_scope
 
 logger = logging.getLogger(__name__)
 
@@ -363,60 +365,70 @@ def _needs_reindex(session_id: str, current_mtime: float, conn) -> bool:
 
 
 def _batch_index_sessions(sessions_dir, on_progress=None) -> int:
-    """Index changed JSONL files across providers (diff-based indexing)."""
+    """Index changed JSONL files across providers (diff-based indexing).
+
+    Each session is indexed in its own write scope so the serialized writer is
+    released between files and concurrent bridge writes are not starved.
+    """
     indexed_count = 0
     skipped_count = 0
+    has_archive = archive.exists()
 
     try:
-        with store.ensure() as conn:
-            conn.execute("PRAGMA busy_timeout = 30000")
-            conn.execute("PRAGMA synchronous = OFF")
-            conn.execute("PRAGMA journal_mode = MEMORY")
-
-            for provider_name in providers.PROVIDER_NAMES:
-                provider_dir = sessions_dir / provider_name
-                if not provider_dir.exists():
-                    continue
+        for provider_name in providers.PROVIDER_NAMES:
+            provider_dir = sessions_dir / provider_name
+            if not provider_dir.exists():
+                continue
 
-                files = list(provider_dir.glob("*.jsonl"))
+            files = list(provider_dir.glob("*.jsonl"))
 
-                for jsonl_file in files:
-                    try:
-                        session_id = jsonl_file.stem
-                        current_mtime = jsonl_file.stat().st_mtime
+            for jsonl_file in files:
+                try:
+                    session_id = jsonl_file.stem
+                    current_mtime = jsonl_file.stat().st_mtime
 
-                        # Skip unchanged sessions
+                    # Skip unchanged sessions
+                    with store.read() as conn:
                         if not _needs_reindex(session_id, current_mtime, conn):
                             skipped_count += 1
                             continue
 
-                        # Delete only this session's transcripts
+                    content = jsonl_file.read_text()
+                    # The transaction (`with conn`) ends before the archive is
+                    # detached and the profile restored: neither DETACH nor
+                    # `synchronous` can change while it is open.
+                    with (
+                        store.write() as conn,
+                        profile_scope(conn, "bulk-load"),
+                        archive.attached_if(conn, has_archive),
+                        conn,
+                    ):
+                        conn.execute("BEGIN")
+                        # Delete only this session's transcripts (in either tier)
                         conn.execute("DELETE FROM transcripts WHERE session_id = ?", (session_id,))
+                        archive.forget_session(conn, session_id)
 
                         # Re-index changed session
-                        content = jsonl_file.read_text()
                         if content.strip():
                             _index_session_file(
                                 session_id, provider_name, content, conn, mtime=current_mtime
                             )
-                        indexed_count += 1
-
-                        if on_progress and indexed_count % 50 == 0:
-                            event = ProgressEvent(
-                                provider=provider_name,
-                                discovered=0,
-                                synced=0,
-                                phase="index",
-                                indexed=indexed_count,
-                                total_indexed=len(files),
-                            )
-                            on_progress(event)
-                    except Exception as e:
-                        logger.warning(f"Failed to index {jsonl_file}: {e}")
+                    indexed_count += 1
+
+                    if on_progress and indexed_count % 50 == 0:
+                        event = ProgressEvent(
+                            provider=provider_name,
+                            discovered=0,
+                            synced=0,
+                            phase="index",
+                            indexed=indexed_count,
+                            total_indexed=len(files),
+                        )
+                        on_progress(event)
+                except Exception as e:
+                    logger.warning(f"Failed to index {jsonl_file}: {e}")
 
-            conn.execute("PRAGMA synchronous = NORMAL")
-            conn.commit()
-            logger.info(f"Indexed {indexed_count} sessions, skipped {skipped_count} unchanged")
+        logger.info(f"Indexed {indexed_count} sessions, skipped {skipped_count} unchanged")
     except Exception as e:
         logger.warning(f"Failed to batch index sessions: {e}")
 
@@ -32,15 +32,17 @@ def compute_constitution_hash(constitution_name: str | None) -> str | None:
 
 
 def touch_agent(agent_id: str) -> None:
-    with store.ensure() as conn:
-        conn.execute(
+    now = datetime.now().isoformat()
+    store.write_batched(
+        lambda conn: conn.execute(
             "UPDATE agents SET last_active_at = ? WHERE agent_id = ?",
-            (datetime.now().isoformat(), agent_id),
+            (now, agent_id),
         )
+    )
 
 
 def get_agent(identifier: str) -> Agent | None:
-    with store.ensure() as conn:
+    with store.read() as conn:
         row = conn.execute(
             "SELECT agent_id, identity, model, constitution, role, spawn_count, created_at, last_active_at, archived_at FROM agents WHERE (identity = ? OR agent_id = ?) AND archived_at IS NULL LIMIT 1",
             (identifier, identifier),
@@ -161,7 +163,7 @@ def unarchive_agent(name: str) -> bool:
 
 
 def list_agents() -> list[str]:
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             "SELECT identity FROM agents WHERE archived_at IS NULL ORDER BY identity"
         ).fetchall()
@@ -180,7 +182,7 @@ def merge_agents(from_name: str, to_name: str) -> bool:
     if from_id == to_id:
         return False
 
-    with store.ensure() as conn:
+    with store.ensure() as conn, store.transaction(conn):
         conn.execute("UPDATE messages SET agent_id = ? WHERE agent_id = ?", (to_id, from_id))
         conn.execute("UPDATE spawns SET agent_id = ? WHERE agent_id = ?", (to_id, from_id))
         conn.execute("UPDATE knowledge SET agent_id = ? WHERE agent_id = ?", (to_id, from_id))
@@ -191,19 +193,19 @@ def merge_agents(from_name: str, to_name: str) -> bool:
 
 
 def agent_identities() -> dict[str, str]:
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute("SELECT agent_id, identity FROM agents").fetchall()
         return {row[0]: row[1] for row in rows}
 
 
 def archived_agents() -> set[str]:
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute("SELECT agent_id FROM agents WHERE archived_at IS NOT NULL").fetchall()
         return {row[0] for row in rows}
 
 
 def stats() -> dict:
-    with store.ensure() as conn:
+    with store.read() as conn:
         total_agents = conn.execute("SELECT COUNT(*) FROM agents").fetchone()[0]
         active_agents = conn.execute(
             "SELECT COUNT(*) FROM agents WHERE archived_at IS NULL"
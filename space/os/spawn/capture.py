@@ -0,0 +1,161 @@
+"""Spawn output capture: stream provider output to disk, keep a bounded tail.
+
+`communicate()` held a provider's whole stdout and stderr in the parent until
+it exited, so a long `codex exec --json` run grew the launcher by megabytes.
+Instead, one reader thread per pipe copies chunks into a rotating log at
+`~/.space/spawns/<identity>/logs/<spawn_id>.log` (stderr lines prefixed) and
+keeps only the last TAIL_LINES lines of each stream for error reporting.
+The session id is parsed from the first stdout line as it arrives. Memory use
+is the same whether the spawn runs for a second or an hour.
+"""
+
+import contextlib
+import threading
+import time
+from collections import deque
+from collections.abc import Callable
+from pathlib import Path
+from typing import IO
+
+from space.lib import paths
+
+CHUNK_BYTES = 64 * 1024
+TAIL_LINES = 200
+TAIL_LINE_CHARS = 2000
+FIRST_LINE_MAX_BYTES = 1024 * 1024
+LOG_MAX_BYTES = 8 * 1024 * 1024
+LOG_BACKUPS = 2
+STDERR_PREFIX = b"[stderr] "
+
+
+def log_path(identity: str, spawn_id: str) -> Path:
+    return paths.identity_dir(identity) / "logs" / f"{spawn_id}.log"
+
+
+class RotatingLog:
+    """Append-only log that rolls to .1, .2, ... past `max_bytes`. Thread-safe."""
+
+    def __init__(self, path: Path, max_bytes: int = LOG_MAX_BYTES, backups: int = LOG_BACKUPS):
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+        self._lock = threading.Lock()
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = path.open("ab")
+        self._size = self._file.tell()
+
+    def write(self, data: bytes) -> None:
+        with self._lock:
+            if self._file.closed:
+                return
+            if self._size and self._size + len(data) > self.max_bytes:
+                self._rotate()
+            self._file.write(data)
+            self._size += len(data)
+
+    def _rotate(self) -> None:
+        self._file.close()
+        for n in range(self.backups, 0, -1):
+            src = self.path.with_name(f"{self.path.name}.{n - 1}") if n > 1 else self.path
+            if src.exists():
+                src.replace(self.path.with_name(f"{self.path.name}.{n}"))
+        if not self.backups:
+            self.path.unlink(missing_ok=True)
+        self._file = self.path.open("ab")
+        self._size = 0
+
+    def close(self) -> None:
+        with self._lock:
+            self._file.close()
+
+
+class OutputCapture:
+    """Drains a process's stdout/stderr on background threads.
+
+    `session_parser` gets the first stdout line (decoded) and returns the
+    session id in it, if any.
+    """
+
+    def __init__(self, path: Path, session_parser: Callable[[str], str | None] | None = None):
+        self.log = RotatingLog(path)
+        self.session_id: str | None = None
+        self.first_output_at: float | None = None  # time.monotonic() of the first stdout chunk
+        self._session_parser = session_parser
+        self._tails: dict[str, deque[str]] = {
+            "stdout": deque(maxlen=TAIL_LINES),
+            "stderr": deque(maxlen=TAIL_LINES),
+        }
+        self._threads: list[threading.Thread] = []
+
+    def attach(self, stdout: IO[bytes] | None, stderr: IO[bytes] | None) -> None:
+        for name, stream in (("stdout", stdout), ("stderr", stderr)):
+            if stream is None:
+                continue
+            thread = threading.Thread(
+                target=self._drain, args=(name, stream), name=f"capture-{name}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+
+    def _drain(self, name: str, stream: IO[bytes]) -> None:
+        tail = self._tails[name]
+        read = getattr(stream, "read1", stream.read)
+        prefix = STDERR_PREFIX if name == "stderr" else b""
+        line_start = True
+        partial = b""
+        first_line: bytearray | None = bytearray() if name == "stdout" else None
+        try:
+            while chunk := read(CHUNK_BYTES):
+                if name == "stdout" and self.first_output_at is None:
+                    self.first_output_at = time.monotonic()
+                if prefix:
+                    data = chunk.replace(b"\n", b"\n" + prefix)
+                    if line_start:
+                        data = prefix + data
+                    line_start = data.endswith(b"\n" + prefix)
+                    self.log.write(data.removesuffix(prefix) if line_start else data)
+                else:
+                    self.log.write(chunk)
+
+                if first_line is not None:
+                    head, newline, _ = chunk.partition(b"\n")
+                    if len(first_line) < FIRST_LINE_MAX_BYTES:
+                        first_line += head
+                    if newline:
+                        self._parse_session(bytes(first_line))
+                        first_line = None
+
+                lines = (partial + chunk).split(b"\n")
+                # Only the end of an over-long line can reach the tail.
+                partial = lines.pop()[-TAIL_LINE_CHARS * 4 :]
+                tail.extend(_decode(line) for line in lines[-TAIL_LINES:])
+        finally:
+            if partial:
+                tail.append(_decode(partial))
+            if first_line:
+                self._parse_session(bytes(first_line))
+            with contextlib.suppress(OSError):
+                stream.close()
+
+    def _parse_session(self, line: bytes) -> None:
+        if not self._session_parser or self.session_id:
+            return
+        with contextlib.suppress(Exception):
+            self.session_id = self._session_parser(line.decode(errors="replace"))
+
+    def join(self, timeout: float | None = None) -> None:
+        """Wait for the pipes to drain, then close the log.
+
+        A provider's own children can hold the pipes open after it exits, so
+        callers pass a timeout; anything written after it is dropped.
+        """
+        for thread in self._threads:
+            thread.join(timeout)
+        self.log.close()
+
+    def tail(self, name: str = "stderr") -> str:
+        return "\n".join(self._tails[name])
+
+
+def _decode(line: bytes) -> str:
+    return line.decode(errors="replace")[:TAIL_LINE_CHARS]
@@ -1,10 +1,8 @@
 """Spawn CLI: Agent Management & Task Orchestration."""
 
-import contextlib
 import json
-import os
-import signal
 import sys
+from dataclasses import asdict
 from typing import NoReturn
 
 import typer
@@ -13,9 +11,10 @@ from space.cli import argv, output
 from space.cli.errors import error_feedback
 from space.core.models import SpawnStatus
 from space.lib import paths, providers
+from space.lib.format import format_duration
 from space.os.sessions.parsing import parse_jsonl_message
 from space.os.spawn import agents as agents_mod
-from space.os.spawn import launch, spawns
+from space.os.spawn import launch, metrics, spawns
 from space.os.spawn import trace as trace_mod
 from space.os.spawn.formatting import (
     display_agent_trace,
@@ -43,6 +42,7 @@ _SPAWN_COMMANDS = {
     "stop",
     "trace",
     "chain",
+    "daemon",
 }
 
 
@@ -444,11 +444,15 @@ def list_spawns(
     all: bool = typer.Option(
         False, "--all", "-a", help="Show all spawns (including completed/failed)"
     ),
+    show_metrics: bool = typer.Option(
+        False, "--metrics", "-m", help="Show CPU, peak memory, latency and tokens"
+    ),
 ):
     """List spawns (filter by status/identity).
 
     Default: Show pending and running spawns only.
     With --all/-a: Show all spawns including completed/failed/timeout.
+    With --metrics/-m: Add per-spawn resource usage.
     """
     if not all and status is None:
         status = "pending|running"
@@ -477,6 +481,8 @@ def list_spawns(
         else:
             spawns_list = [s for s in all_spawns if s.status == status_filter]
 
+    metrics_by_id = metrics.get_metrics([s.id for s in spawns_list]) if show_metrics else {}
+
     if ctx.obj and ctx.obj.get("json_output"):
         data = [
             {
@@ -487,9 +493,17 @@ def list_spawns(
                 "channel_id": s.channel_id,
                 "created_at": s.created_at,
                 "ended_at": s.ended_at,
+                "priority": s.priority,
+                "queued_at": s.queued_at,
+                "started_at": s.started_at,
+                "queue_wait_seconds": s.queue_wait_seconds,
             }
             for s in spawns_list
         ]
+        if show_metrics:
+            for entry in data:
+                m = metrics_by_id.get(entry["id"])
+                entry["metrics"] = asdict(m) if m else None
         typer.echo(json.dumps(data))
         return
 
@@ -497,14 +511,35 @@ def list_spawns(
         typer.echo("No spawns.")
         return
 
-    typer.echo(f"{'ID':<8} {'Status':<12} {'Created':<20}")
-    typer.echo("-" * 40)
+    header = f"{'ID':<8} {'Status':<12} {'Created':<20} {'Wait':<8}"
+    if show_metrics:
+        header += f" {'CPU':>8} {'RSS':>8} {'Wall':>8} {'First':>7} {'Tokens':>14}"
+    typer.echo(header)
+    typer.echo("-" * len(header))
 
     for spawn_obj in spawns_list:
         spawn_id = spawn_obj.id[:8]
         stat = spawn_obj.status
         created = spawn_obj.created_at[:19] if spawn_obj.created_at else "-"
-        typer.echo(f"{spawn_id:<8} {stat:<12} {created:<20}")
+        wait_s = spawn_obj.queue_wait_seconds
+        wait = format_duration(wait_s) if wait_s is not None else "-"
+        line = f"{spawn_id:<8} {stat:<12} {created:<20} {wait:<8}"
+        if show_metrics:
+            line += " " + _metrics_columns(metrics_by_id.get(spawn_obj.id))
+        typer.echo(line)
+
+
+def _metrics_columns(m) -> str:
+    if not m or not m.runs:
+        return f"{'-':>8} {'-':>8} {'-':>8} {'-':>7} {'-':>14}"
+    cpu = "-"
+    if m.cpu_user_seconds is not None:
+        cpu = f"{m.cpu_user_seconds + m.cpu_system_seconds:.1f}s"
+    rss = f"{m.max_rss_kb / 1024:.0f}M" if m.max_rss_kb is not None else "-"
+    wall = format_duration(m.wall_seconds) if m.wall_seconds is not None else "-"
+    first = f"{m.first_output_seconds:.1f}s" if m.first_output_seconds is not None else "-"
+    tokens = f"{m.input_tokens}/{m.output_tokens}" if m.input_tokens is not None else "-"
+    return f"{cpu:>8} {rss:>8} {wall:>8} {first:>7} {tokens:>14}"
 
 
 @app.command()
@@ -583,11 +618,7 @@ def stop(spawn_id: str):
         typer.echo(f"⚠️ Spawn already {spawn_obj.status}, nothing to stop")
         return
 
-    if spawn_obj.pid:
-        with contextlib.suppress(OSError, ProcessLookupError):
-            os.kill(spawn_obj.pid, signal.SIGTERM)
-
-    spawns.update_status(spawn_id, SpawnStatus.KILLED)
+    spawns.terminate_spawn(spawn_obj.id, SpawnStatus.KILLED)
     typer.echo(f"✓ Spawn {spawn_id[:8]} stopped")
 
 
@@ -604,6 +635,7 @@ def run(
     spawn_id: str | None = typer.Option(
         None, "--spawn-id", help="Existing spawn ID to reuse (for @mention continuity)"
     ),
+    priority: int = typer.Option(0, "--priority", help="Queue priority when at capacity"),
 ):
     """Run spawn directly (used by detached processes)."""
     try:
@@ -614,6 +646,7 @@ def run(
             resume=resume,
             parent_spawn_id=parent_spawn,
             existing_spawn_id=spawn_id,
+            priority=priority,
         )
         typer.echo(f"spawn:{spawn.id}")
     except Exception as e:
@@ -621,6 +654,40 @@ def run(
         raise typer.Exit(1) from e
 
 
+@app.command()
+@error_feedback
+def daemon(
+    show_status: bool = typer.Option(False, "--status", help="Show the running supervisor."),
+):
+    """Run the spawn supervisor (launches @mentions from a warm process)."""
+    import logging
+
+    from space.os.spawn import supervisor
+
+    if show_status:
+        state = supervisor.status()
+        if state is None:
+            typer.echo("No spawn supervisor running")
+            raise typer.Exit(1)
+        typer.echo(
+            f"pid {state['pid']} · up {state['uptime_seconds']}s · "
+            f"{state['launched']} launched · {state['failed']} failed · "
+            f"{len(state['running'])} running"
+        )
+        for child in state["running"]:
+            typer.echo(f"  {child['identity']} · {child['channel_id'] or '-'}")
+        return
+
+    logging.basicConfig(level=logging.INFO)
+    try:
+        supervisor.serve()
+    except RuntimeError as e:
+        typer.echo(f"❌ {e}", err=True)
+        raise typer.Exit(1) from e
+    except KeyboardInterrupt:
+        pass
+
+
 @app.command()
 @error_feedback
 def cleanup():
@@ -5,6 +5,25 @@ import typer
 from space.lib import format as fmt
 
 
+def format_metrics(m: dict) -> str:
+    """One-line resource summary for a spawn's metrics dict."""
+    parts = []
+    if m.get("cpu_user_seconds") is not None:
+        parts.append(f"cpu {m['cpu_user_seconds']:.1f}s user / {m['cpu_system_seconds']:.1f}s sys")
+    if m.get("max_rss_kb") is not None:
+        parts.append(f"max rss {m['max_rss_kb'] / 1024:.0f} MiB")
+    if m.get("wall_seconds") is not None:
+        parts.append(f"wall {m['wall_seconds']:.1f}s")
+    if m.get("first_output_seconds") is not None:
+        parts.append(f"first output {m['first_output_seconds']:.1f}s")
+    if m.get("input_tokens") is not None:
+        parts.append(f"tokens {m['input_tokens']} in / {m['output_tokens']} out")
+    runs = m.get("runs") or 0
+    if runs > 1:
+        parts.append(f"{runs} runs")
+    return ", ".join(parts)
+
+
 def display_agent_trace(result: dict) -> None:
     """Display agent identity trace: recent spawns."""
     typer.echo(f"\nTrace: {result['identity']}\n")
@@ -45,12 +64,20 @@ def display_session_trace(result: dict) -> None:
     if result.get("started_at"):
         typer.echo(f"Started: {fmt.humanize_timestamp(result['started_at'])}")
 
+    if result.get("queue_wait_seconds") is not None:
+        waited = "Queued" if status == "pending" else "Queue wait"
+        priority = result.get("priority") or 0
+        typer.echo(f"{waited}: {result['queue_wait_seconds']:.1f}s (priority {priority})")
+
     if result.get("ended_at"):
         typer.echo(f"Ended: {fmt.humanize_timestamp(result['ended_at'])}")
 
     if result.get("duration_seconds"):
         typer.echo(f"Duration: {result['duration_seconds']:.1f}s")
 
+    if result.get("metrics"):
+        typer.echo(f"Resources: {format_metrics(result['metrics'])}")
+
     if result.get("triggered_by"):
         typer.echo(f"Triggered by: {result['triggered_by']}")
 
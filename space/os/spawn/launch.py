@@ -3,21 +3,24 @@
 import contextlib
 import logging
 import os
+import resource
 import subprocess
-import tempfile
+import time
 from datetime import datetime
 
 from space.lib import paths
 from space.lib.providers import Claude, Codex, Gemini
 from space.os.sessions import resolve_session_id
 
-from . import agents, spawns
+from . import agents, capture, metrics, scheduler, spawns
 from .constitute import constitute
 from .environment import build_launch_env
 from .prompt import build_resume_context, build_spawn_context
 
 logger = logging.getLogger(__name__)
 
+# After the provider exits, how long its pipes may stay open (held by its children).
+DRAIN_TIMEOUT_SECONDS = 5.0
 
 PROVIDERS = {
     "claude": Claude,
@@ -76,6 +79,7 @@ def spawn_ephemeral(
     max_retries: int = 1,
     parent_spawn_id: str | None = None,
     existing_spawn_id: str | None = None,
+    priority: int = 0,
 ):
     """Run agent CLI invocation.
 
@@ -84,8 +88,12 @@ def spawn_ephemeral(
     - Subsequent @mentions: reuse spawn → run CLI → status=active
     - !compact: status=completed, successor created
 
+    When the concurrency caps are reached the spawn is queued instead (status
+    pending) and returned without running; the scheduler launches it later.
+
     Args:
         existing_spawn_id: Reuse this spawn instead of creating new (for @mention continuity)
+        priority: Queue priority if the spawn has to wait (see scheduler)
     """
     from space.os.bridge import channels
 
@@ -126,7 +134,12 @@ def spawn_ephemeral(
         )
         constitute(spawn, agent)
 
-    spawns.update_status(spawn.id, "running")
+    # A spawn the scheduler released from the queue is already running.
+    if spawn.status != "running" and not scheduler.admit(
+        spawn.id, agent, {"instruction": instruction, "resume": resume}, priority
+    ):
+        logger.info(f"Spawn {spawn.id[:8]} for {identity} queued: concurrency cap reached")
+        return spawn
 
     env = build_launch_env()
     env["SPACE_SPAWN_ID"] = spawn.id
@@ -186,8 +199,8 @@ def _run_ephemeral(
             inject_marker=True,
         )
     cmd = _build_spawn_command(agent, session_id, image_paths=image_paths)
-    stdout = _execute_spawn(cmd, context, agent, spawn.id, env)
-    _link_session(spawn, session_id, agent.provider, stdout)
+    streamed_session_id = _execute_spawn(cmd, context, agent, spawn.id, env)
+    _link_session(spawn, session_id, agent.provider, streamed_session_id)
 
 
 def _build_launch_args(agent, is_task: bool, image_paths: list[str] | None = None) -> list[str]:
@@ -228,38 +241,72 @@ def _build_spawn_command(
     return [agent.provider] + launch_args + model_args + add_dir_args + resume_args
 
 
-def _execute_spawn(cmd: list[str], context: str, agent, spawn_id: str, env: dict[str, str]) -> str:
+def _execute_spawn(
+    cmd: list[str], context: str, agent, spawn_id: str, env: dict[str, str]
+) -> str | None:
+    """Run the provider, streaming its output to the spawn log. Returns the streamed session id."""
     spawn_dir = paths.identity_dir(agent.identity)
+    provider_cls = PROVIDERS.get(agent.provider)
+    # Only Codex prints session metadata on stdout; Claude/Gemini write session files only.
+    parser = provider_cls.extract_session_id if agent.provider == "codex" else None
+    output = capture.OutputCapture(capture.log_path(agent.identity, spawn_id), parser)
+
+    started = time.monotonic()
+    proc = subprocess.Popen(
+        cmd,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        cwd=str(spawn_dir),
+        env=env,
+        # Own process group, so a kill reaches the provider's subprocesses too.
+        start_new_session=True,
+    )
+    spawns.set_pid(spawn_id, proc.pid)
+    output.attach(proc.stdout, proc.stderr)
+    try:
+        with contextlib.suppress(BrokenPipeError):
+            proc.stdin.write(context.encode())
+        with contextlib.suppress(BrokenPipeError, OSError):
+            proc.stdin.close()
+        rusage = _reap(proc)
+    finally:
+        output.join(timeout=DRAIN_TIMEOUT_SECONDS)
+    wall = time.monotonic() - started
+    first_output = output.first_output_at - started if output.first_output_at else None
+
+    if proc.returncode is None:
+        logger.warning(f"Exit status of spawn {spawn_id} unknown (reaped elsewhere)")
+    else:
+        try:
+            metrics.record(spawn_id, proc.returncode, wall, first_output, rusage)
+        except Exception as e:
+            logger.warning(f"Failed to record metrics for spawn {spawn_id}: {e}")
 
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".txt", delete=False) as f:
-        f.write(context)
-        context_file = f.name
+    if proc.returncode not in (0, None):
+        raise RuntimeError(f"{agent.provider.title()} spawn failed: {output.tail('stderr')}")
 
-    try:
-        with open(context_file) as stdin_file:
-            proc = subprocess.Popen(
-                cmd,
-                stdin=stdin_file,
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                cwd=str(spawn_dir),
-                env=env,
-            )
-            spawns.set_pid(spawn_id, proc.pid)
-            stdout, stderr = proc.communicate()
+    return output.session_id
 
-        if proc.returncode != 0:
-            raise RuntimeError(f"{agent.provider.title()} spawn failed: {stderr}")
 
-        return stdout
+def _reap(proc: subprocess.Popen) -> resource.struct_rusage | None:
+    """Wait for the provider with wait4, keeping the rusage that Popen.wait() discards.
 
-    finally:
-        with contextlib.suppress(Exception):
-            os.unlink(context_file)
+    If something else already reaped it, the status is known only when that was
+    Popen itself; otherwise `proc.returncode` stays None (unknown).
+    """
+    try:
+        _, status, rusage = os.wait4(proc.pid, 0)
+    except ChildProcessError:
+        # Popen.wait() would turn ECHILD into a returncode of 0, hiding failures.
+        return None
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    return rusage
 
 
-def _link_session(spawn, resumed_session_id: str | None, provider: str, stdout: str = "") -> None:
+def _link_session(
+    spawn, resumed_session_id: str | None, provider: str, streamed_session_id: str | None = None
+) -> None:
     """Link spawn to actual session file created (not resumed-from session).
 
     Claude CLI creates NEW session files even when resuming. We must discover
@@ -277,7 +324,7 @@ def _link_session(spawn, resumed_session_id: str | None, provider: str, stdout:
         session_id = linker.find_session_for_spawn(spawn.id, provider, spawn.created_at, cwd=cwd)
 
         if not session_id:
-            session_id = _extract_session_from_output(provider, stdout)
+            session_id = streamed_session_id
 
         if not session_id:
             session_id = _discover_spawn_session(spawn, provider)
@@ -294,22 +341,6 @@ def _link_session(spawn, resumed_session_id: str | None, provider: str, stdout:
         logger.debug(f"Session linking failed (non-fatal): {e}")
 
 
-def _extract_session_from_output(provider: str, stdout: str) -> str | None:
-    """Extract session ID from Codex CLI JSONL output.
-
-    Only Codex outputs session metadata to stdout.
-    Claude/Gemini write to files only.
-    """
-    if provider != "codex" or not stdout:
-        return None
-
-    provider_cls = PROVIDERS.get(provider)
-    if not provider_cls or not hasattr(provider_cls, "extract_session_id"):
-        return None
-
-    return provider_cls.extract_session_id(stdout)
-
-
 def _discover_spawn_session(spawn, provider: str) -> str | None:
     """Discover session by finding newest file in spawn's project directory.
 
@@ -0,0 +1,88 @@
+"""Spawn resource accounting: CPU, peak memory and latency per provider run.
+
+The launcher reaps each provider with `os.wait4`, which returns the child's
+rusage (it includes descendants the provider itself waited for), and records
+one `spawn_metrics` row per run. Queries sum a spawn's runs and join its
+session for token counts.
+"""
+
+import resource
+import sys
+from collections.abc import Sequence
+from datetime import datetime
+
+from space.core.models import SpawnMetrics
+from space.lib import store
+from space.lib.store import from_row
+
+# ru_maxrss is kilobytes on Linux but bytes on macOS.
+_RSS_DIVISOR = 1024 if sys.platform == "darwin" else 1
+
+
+def record(
+    spawn_id: str,
+    exit_code: int | None,
+    wall_seconds: float,
+    first_output_seconds: float | None,
+    rusage: resource.struct_rusage | None,
+) -> None:
+    with store.write() as conn:
+        conn.execute(
+            """
+            INSERT INTO spawn_metrics (
+                spawn_id, recorded_at, exit_code, wall_seconds, first_output_seconds,
+                cpu_user_seconds, cpu_system_seconds, max_rss_kb
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            (
+                spawn_id,
+                datetime.now().isoformat(),
+                exit_code,
+                wall_seconds,
+                first_output_seconds,
+                rusage.ru_utime if rusage else None,
+                rusage.ru_stime if rusage else None,
+                rusage.ru_maxrss // _RSS_DIVISOR if rusage else None,
+            ),
+        )
+
+
+def _metrics_query(spawn_ids: Sequence[str]) -> tuple[str, list[str]]:
+    placeholders = ", ".join(["?"] * len(spawn_ids))
+    query = f"""
+        SELECT
+            s.id AS spawn_id,
+            COUNT(m.id) AS runs,
+            SUM(m.wall_seconds) AS wall_seconds,
+            AVG(m.first_output_seconds) AS first_output_seconds,
+            SUM(m.cpu_user_seconds) AS cpu_user_seconds,
+            SUM(m.cpu_system_seconds) AS cpu_system_seconds,
+            MAX(m.max_rss_kb) AS max_rss_kb,
+            ses.input_tokens AS input_tokens,
+            ses.output_tokens AS output_tokens
+        FROM spawns s
+        LEFT JOIN spawn_metrics m ON m.spawn_id = s.id
+        LEFT JOIN sessions ses ON ses.session_id = s.session_id
+        WHERE s.id IN ({placeholders})
+        GROUP BY s.id
+    """
+    return query, list(spawn_ids)
+
+
+def get_metrics(spawn_ids: Sequence[str]) -> dict[str, SpawnMetrics]:
+    """Metrics keyed by spawn id (runs=0 for spawns that never ran)."""
+    if not spawn_ids:
+        return {}
+    with store.read() as conn:
+        rows = conn.execute(*_metrics_query(spawn_ids)).fetchall()
+    return {row["spawn_id"]: from_row(row, SpawnMetrics) for row in rows}
+
+
+async def aget_metrics(spawn_ids: Sequence[str]) -> dict[str, SpawnMetrics]:
+    """Async get_metrics() (see store.aio)."""
+    from space.lib.store import aio
+
+    if not spawn_ids:
+        return {}
+    rows = await aio.fetchall(*_metrics_query(spawn_ids))
+    return {row["spawn_id"]: from_row(row, SpawnMetrics) for row in rows}
@@ -7,7 +7,7 @@ def _get_human_identity() -> str:
     """Get current human identity (agent with model=NULL or empty string)."""
     from space.lib import store
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         row = conn.execute(
             "SELECT identity FROM agents WHERE (model IS NULL OR model = '') AND archived_at IS NULL LIMIT 1"
         ).fetchone()
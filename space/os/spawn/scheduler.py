@@ -0,0 +1,214 @@
+"""Spawn admission control: concurrency caps and a priority queue.
+
+Every launch asks `admit()` for a slot before its provider CLI starts. A spawn
+gets one while fewer spawns than each cap are running:
+
+- globally: SPACE_SPAWN_MAX (default 6);
+- per provider: SPACE_SPAWN_MAX_CLAUDE / _CODEX / _GEMINI (default: the global cap);
+- per agent: SPACE_SPAWN_MAX_PER_AGENT (default 2).
+
+Otherwise the spawn waits in the spawns table itself: status 'pending' with its
+launch request stored as JSON, ordered by priority, then by queued_at. Whenever
+a spawn leaves 'running' (see `spawns.update_status`), `release()` starts what
+now fits through the supervisor. The cap check and the status change are a
+single UPDATE on the serialized writer, so two launches never take one slot.
+
+A spawn whose process died without leaving 'running' would hold its slot
+forever, so `reap()` fails such spawns: throttled on every admission, and on
+a timer in the supervisor (`tick()`), which also drains the queue.
+"""
+
+import json
+import logging
+import os
+import time
+from datetime import datetime
+
+from space.core.models import Agent
+from space.lib import store
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_RUNNING = 6
+DEFAULT_MAX_PER_AGENT = 2
+PROVIDERS = ("claude", "codex", "gemini")
+QUEUE_SCAN_LIMIT = 50
+REAP_INTERVAL_SECONDS = 30
+
+PRIORITY_DEFAULT = 0
+PRIORITY_CONTINUATION = 5  # !compact successors: keep running chains moving
+PRIORITY_HUMAN = 10  # someone is waiting on the reply
+
+# Mirrors Agent.provider so caps can be checked inside one statement.
+_PROVIDER_SQL = (
+    "CASE WHEN a.model LIKE 'gpt-%' THEN 'codex' "
+    "WHEN a.model LIKE 'gemini%' THEN 'gemini' ELSE 'claude' END"
+)
+
+_FITS_SQL = f"""
+    (SELECT COUNT(*) FROM spawns WHERE status = 'running') < ?
+    AND (
+        SELECT COUNT(*) FROM spawns s JOIN agents a ON a.agent_id = s.agent_id
+        WHERE s.status = 'running' AND {_PROVIDER_SQL} = ?
+    ) < ?
+    AND (SELECT COUNT(*) FROM spawns WHERE status = 'running' AND agent_id = ?) < ?
+"""
+
+
+def _cap(name: str, default: int) -> int:
+    raw = os.environ.get(name)
+    if raw is None:
+        return default
+    try:
+        return max(int(raw), 1)
+    except ValueError:
+        logger.warning(f"Ignoring {name}={raw!r}: not an integer")
+        return default
+
+
+def limits() -> dict:
+    """Current caps: {"global": n, "per_agent": n, "providers": {provider: n}}."""
+    global_cap = _cap("SPACE_SPAWN_MAX", DEFAULT_MAX_RUNNING)
+    return {
+        "global": global_cap,
+        "per_agent": _cap("SPACE_SPAWN_MAX_PER_AGENT", DEFAULT_MAX_PER_AGENT),
+        "providers": {p: _cap(f"SPACE_SPAWN_MAX_{p.upper()}", global_cap) for p in PROVIDERS},
+    }
+
+
+def _fits_params(agent: Agent, caps: dict) -> tuple:
+    provider = agent.provider or "claude"
+    return (
+        caps["global"],
+        provider,
+        caps["providers"].get(provider, caps["global"]),
+        agent.agent_id,
+        caps["per_agent"],
+    )
+
+
+_last_reap = 0.0
+
+
+def reap(force: bool = False) -> int:
+    """Fail running spawns whose process is gone, at most every REAP_INTERVAL_SECONDS.
+
+    Returns how many were failed; their slots go straight to the queue.
+    """
+    global _last_reap
+    now = time.monotonic()
+    if not force and now - _last_reap < REAP_INTERVAL_SECONDS:
+        return 0
+    _last_reap = now
+
+    from . import spawns
+
+    reaped = spawns.cleanup_orphans()
+    if reaped:
+        logger.info(f"Reaped {reaped} dead spawn(s)")
+    return reaped
+
+
+def tick() -> None:
+    """Reap dead spawns, then start whatever fits. Run periodically by the supervisor."""
+    reap(force=True)
+    release()
+
+
+def admit(spawn_id: str, agent: Agent, request: dict, priority: int = PRIORITY_DEFAULT) -> bool:
+    """Mark a spawn running if a slot is free, else queue it. True if it may start now.
+
+    A newcomer never overtakes a queued spawn of equal or higher priority: it
+    joins the queue and `release()` decides, which still starts it at once if
+    the spawns ahead of it are blocked by their own per-agent or provider cap.
+    """
+    reap()
+    now = datetime.now().isoformat()
+    caps = limits()
+    with store.write() as conn:
+        admitted = conn.execute(
+            f"""
+            UPDATE spawns SET status = 'running', priority = ?, queued_at = ?, started_at = ?,
+                request = NULL
+            WHERE id = ? AND {_FITS_SQL}
+              AND NOT EXISTS (
+                  SELECT 1 FROM spawns
+                  WHERE status = 'pending' AND request IS NOT NULL AND priority >= ? AND id != ?
+              )
+            RETURNING id
+            """,
+            (priority, now, now, spawn_id, *_fits_params(agent, caps), priority, spawn_id),
+        ).fetchone()
+        if admitted:
+            return True
+        conn.execute(
+            "UPDATE spawns SET status = 'pending', priority = ?, queued_at = ?, started_at = NULL, "
+            "request = ? WHERE id = ?",
+            (priority, now, json.dumps(request), spawn_id),
+        )
+
+    # A slot may have been freed between the check and the enqueue.
+    return spawn_id in release(own=spawn_id)
+
+
+def _claim(spawn_id: str, agent: Agent, caps: dict) -> bool:
+    now = datetime.now().isoformat()
+    with store.write() as conn:
+        row = conn.execute(
+            f"""
+            UPDATE spawns SET status = 'running', started_at = ?, request = NULL
+            WHERE id = ? AND status = 'pending' AND request IS NOT NULL AND {_FITS_SQL}
+            RETURNING id
+            """,
+            (now, spawn_id, *_fits_params(agent, caps)),
+        ).fetchone()
+    return row is not None
+
+
+def release(own: str | None = None) -> list[str]:
+    """Start queued spawns that fit under the caps, highest priority and oldest first.
+
+    Claimed spawns are handed to the supervisor, except `own`, which the caller
+    is about to run itself. Returns the ids that were claimed.
+    """
+    from . import agents, supervisor
+
+    with store.read() as conn:
+        queued = conn.execute(
+            """
+            SELECT id, agent_id, channel_id, request FROM spawns
+            WHERE status = 'pending' AND request IS NOT NULL
+            ORDER BY priority DESC, queued_at
+            LIMIT ?
+            """,
+            (QUEUE_SCAN_LIMIT,),
+        ).fetchall()
+    if not queued:
+        return []
+
+    caps = limits()
+    started: list[str] = []
+    for spawn_id, agent_id, channel_id, raw_request in queued:
+        agent = agents.get_agent(agent_id)
+        if not agent or not _claim(spawn_id, agent, caps):
+            continue
+        started.append(spawn_id)
+        if spawn_id == own:
+            continue
+        request = json.loads(raw_request)
+        try:
+            supervisor.submit(
+                agent.identity,
+                request["instruction"],
+                channel_id=channel_id,
+                spawn_id=spawn_id,
+                resume=request.get("resume"),
+            )
+        except Exception as e:
+            logger.error(f"Failed to launch queued spawn {spawn_id[:8]}: {e}")
+            from . import spawns
+
+            spawns.update_status(spawn_id, "failed")
+    if started:
+        logger.info(f"Started {len(started)} queued spawn(s)")
+    return started
@@ -2,16 +2,23 @@
 
 import logging
 from collections.abc import Sequence
-from datetime import datetime
+from datetime import datetime, timedelta
 
 from space.core.models import SPAWN_TERMINAL_STATUSES, Spawn, SpawnStatus
 from space.lib import store
-from space.lib.store import from_row
-from space.lib.uuid7 import uuid7
+from space.lib.store import from_row, from_rows
+from space.lib.uuid7 import prefix_range, uuid7
 
 logger = logging.getLogger(__name__)
 
 MAX_SPAWN_DEPTH = 3
+# Admitted spawns are 'running' before their provider has a pid; give them this long.
+ORPHAN_GRACE_SECONDS = 120
+
+_COLUMNS = (
+    "id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, "
+    "created_at, ended_at, priority, queued_at, started_at"
+)
 
 
 def create_spawn(
@@ -25,7 +32,7 @@ def create_spawn(
     spawn_id = uuid7()
     now = datetime.now().isoformat()
 
-    with store.ensure() as conn:
+    with store.ensure() as conn, store.transaction(conn):
         cursor = conn.cursor()
 
         cursor.execute(
@@ -51,7 +58,7 @@ def create_spawn(
         )
 
         cursor.execute(
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns WHERE id = ?",
+            f"SELECT {_COLUMNS} FROM spawns WHERE id = ?",
             (spawn_id,),
         )
         row = cursor.fetchone()
@@ -69,6 +76,10 @@ def update_status(spawn_id: str, status: str) -> None:
         current = conn.execute("SELECT status FROM spawns WHERE id = ?", (spawn_id,)).fetchone()
         if current and current[0] == SpawnStatus.KILLED.value:
             return
+        # Leaving 'running' frees an admission slot for the queue.
+        freed_slot = (
+            current is not None and current[0] == SpawnStatus.RUNNING.value and status != "running"
+        )
 
         if is_terminal:
             conn.execute(
@@ -81,12 +92,24 @@ def update_status(spawn_id: str, status: str) -> None:
                 (status, spawn_id),
             )
 
+    if freed_slot:
+        _release_queue()
+
     if is_terminal:
         _finalize_session(spawn_id)
     elif status == SpawnStatus.ACTIVE.value or status == SpawnStatus.ACTIVE:
         _sync_current_session(spawn_id)
 
 
+def _release_queue() -> None:
+    try:
+        from . import scheduler
+
+        scheduler.release()
+    except Exception as e:
+        logger.warning(f"Failed to start queued spawns: {e}")
+
+
 def _finalize_session(spawn_id: str) -> None:
     spawn = get_spawn(spawn_id)
     if not spawn or not spawn.session_id:
@@ -131,49 +154,45 @@ def terminate_spawn(spawn_id: str, final_status: str = "completed") -> None:
         update_status(spawn_id, final_status)
 
 
-def kill_spawn(spawn_id: str) -> None:
-    """Kill spawn process with SIGTERM -> SIGKILL escalation."""
-    import os
-    import signal
-    import time
+def terminate_spawns(spawn_ids: Sequence[str], final_status: str = "completed") -> None:
+    """Terminate several spawns at once: running ones are killed together."""
+    running = []
+    for spawn_id in spawn_ids:
+        spawn = get_spawn(spawn_id)
+        if not spawn:
+            continue
+        if spawn.status == SpawnStatus.RUNNING:
+            running.append(spawn)
+        else:
+            update_status(spawn.id, final_status)
+    if running:
+        _kill(running)
 
+
+def kill_spawn(spawn_id: str) -> None:
+    """Kill spawn process group with SIGTERM -> SIGKILL escalation."""
     spawn = get_spawn(spawn_id)
     if not spawn:
         logger.warning(f"Cannot kill spawn {spawn_id}: not found")
         return
+    _kill([spawn])
 
-    if not spawn.pid:
-        logger.warning(f"Cannot kill spawn {spawn_id}: no PID")
-        update_status(spawn_id, "killed")
-        return
-
-    try:
-        os.kill(spawn.pid, signal.SIGTERM)
-    except ProcessLookupError:
-        update_status(spawn_id, "killed")
-        return
-    except OSError as e:
-        logger.error(f"SIGTERM failed for spawn {spawn_id}: {e}")
-        update_status(spawn_id, "killed")
-        return
 
-    for _ in range(10):
-        time.sleep(0.5)
-        try:
-            os.kill(spawn.pid, 0)
-        except ProcessLookupError:
-            update_status(spawn_id, "killed")
-            return
+def _kill(targets: list[Spawn]) -> None:
+    from space.lib import terminate
 
-    try:
-        os.kill(spawn.pid, signal.SIGKILL)
-        logger.info(f"Spawn {spawn_id} required SIGKILL")
-    except ProcessLookupError:
-        pass
-    except OSError as e:
-        logger.error(f"SIGKILL failed for spawn {spawn_id}: {e}")
+    for spawn in targets:
+        if not spawn.pid:
+            logger.warning(f"Cannot kill spawn {spawn.id}: no PID")
 
-    update_status(spawn_id, "killed")
+    outcome = terminate.terminate([s.pid for s in targets if s.pid])
+    for spawn in targets:
+        result = outcome.get(spawn.pid) if spawn.pid else None
+        if result == "killed":
+            logger.info(f"Spawn {spawn.id} required SIGKILL")
+        elif result == "survived":
+            logger.error(f"Spawn {spawn.id} (pid {spawn.pid}) survived SIGKILL")
+        update_status(spawn.id, "killed")
 
 
 SPAWN_TIMEOUT_MINUTES = 10
@@ -181,15 +200,24 @@ STALL_THRESHOLD_MINUTES = 3
 
 
 def cleanup_orphans() -> int:
-    """Mark spawns with dead PIDs as failed. Returns count cleaned."""
+    """Mark spawns with dead PIDs as failed. Returns count cleaned.
+
+    A running spawn without a pid counts as dead only once ORPHAN_GRACE_SECONDS
+    have passed since it was admitted (or created).
+    """
     import os
 
+    cutoff = (datetime.now() - timedelta(seconds=ORPHAN_GRACE_SECONDS)).isoformat()
     cleaned = 0
-    with store.ensure() as conn:
-        rows = conn.execute("SELECT id, pid FROM spawns WHERE status = 'running'").fetchall()
+    with store.read() as conn:
+        rows = conn.execute(
+            "SELECT id, pid, COALESCE(started_at, created_at) FROM spawns WHERE status = 'running'"
+        ).fetchall()
 
-    for spawn_id, pid in rows:
+    for spawn_id, pid, since in rows:
         if pid is None:
+            if since > cutoff:
+                continue
             update_status(spawn_id, "failed")
             cleaned += 1
         else:
@@ -212,7 +240,7 @@ def detect_failures() -> dict[str, list[str]]:
 
     issues: dict[str, list[str]] = {"timeout": [], "stalled": [], "no_session": []}
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
             "SELECT id, pid, session_id, created_at FROM spawns WHERE status = 'running'"
         ).fetchall()
@@ -249,59 +277,80 @@ def link_session_to_spawn(spawn_id: str, session_id: str) -> None:
 
 
 def get_spawn_count(agent_id: str) -> int:
-    with store.ensure() as conn:
+    with store.read() as conn:
         row = conn.execute(
             "SELECT spawn_count FROM agents WHERE agent_id = ?", (agent_id,)
         ).fetchone()
         return row[0] if row else 0
 
 
+def _agent_spawns_query(
+    agent_id: str,
+    limit: int | None,
+    status: str | Sequence[str] | None,
+) -> tuple[str, list[object]]:
+    query = f"SELECT {_COLUMNS} FROM spawns WHERE agent_id = ?"
+    params: list[object] = [agent_id]
+
+    if status:
+        statuses: list[str]
+        if isinstance(status, str):
+            statuses = status.split("|") if "|" in status else [status]
+        else:
+            statuses = list(status)
+
+        placeholders = ", ".join(["?"] * len(statuses))
+        query += f" AND status IN ({placeholders})"
+        params.extend(statuses)
+
+    query += " ORDER BY created_at DESC"
+
+    if limit:
+        query += " LIMIT ?"
+        params.append(limit)
+
+    return query, params
+
+
 def get_spawns_for_agent(
     agent_id: str,
     limit: int | None = None,
     status: str | Sequence[str] | None = None,
 ) -> list[Spawn]:
-    with store.ensure() as conn:
-        query = (
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at "
-            "FROM spawns WHERE agent_id = ?"
-        )
-        params: list[object] = [agent_id]
-
-        if status:
-            statuses: list[str]
-            if isinstance(status, str):
-                statuses = status.split("|") if "|" in status else [status]
-            else:
-                statuses = list(status)
+    with store.read() as conn:
+        rows = conn.execute(*_agent_spawns_query(agent_id, limit, status))
+        return from_rows(rows, Spawn)
 
-            placeholders = ", ".join(["?"] * len(statuses))
-            query += f" AND status IN ({placeholders})"
-            params.extend(statuses)
-
-        query += " ORDER BY created_at DESC"
 
-        if limit:
-            query += " LIMIT ?"
-            params.append(limit)
+async def aget_spawns_for_agent(
+    agent_id: str,
+    limit: int | None = None,
+    status: str | Sequence[str] | None = None,
+) -> list[Spawn]:
+    """Async get_spawns_for_agent() (see store.aio)."""
+    from space.lib.store import aio
 
-        rows = conn.execute(query, params).fetchall()
-        return [from_row(row, Spawn) for row in rows]
+    rows = await aio.fetchall(*_agent_spawns_query(agent_id, limit, status))
+    return [from_row(row, Spawn) for row in rows]
 
 
 def get_spawn(spawn_id: str) -> Spawn | None:
     """Get spawn by full or partial ID. Prefers exact matches, then unique prefix."""
-    with store.ensure() as conn:
+    with store.read() as conn:
         row = conn.execute(
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns WHERE id = ?",
+            f"SELECT {_COLUMNS} FROM spawns WHERE id = ?",
             (spawn_id,),
         ).fetchone()
         if row:
             return from_row(row, Spawn)
+        if not spawn_id:
+            return None
 
+        # Prefix match as a primary-key range scan (LIKE 'x%' cannot use the index).
+        # Ids are lowercase hex; the range is case-sensitive where LIKE was not.
         matches = conn.execute(
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns WHERE id LIKE ?",
-            (f"{spawn_id}%",),
+            f"SELECT {_COLUMNS} FROM spawns WHERE id >= ? AND id < ?",
+            prefix_range(spawn_id.lower()),
         ).fetchall()
         if len(matches) > 1:
             raise ValueError(
@@ -319,11 +368,8 @@ def get_channel_spawns(
     limit: int | None = None,
 ) -> list[Spawn]:
     """Get spawns in channel, optionally filtered by status or agent."""
-    with store.ensure() as conn:
-        query = (
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at "
-            "FROM spawns WHERE channel_id = ?"
-        )
+    with store.read() as conn:
+        query = f"SELECT {_COLUMNS} FROM spawns WHERE channel_id = ?"
         params: list[object] = [channel_id]
 
         if status:
@@ -340,17 +386,25 @@ def get_channel_spawns(
             query += " LIMIT ?"
             params.append(limit)
 
-        rows = conn.execute(query, params).fetchall()
-        return [from_row(row, Spawn) for row in rows]
+        rows = conn.execute(query, params)
+        return from_rows(rows, Spawn)
+
+
+_ALL_SPAWNS_SQL = f"SELECT {_COLUMNS} FROM spawns ORDER BY created_at DESC LIMIT ?"
 
 
 def get_all_spawns(limit: int = 100) -> list[Spawn]:
-    with store.ensure() as conn:
-        rows = conn.execute(
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns ORDER BY created_at DESC LIMIT ?",
-            (limit,),
-        ).fetchall()
-        return [from_row(row, Spawn) for row in rows]
+    with store.read() as conn:
+        rows = conn.execute(_ALL_SPAWNS_SQL, (limit,))
+        return from_rows(rows, Spawn)
+
+
+async def aget_all_spawns(limit: int = 100) -> list[Spawn]:
+    """Async get_all_spawns() (see store.aio)."""
+    from space.lib.store import aio
+
+    rows = await aio.fetchall(_ALL_SPAWNS_SQL, (limit,))
+    return [from_row(row, Spawn) for row in rows]
 
 
 def get_spawn_depth(spawn_id: str) -> int:
@@ -363,7 +417,7 @@ def get_spawn_lineage(spawn_id: str) -> list[str]:
     lineage = [spawn_id]
     current_id = spawn_id
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         while current_id:
             row = conn.execute(
                 "SELECT parent_spawn_id FROM spawns WHERE id = ?", (current_id,)
@@ -380,41 +434,46 @@ def get_spawn_lineage(spawn_id: str) -> list[str]:
 
 def get_spawn_children(spawn_id: str) -> list[Spawn]:
     """Get direct children of a spawn."""
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns WHERE parent_spawn_id = ? ORDER BY created_at ASC",
+            f"SELECT {_COLUMNS} FROM spawns WHERE parent_spawn_id = ? ORDER BY created_at ASC",
             (spawn_id,),
-        ).fetchall()
-        return [from_row(row, Spawn) for row in rows]
+        )
+        return from_rows(rows, Spawn)
 
 
 def get_all_root_spawns(limit: int = 100) -> list[Spawn]:
     """Get spawns with no parent (root spawns)."""
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns WHERE parent_spawn_id IS NULL ORDER BY created_at DESC LIMIT ?",
+            f"SELECT {_COLUMNS} FROM spawns WHERE parent_spawn_id IS NULL ORDER BY created_at DESC LIMIT ?",
             (limit,),
-        ).fetchall()
-        return [from_row(row, Spawn) for row in rows]
+        )
+        return from_rows(rows, Spawn)
 
 
 def get_root_spawns_for_agent(agent_id: str, limit: int = 100) -> list[Spawn]:
     """Get root spawns (no parent) for a specific agent. Efficient WHERE clause filtering."""
-    with store.ensure() as conn:
+    with store.read() as conn:
         rows = conn.execute(
-            "SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at FROM spawns WHERE parent_spawn_id IS NULL AND agent_id = ? ORDER BY created_at DESC LIMIT ?",
+            f"SELECT {_COLUMNS} FROM spawns WHERE parent_spawn_id IS NULL AND agent_id = ? ORDER BY created_at DESC LIMIT ?",
             (agent_id, limit),
-        ).fetchall()
-        return [from_row(row, Spawn) for row in rows]
+        )
+        return from_rows(rows, Spawn)
 
 
 def get_active_spawn_in_channel(agent_id: str, channel_id: str) -> Spawn | None:
-    """Get agent's active or running spawn in channel (for reuse on @mention)."""
-    with store.ensure() as conn:
+    """Get agent's active, running or queued spawn in channel (for reuse on @mention).
+
+    'pending' is also the column default, so only pending rows holding a launch
+    request (queued by the scheduler) count.
+    """
+    with store.read() as conn:
         row = conn.execute(
-            """SELECT id, agent_id, parent_spawn_id, session_id, channel_id, constitution_hash, status, pid, created_at, ended_at
+            f"""SELECT {_COLUMNS}
             FROM spawns
-            WHERE agent_id = ? AND channel_id = ? AND status IN ('active', 'running')
+            WHERE agent_id = ? AND channel_id = ?
+              AND (status IN ('active', 'running') OR (status = 'pending' AND request IS NOT NULL))
             ORDER BY created_at DESC LIMIT 1""",
             (agent_id, channel_id),
         ).fetchone()
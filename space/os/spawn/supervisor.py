@@ -0,0 +1,230 @@
+"""Spawn supervisor: launch agents from one resident, already-imported process.
+
+Without it every @mention, !compact and /compact detaches `spawn run ...`: a
+fresh interpreter that re-imports the whole package before it even starts the
+provider CLI. `spawn daemon` (or the API server) instead listens on
+`~/.space/spawnd.sock`; `submit()` hands it the request as one JSON line and
+the supervisor runs `launch.spawn_ephemeral` on a thread. Provider processes
+are its children and are reaped with waitpid by the thread that started them,
+so nothing re-polls PIDs to learn that a spawn ended.
+
+When no supervisor is listening, `submit()` falls back to the detached
+`spawn run`, so delimiters work the same with or without the daemon.
+"""
+
+import contextlib
+import json
+import logging
+import os
+import socket
+import socketserver
+import threading
+import time
+from pathlib import Path
+
+from space.lib import paths
+from space.lib.detach import detach
+
+logger = logging.getLogger(__name__)
+
+SOCKET_NAME = "spawnd.sock"
+CALL_TIMEOUT_SECONDS = 2.0
+
+
+def socket_path() -> Path:
+    return paths.dot_space() / SOCKET_NAME
+
+
+def _call(payload: dict, path: Path | None = None) -> dict:
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(CALL_TIMEOUT_SECONDS)
+        sock.connect(str(path or socket_path()))
+        sock.sendall(json.dumps(payload).encode() + b"\n")
+        with sock.makefile("rb") as reply:
+            line = reply.readline()
+    if not line:
+        raise ConnectionError("Supervisor closed the connection")
+    return json.loads(line)
+
+
+def status(path: Path | None = None) -> dict | None:
+    """Running supervisor's state, or None if none is listening."""
+    try:
+        return _call({"op": "status"}, path)
+    except (OSError, ValueError):
+        return None
+
+
+def _run_args(request: dict) -> list[str]:
+    args = ["spawn", "run", request["identity"], request["instruction"]]
+    for flag, key in (
+        ("--channel", "channel_id"),
+        ("--spawn-id", "spawn_id"),
+        ("--resume", "resume"),
+        ("--parent-spawn", "parent_spawn_id"),
+    ):
+        if request.get(key):
+            args.extend([flag, request[key]])
+    if request.get("priority"):
+        args.extend(["--priority", str(request["priority"])])
+    return args
+
+
+def submit(
+    identity: str,
+    instruction: str,
+    channel_id: str | None = None,
+    spawn_id: str | None = None,
+    resume: str | None = None,
+    parent_spawn_id: str | None = None,
+    priority: int = 0,
+) -> bool:
+    """Start a spawn on the supervisor, or a detached `spawn run` if there is none.
+
+    Returns True if the supervisor accepted it.
+    """
+    request = {
+        "identity": identity,
+        "instruction": instruction,
+        "channel_id": channel_id,
+        "spawn_id": spawn_id,
+        "resume": resume,
+        # A detached `spawn run` would inherit SPACE_SPAWN_ID; pass it along explicitly.
+        "parent_spawn_id": parent_spawn_id
+        or (None if spawn_id else os.environ.get("SPACE_SPAWN_ID")),
+        "priority": priority,
+    }
+    try:
+        reply = _call({"op": "spawn", **request})
+        if reply.get("ok"):
+            return True
+        logger.warning(f"Supervisor refused spawn for {identity}: {reply.get('error')}")
+    except (OSError, ValueError):
+        pass
+
+    detach(_run_args(request))
+    return False
+
+
+class Supervisor(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix-socket server that runs spawn requests on its own threads."""
+
+    daemon_threads = True
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.started_at = time.time()
+        self.launched = 0
+        self.failed = 0
+        self._running: dict[int, dict] = {}
+        self._lock = threading.Lock()
+        super().__init__(str(path), _Handler)
+
+    def start_spawn(self, request: dict) -> None:
+        thread = threading.Thread(
+            target=self._launch, args=(request,), name=f"spawn-{request['identity']}", daemon=True
+        )
+        thread.start()
+
+    def _launch(self, request: dict) -> None:
+        from . import launch
+
+        key = threading.get_ident()
+        with self._lock:
+            self.launched += 1
+            self._running[key] = {
+                "identity": request["identity"],
+                "channel_id": request.get("channel_id"),
+                "started_at": time.time(),
+            }
+        try:
+            launch.spawn_ephemeral(
+                request["identity"],
+                request["instruction"],
+                channel_id=request.get("channel_id"),
+                resume=request.get("resume"),
+                parent_spawn_id=request.get("parent_spawn_id"),
+                existing_spawn_id=request.get("spawn_id"),
+                priority=request.get("priority") or 0,
+            )
+        except Exception as e:
+            with self._lock:
+                self.failed += 1
+            logger.warning(f"Supervised spawn for {request['identity']} failed: {e}")
+        finally:
+            with self._lock:
+                self._running.pop(key, None)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "pid": os.getpid(),
+                "uptime_seconds": round(time.time() - self.started_at, 1),
+                "launched": self.launched,
+                "failed": self.failed,
+                "running": list(self._running.values()),
+            }
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    server: Supervisor
+
+    def handle(self) -> None:
+        try:
+            request = json.loads(self.rfile.readline())
+            op = request.pop("op", None)
+            if op == "spawn":
+                if not request.get("identity") or not request.get("instruction"):
+                    raise ValueError("identity and instruction are required")
+                self.server.start_spawn(request)
+                reply: dict = {"ok": True}
+            elif op == "status":
+                reply = {"ok": True, **self.server.snapshot()}
+            else:
+                raise ValueError(f"Unknown op: {op}")
+        except (ValueError, KeyError, TypeError) as e:
+            reply = {"ok": False, "error": str(e)}
+        self.wfile.write(json.dumps(reply).encode() + b"\n")
+
+
+def _reap_loop(stop: threading.Event) -> None:
+    """Free slots held by spawns that died without reporting, and drain the queue."""
+    from . import scheduler
+
+    while not stop.wait(scheduler.REAP_INTERVAL_SECONDS):
+        try:
+            scheduler.tick()
+        except Exception as e:
+            logger.warning(f"Spawn reaper failed: {e}")
+
+
+def serve(path: Path | None = None, ready: threading.Event | None = None) -> None:
+    """Run the supervisor until interrupted. Refuses to start beside a live one."""
+    from . import scheduler, spawns
+
+    path = path or socket_path()
+    if path.exists():
+        if status(path) is not None:
+            raise RuntimeError(f"Spawn supervisor already running on {path}")
+        path.unlink()  # stale socket from a supervisor that died
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    cleaned = spawns.cleanup_orphans()
+    if cleaned:
+        logger.info(f"Marked {cleaned} orphaned spawn(s) failed")
+
+    server = Supervisor(path)
+    logger.info(f"Spawn supervisor listening on {path}")
+    stop = threading.Event()
+    threading.Thread(target=_reap_loop, args=(stop,), name="spawn-reaper", daemon=True).start()
+    try:
+        if ready:
+            ready.set()
+        # Spawns queued while nothing was running to release them.
+        scheduler.release()
+        server.serve_forever()
+    finally:
+        stop.set()
+        server.server_close()
+        with contextlib.suppress(OSError):
+            path.unlink()
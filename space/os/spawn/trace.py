@@ -1,9 +1,10 @@
 """Trace API: unified execution introspection and diagnostics."""
 
+from dataclasses import asdict
 from datetime import datetime
 
 from space.os import bridge, spawn
-from space.os.spawn import spawns
+from space.os.spawn import metrics, spawns
 
 
 def trace_agent(identity: str, limit: int = 10) -> dict:
@@ -23,6 +24,7 @@ def trace_agent(identity: str, limit: int = 10) -> dict:
                 "status": spawn_obj.status,
                 "created_at": spawn_obj.created_at,
                 "ended_at": spawn_obj.ended_at,
+                "queue_wait_seconds": spawn_obj.queue_wait_seconds,
             }
         )
 
@@ -110,6 +112,8 @@ def trace_spawn(spawn_id: str) -> dict:
     agent = spawn.get_agent(spawn_obj.agent_id) if spawn_obj.agent_id else None
     identity = agent.identity if agent else "unknown"
 
+    spawn_metrics = metrics.get_metrics([spawn_obj.id]).get(spawn_obj.id)
+
     duration = None
     if spawn_obj.created_at and spawn_obj.ended_at:
         start = datetime.fromisoformat(spawn_obj.created_at)
@@ -126,6 +130,11 @@ def trace_spawn(spawn_id: str) -> dict:
         "ended_at": spawn_obj.ended_at,
         "duration_seconds": duration,
         "channel_id": spawn_obj.channel_id,
+        "priority": spawn_obj.priority,
+        "queued_at": spawn_obj.queued_at,
+        "started_at": spawn_obj.started_at,
+        "queue_wait_seconds": spawn_obj.queue_wait_seconds,
+        "metrics": asdict(spawn_metrics) if spawn_metrics and spawn_metrics.runs else None,
     }
 
 
@@ -4,7 +4,7 @@ from datetime import datetime
 
 from space.core.models import Task
 from space.lib import store
-from space.lib.store import from_row
+from space.lib.store import from_row, from_rows
 from space.lib.uuid7 import resolve_id, uuid7
 from space.os import spawn
 
@@ -37,7 +37,7 @@ def list_tasks(
     limit: int | None = None,
 ) -> list[Task]:
     """List tasks. Default: open + in_progress only."""
-    with store.ensure() as conn:
+    with store.read() as conn:
         base = "SELECT task_id, creator_id, agent_id, content, project, status, created_at, started_at, completed_at FROM tasks WHERE"
 
         conditions = []
@@ -64,7 +64,7 @@ def list_tasks(
             query += " LIMIT ?"
             params.append(limit)
 
-        return [_row_to_task(row) for row in conn.execute(query, params).fetchall()]
+        return from_rows(conn.execute(query, params), Task)
 
 
 def get_task(task_id: str) -> Task | None:
@@ -73,7 +73,7 @@ def get_task(task_id: str) -> Task | None:
     except ValueError:
         return None
 
-    with store.ensure() as conn:
+    with store.read() as conn:
         row = conn.execute(
             "SELECT task_id, creator_id, agent_id, content, project, status, created_at, started_at, completed_at FROM tasks WHERE task_id = ?",
             (full_id,),
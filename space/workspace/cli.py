@@ -57,11 +57,58 @@ stats_app = typer.Typer(invoke_without_command=True)
 
 
 @stats_app.callback(invoke_without_command=True)
-def stats_callback(ctx: typer.Context):
-    if ctx.invoked_subcommand is None:
+def stats_callback(
+    ctx: typer.Context,
+    queries: bool = typer.Option(
+        False, "--queries", help="Show traced query latency by call site (SPACE_DB_TRACE=1)."
+    ),
+    limit: int = typer.Option(20, "--limit", "-n", help="Max call sites in --queries report."),
+    reset: bool = typer.Option(False, "--reset", help="Clear recorded query stats and slow log."),
+):
+    if ctx.invoked_subcommand is not None:
+        return
+    if reset:
+        stats.reset_query_stats()
+        typer.echo("Query stats cleared")
+    elif queries:
+        _show_queries(ctx, limit)
+    else:
         _show_overview(ctx)
 
 
+def _show_queries(ctx: typer.Context, limit: int):
+    """Show traced query latency per call site and the slow-query log."""
+    report = stats.query_stats(limit=limit)
+
+    from space.cli import output
+
+    if output.echo_json(report, ctx):
+        return
+
+    if not report["queries"]:
+        hint = "" if report["tracing"] else " · set SPACE_DB_TRACE=1 to record"
+        typer.echo(f"No traced queries{hint}")
+        return
+
+    lines = ["queries · calls · total · mean · p95 · max · rows"]
+    for q in report["queries"]:
+        lines.append(
+            f"  {q['caller']} · {q['calls']} · {q['total_ms']:.1f}ms · {q['mean_ms']:.2f}ms"
+            f" · {q['p95_ms']:.1f}ms · {q['max_ms']:.1f}ms · {q['rows']}"
+        )
+        lines.append(f"    {q['shape'][:160]}")
+
+    if report["slow"]:
+        lines.append("\nslow")
+        for s in report["slow"]:
+            lines.append(f"  {s['ms']:.1f}ms · {s['caller']}")
+            lines.append(f"    {s['sql'][:160]}")
+            for step in s.get("plan") or []:
+                lines.append(f"      {step}")
+
+    typer.echo("\n".join(lines) + "\n")
+
+
 def _show_overview(ctx: typer.Context):
     """Show space overview."""
     s = stats.collect(agent_limit=10)
@@ -102,6 +149,11 @@ overview"""
         lines.append(
             f"  bridge · {s.bridge.active_channels} active · {s.bridge.archived_channels} archived · {s.bridge.active} msgs ({s.bridge.archived} archived)"
         )
+        if s.bridge.outbox_pending or s.bridge.outbox_dead:
+            lines.append(
+                f"  outbox · {s.bridge.outbox_pending} pending · {s.bridge.outbox_dead} dead"
+                f" · lag {s.bridge.outbox_lag_seconds:.1f}s"
+            )
 
     if s.memory.available and s.memory.total > 0:
         archived = s.memory.total - s.memory.active
@@ -139,16 +191,89 @@ overview"""
 
 health_app = typer.Typer()
 
+_QUICK = typer.Option(False, "--quick", help="Re-run the fast tier now.")
+_DEEP = typer.Option(False, "--deep", help="Advance the deep tier (resumes where it stopped).")
+_BUDGET = typer.Option(health.DEEP_BUDGET_S, "--budget", help="Seconds the deep tier may run.")
+_FULL = typer.Option(False, "--full", help="Run every check to completion (slow on large DBs).")
+
 
 @health_app.callback(invoke_without_command=True)
-def health_callback(ctx: typer.Context):
+def health_callback(
+    ctx: typer.Context,
+    quick: bool = _QUICK,
+    deep: bool = _DEEP,
+    budget: float = _BUDGET,
+    full: bool = _FULL,
+):
     if ctx.invoked_subcommand is None:
-        ctx.invoke(health_cmd)
+        ctx.invoke(health_cmd, ctx, quick=quick, deep=deep, budget=budget, full=full)
 
 
 @health_app.command()
-def health_cmd(ctx: typer.Context):
-    """Verify space-os lattice integrity."""
+def health_cmd(
+    ctx: typer.Context,
+    quick: bool = _QUICK,
+    deep: bool = _DEEP,
+    budget: float = _BUDGET,
+    full: bool = _FULL,
+):
+    """Verify space-os lattice integrity.
+
+    By default shows the last stored results (running the fast tier if there are none).
+    """
+    from space.cli import output
+    from space.lib import store
+
+    if full:
+        _health_full(ctx)
+        return
+
+    if not store.database_exists():
+        _report_issues(ctx, [f"❌ {health.DB_NAME} missing"])
+
+    state = health.load_state()
+    if quick or "quick" not in state:
+        health.run_quick()
+    if deep:
+        health.run_deep(budget_s=budget)
+    report = health.summary(health.load_state())
+
+    if output.is_json_mode(ctx):
+        typer.echo(output.out_json(report))
+        if not report["ok"]:
+            raise typer.Exit(1)
+        return
+
+    from space.lib.format import format_duration
+
+    for tbl, cnt in report["counts"].items():
+        typer.echo(f"✓ {health.DB_NAME}::{tbl} (~{cnt if cnt is not None else '?'} rows)")
+    for warning in report["warnings"]:
+        typer.echo(warning)
+
+    checked = report["deep"]
+    deep_line = f"deep: {checked['checked']}/{checked['total']} tables"
+    if checked["completed_age_s"] is not None:
+        deep_line += f", last full pass {format_duration(checked['completed_age_s'])} ago"
+    typer.echo(f"\nquick: checked {format_duration(report['quick_age_s'])} ago · {deep_line}")
+
+    if report["issues"]:
+        _report_issues(ctx, report["issues"])
+    typer.echo("✓ Space infrastructure healthy")
+
+
+def _report_issues(ctx: typer.Context, issues: list[str]):
+    from space.cli import output
+
+    if output.is_json_mode(ctx):
+        typer.echo(output.out_json({"ok": False, "issues": issues}))
+    else:
+        for issue in issues:
+            typer.echo(issue)
+    raise typer.Exit(1)
+
+
+def _health_full(ctx: typer.Context):
     issues, counts_by_db = health.run_all_checks()
 
     from space.cli import output
@@ -176,6 +301,116 @@ def health_cmd(ctx: typer.Context):
     typer.echo("\n✓ Space infrastructure healthy")
 
 
+db_app = typer.Typer()
+
+
+@db_app.command(name="archive")
+def db_archive_cmd(
+    ctx: typer.Context,
+    older_than: int = typer.Option(90, "--older-than", help="Move rows older than N days."),
+    batch: int = typer.Option(5000, "--batch", help="Rows moved per write transaction."),
+    keep_archived_channels: bool = typer.Option(
+        False, "--keep-archived-channels", help="Only move archived channels' messages by age."
+    ),
+):
+    """Move old messages and transcripts into the cold archive database."""
+    from space.cli import output
+    from space.lib.store import archive
+
+    quiet = output.is_json_mode(ctx) or output.is_quiet_mode(ctx)
+
+    def on_batch(table: str, moved: int) -> None:
+        if not quiet:
+            typer.echo(f"  {table}: +{moved}")
+
+    moved = archive.move(
+        older_than,
+        batch_size=batch,
+        archived_channels=not keep_archived_channels,
+        on_batch=on_batch,
+    )
+
+    if output.is_json_mode(ctx):
+        typer.echo(output.out_json({"moved": moved, "archive": archive.stats()}))
+        return
+    totals = archive.stats()
+    for table, count in moved.items():
+        typer.echo(f"✓ {table}: moved {count} ({totals.get(table, 0)} archived)")
+
+
+_MAINTAIN_TASKS = typer.Option(
+    None, "--task", "-t", help="checkpoint, fts, optimize or vacuum (repeatable)."
+)
+
+
+@db_app.command(name="maintain")
+def db_maintain_cmd(
+    ctx: typer.Context,
+    task: list[str] = _MAINTAIN_TASKS,
+    budget: float = typer.Option(None, "--budget", help="Seconds per task (default: schedule)."),
+    status: bool = typer.Option(False, "--status", help="Show last-run stats without running."),
+):
+    """Run database maintenance now (the API server also runs it on a schedule)."""
+    import time
+
+    from space.cli import output
+    from space.lib.format import format_duration
+    from space.lib.store import maintenance
+
+    if status:
+        results = maintenance.load_state()
+    else:
+        names = task or list(maintenance.TASKS)
+        unknown = [n for n in names if n not in maintenance.TASKS]
+        if unknown:
+            typer.echo(f"Unknown task(s): {', '.join(unknown)}", err=True)
+            raise typer.Exit(1)
+        results = {name: maintenance.run_task(name, budget) for name in names}
+
+    if output.is_json_mode(ctx):
+        typer.echo(output.out_json(results))
+        return
+    if not results:
+        typer.echo("No maintenance has run yet. Run: space db maintain")
+        return
+    for name, result in results.items():
+        age = format_duration(time.time() - result["at"])
+        mark = "✓" if result.get("ok") else "❌"
+        detail = " · ".join(
+            f"{k}={v}"
+            for k, v in result.items()
+            if k not in ("ok", "at", "elapsed_ms", "last_optimize_at")
+        )
+        typer.echo(f"{mark} {name} · {result['elapsed_ms']}ms · {age} ago · {detail}")
+
+
+@db_app.command(name="tune")
+def db_tune_cmd(
+    ctx: typer.Context,
+    rounds: int = typer.Option(5, "--rounds", help="Timed repetitions per profile."),
+    writes: int = typer.Option(200, "--writes", help="Committed inserts per write round."),
+):
+    """Benchmark SQLite PRAGMA profiles on a copy of space.db."""
+    from space.cli import output
+    from space.lib.store import sqlite, tune
+
+    report = tune.run(rounds=rounds, writes=writes)
+
+    if output.is_json_mode(ctx):
+        typer.echo(output.out_json(report))
+        return
+
+    typer.echo(f"space.db copy: {report['db_bytes'] / 1024 / 1024:.1f} MiB, {rounds} rounds")
+    typer.echo(f"{'PROFILE':<14} {'READ ms':>10} {'WRITE ms':>10}")
+    for name, timing in report["profiles"].items():
+        typer.echo(f"{name:<14} {timing['read_ms']:>10.2f} {timing['write_ms']:>10.2f}")
+    typer.echo(f"\nFastest reads: {report['best_read']}, fastest writes: {report['best_write']}")
+    typer.echo(
+        f"Current: SPACE_DB_PROFILE={sqlite.profile_name()}, "
+        f"SPACE_DB_READ_PROFILE={sqlite.profile_name(query_only=True)}"
+    )
+
+
 identity_app = typer.Typer()
 
 
@@ -233,8 +468,10 @@ def identity_get_cmd():
 app.add_typer(identity_app, name="identity", help="Manage your human identity.")
 app.add_typer(init_app, name="init", help="Initialize space workspace structure and databases.")
 app.add_typer(backup.app, name="backup", help="Backup and restore space data.")
+app.command(name="restore", help="Restore space data from a backup archive.")(backup.restore)
 app.add_typer(stats_app, name="stats", help="Show space overview and agent statistics.")
 app.add_typer(health_app, name="health", help="Verify space-os lattice integrity.")
+app.add_typer(db_app, name="db", help="Database maintenance.")
 
 
 def main() -> None:
@@ -1,13 +1,21 @@
 from __future__ import annotations
 
+import json
 import logging
 import sqlite3
+import time
+from pathlib import Path
+from typing import Any
 
 from space.lib import store
 
 logger = logging.getLogger(__name__)
 
 DB_NAME = "space.db"
+STATE_FILE = "health.json"
+QUICK_CHECK_MAX_ERRORS = 100
+WAL_WARN_BYTES = 64 * 1024 * 1024
+DEEP_BUDGET_S = 30.0
 EXPECTED_TABLES = {
     "agents",
     "sessions",
@@ -42,7 +50,7 @@ def check_db() -> tuple[bool, list[str], dict[str, int]]:
         return False, issues, counts
 
     try:
-        with store.ensure() as conn:
+        with store.read() as conn:
             actual_tables = {
                 row[0] for row in conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
             }
@@ -67,6 +75,193 @@ def check_db() -> tuple[bool, list[str], dict[str, int]]:
     return not issues, issues, counts
 
 
+def _db_path() -> Path:
+    return store.pool().db_path
+
+
+def _state_path() -> Path:
+    return _db_path().parent / STATE_FILE
+
+
+def load_state() -> dict[str, Any]:
+    """Last persisted quick/deep results (empty if none)."""
+    path = _state_path()
+    if not path.exists():
+        return {}
+    try:
+        return json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_state(state: dict[str, Any]) -> None:
+    path = _state_path()
+    tmp = path.with_suffix(".tmp")
+    tmp.write_text(json.dumps(state, indent=2))
+    tmp.replace(path)
+
+
+def _user_tables(conn: sqlite3.Connection) -> list[str]:
+    """Ordinary tables (including FTS shadow tables), excluding virtual tables."""
+    return [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'table' "
+            "AND name NOT LIKE 'sqlite_%' AND sql NOT LIKE 'CREATE VIRTUAL%' ORDER BY name"
+        )
+    ]
+
+
+def approximate_counts(conn: sqlite3.Connection, tables: list[str]) -> dict[str, int | None]:
+    """Row counts without scanning: sqlite_stat1 when ANALYZE has run, else MAX(rowid)."""
+    counts: dict[str, int | None] = {}
+    has_stat1 = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'sqlite_stat1'"
+    ).fetchone()
+    if has_stat1:
+        for tbl, stat in conn.execute("SELECT tbl, stat FROM sqlite_stat1"):
+            if tbl in tables and stat:
+                counts[tbl] = max(counts.get(tbl) or 0, int(stat.split()[0]))
+    for table in tables:
+        if table in counts:
+            continue
+        try:
+            counts[table] = conn.execute(f'SELECT MAX(rowid) FROM "{table}"').fetchone()[0] or 0
+        except sqlite3.OperationalError:  # WITHOUT ROWID
+            counts[table] = None
+    return counts
+
+
+def wal_size(db_path: Path) -> int:
+    wal = db_path.with_name(db_path.name + "-wal")
+    return wal.stat().st_size if wal.exists() else 0
+
+
+def run_quick(max_errors: int = QUICK_CHECK_MAX_ERRORS) -> dict[str, Any]:
+    """Fast tier: quick_check(N), approximate counts, WAL size. Persisted as state['quick']."""
+    started = time.perf_counter()
+    result: dict[str, Any] = {"at": time.time(), "issues": [], "warnings": [], "counts": {}}
+
+    if not store.database_exists():
+        result["issues"].append(f"❌ {DB_NAME} missing")
+    else:
+        try:
+            with store.read() as conn:
+                actual = set(_user_tables(conn))
+                missing = EXPECTED_TABLES - actual
+                if missing:
+                    result["issues"].append(f"❌ {DB_NAME}: missing tables {sorted(missing)}")
+
+                problems = [
+                    row[0] for row in conn.execute(f"PRAGMA quick_check({int(max_errors)})")
+                ]
+                if problems != ["ok"]:
+                    result["issues"].extend(f"❌ {DB_NAME}: quick_check={p}" for p in problems)
+
+                result["counts"] = approximate_counts(conn, sorted(EXPECTED_TABLES & actual))
+        except sqlite3.Error as exc:
+            result["issues"].append(f"❌ {DB_NAME}: {exc}")
+
+        result["wal_bytes"] = wal_size(_db_path())
+        if result["wal_bytes"] > WAL_WARN_BYTES:
+            result["warnings"].append(
+                f"⚠️ {DB_NAME}-wal is {result['wal_bytes'] // (1024 * 1024)} MiB "
+                "(checkpoints are falling behind)"
+            )
+
+    result["ok"] = not result["issues"]
+    result["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    if store.database_exists():
+        state = load_state()
+        state["quick"] = result
+        _save_state(state)
+    return result
+
+
+def _check_table(conn: sqlite3.Connection, table: str) -> dict[str, Any]:
+    issues = [
+        f"❌ {table}: integrity_check={row[0]}"
+        for row in conn.execute(f'PRAGMA integrity_check("{table}")')
+        if row[0] != "ok"
+    ]
+    for row in conn.execute(f'PRAGMA foreign_key_check("{table}")'):
+        issues.append(f"❌ {row['table']} row {row['rowid']} violates FK to {row['parent']}")
+    count = conn.execute(f'SELECT COUNT(*) FROM "{table}"').fetchone()[0]
+    return {"at": time.time(), "ok": not issues, "issues": issues, "count": count}
+
+
+def run_deep(budget_s: float | None = DEEP_BUDGET_S, restart: bool = False) -> dict[str, Any]:
+    """Deep tier: full integrity, FK and COUNT(*) per table, resumable.
+
+    Checks tables one at a time until `budget_s` runs out, persisting progress after
+    each, so a multi-GB database is covered across several runs. A pass that
+    completes starts over on the next call; its results stay under "last" until
+    the new pass completes.
+    """
+    if not store.database_exists():
+        return {}
+    state = load_state()
+    deep = state.get("deep") or {}
+    if restart or not deep.get("pending"):
+        last = deep.get("last")
+        if deep.get("completed_at"):
+            last = {"completed_at": deep["completed_at"], "tables": deep["tables"]}
+        with store.read() as conn:
+            deep = {"started_at": time.time(), "completed_at": None, "tables": {}}
+            deep["pending"] = _user_tables(conn)
+        if last:
+            deep["last"] = last
+
+    deadline = None if budget_s is None else time.monotonic() + budget_s
+    with store.read() as conn:
+        while deep["pending"]:
+            if deadline is not None and time.monotonic() >= deadline:
+                break
+            table = deep["pending"].pop(0)
+            try:
+                deep["tables"][table] = _check_table(conn, table)
+            except sqlite3.Error as exc:
+                deep["tables"][table] = {"at": time.time(), "ok": False, "issues": [str(exc)]}
+            state["deep"] = deep
+            _save_state(state)
+
+    if not deep["pending"] and deep["completed_at"] is None:
+        deep["completed_at"] = time.time()
+    state["deep"] = deep
+    _save_state(state)
+    return deep
+
+
+def summary(state: dict[str, Any]) -> dict[str, Any]:
+    """Merge persisted quick and deep results into one report with their ages.
+
+    While a deep pass is in progress, tables it has not reached yet report their
+    result from the last completed pass.
+    """
+    now = time.time()
+    quick = state.get("quick") or {}
+    deep = state.get("deep") or {}
+    tables = deep.get("tables", {})
+    last = deep.get("last") or {}
+    completed_at = deep.get("completed_at") or last.get("completed_at")
+    issues = list(quick.get("issues", []))
+    for result in {**last.get("tables", {}), **tables}.values():
+        issues.extend(result.get("issues", []))
+    return {
+        "ok": not issues,
+        "issues": issues,
+        "warnings": quick.get("warnings", []),
+        "counts": quick.get("counts", {}),
+        "wal_bytes": quick.get("wal_bytes"),
+        "quick_age_s": now - quick["at"] if quick else None,
+        "deep": {
+            "checked": len(tables),
+            "total": len(tables) + len(deep.get("pending", [])),
+            "completed_age_s": now - completed_at if completed_at else None,
+        },
+    }
+
+
 def run_all_checks() -> tuple[list[str], dict[str, dict[str, int]]]:
     """Run health checks for consumers expecting legacy signature."""
     ok, issues, counts = check_db()
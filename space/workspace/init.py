@@ -178,7 +178,7 @@ def init():
     typer.echo()
     typer.echo("  ~/.space_backups/")
     typer.echo("    ├── data/                   → timestamped snapshots")
-    typer.echo("    └── sessions/               → latest backup")
+    typer.echo("    └── sessions/               → hardlinked snapshots (latest/)")
 
     typer.echo()
     typer.echo("Next steps:")
@@ -79,6 +79,11 @@ def _get_bridge_stats() -> dict:
             "SELECT agent_id, COUNT(*) FROM messages GROUP BY agent_id ORDER BY COUNT(*) DESC"
         ).fetchall()
 
+    try:
+        queue = bridge.outbox.stats()
+    except Exception:
+        queue = {}
+
     total_events, events_by_agent = 0, []
     try:
         with store.ensure("events") as conn:
@@ -102,6 +107,7 @@ def _get_bridge_stats() -> dict:
             "archived": archived_channels,
         },
         "events": {"total": total_events, "by_agent": events_by_agent},
+        "outbox": queue,
     }
 
 
@@ -140,6 +146,7 @@ def bridge_stats() -> BridgeStats:
 
     msg_data = stats_data.get("messages", {})
     channels_data = stats_data.get("channels", {})
+    outbox_data = stats_data.get("outbox", {})
 
     return BridgeStats(
         available=True,
@@ -149,6 +156,9 @@ def bridge_stats() -> BridgeStats:
         channels=channels_data.get("total", 0),
         active_channels=channels_data.get("active", 0),
         archived_channels=channels_data.get("archived", 0),
+        outbox_pending=outbox_data.get("pending", 0),
+        outbox_dead=outbox_data.get("dead", 0),
+        outbox_lag_seconds=outbox_data.get("lag_seconds", 0.0),
     )
 
 
@@ -277,3 +287,34 @@ def collect(agent_limit: int = None) -> SpaceStats:
         sessions=session_stats(),
         agents=agent_stats(limit=agent_limit),
     )
+
+
+def query_stats(limit: int | None = 20, slow_limit: int = 10) -> dict:
+    """Traced query report: hottest call sites by total time plus recent slow queries.
+
+    Populated only while SPACE_DB_TRACE is set (see store.trace).
+    """
+    from space.lib.store import trace
+
+    trace.tracer().flush()
+    db_dir = store.pool().db_path.parent
+
+    queries = sorted(trace.load(db_dir), key=lambda q: q["total_ms"], reverse=True)
+    for q in queries:
+        q["mean_ms"] = q["total_ms"] / q["calls"] if q["calls"] else 0.0
+        q["p50_ms"] = trace.percentile(q, 50)
+        q["p95_ms"] = trace.percentile(q, 95)
+
+    return {
+        "tracing": trace.enabled(),
+        "buckets_ms": list(trace.BUCKETS_MS),
+        "queries": queries[:limit] if limit else queries,
+        "slow": trace.load_slow(db_dir, slow_limit),
+    }
+
+
+def reset_query_stats() -> None:
+    from space.lib.store import trace
+
+    trace.tracer().flush()
+    trace.reset(store.pool().db_path.parent)
@@ -65,9 +65,15 @@ def populated_space(test_space):
 def mock_db():
     """Mock db.ensure context manager for unit tests."""
     mock_conn = MagicMock()
-    with patch("space.lib.store.ensure") as mock_ensure:
+    with (
+        patch("space.lib.store.ensure") as mock_ensure,
+        patch("space.lib.store.read", mock_ensure),
+        patch("space.lib.store.write", mock_ensure),
+        patch("space.lib.store.write_batched") as batched,
+    ):
         mock_ensure.return_value.__enter__.return_value = mock_conn
         mock_ensure.return_value.__exit__.return_value = None
+        batched.side_effect = lambda job: job(mock_conn)
         yield mock_conn
 
 
@@ -0,0 +1,32 @@
+"""SSE message stream."""
+
+import json
+
+import pytest
+
+from space.api.channels import stream_channel_messages
+from space.os.bridge import channels, messaging
+from space.os.spawn import agents
+
+
+async def _next_content(stream) -> str:
+    event = await anext(stream)
+    return json.loads(event.removeprefix("data: "))["content"]
+
+
+@pytest.mark.asyncio
+async def test_stream_resumes_after_cursor_deleted_and_ends_with_channel(test_space):
+    agents.register_agent("alice", "claude-haiku-4-5", None)
+    channel = channels.create_channel("live")
+    await messaging.send_message(channel.channel_id, "alice", "one")
+    cursor = await messaging.send_message(channel.channel_id, "alice", "two")
+    stream = stream_channel_messages(channel.channel_id)
+    assert [await _next_content(stream), await _next_content(stream)] == ["one", "two"]
+
+    messaging.delete_message(cursor)
+    await messaging.send_message(channel.channel_id, "alice", "three")
+    assert await _next_content(stream) == "three"  # no replay of "one"
+
+    channels.delete_channel("live")
+    with pytest.raises(StopAsyncIteration):
+        await anext(stream)
@@ -0,0 +1,96 @@
+"""Tests for space.lib.store async access."""
+
+import asyncio
+import sqlite3
+import threading
+
+import pytest
+
+from space.lib import store
+from space.lib.store import aio
+from space.os.bridge import channels, messaging
+from space.os.spawn import agents, spawns
+
+
+@pytest.mark.asyncio
+async def test_read_connection_is_query_only(test_space):
+    async with aio.read() as conn:
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            await conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c', 'c')")
+
+
+@pytest.mark.asyncio
+async def test_write_goes_through_shared_writer(test_space):
+    await aio.write(
+        lambda conn: conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c-1', 'one')")
+    )
+
+    row = await aio.fetchone("SELECT name FROM channels WHERE channel_id = ?", ("c-1",))
+    assert row["name"] == "one"
+
+
+@pytest.mark.asyncio
+async def test_reads_do_not_block_event_loop(test_space):
+    ticks = 0
+
+    async def heartbeat():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    slow = """
+        WITH RECURSIVE n(i) AS (SELECT 1 UNION ALL SELECT i + 1 FROM n WHERE i < 300000)
+        SELECT COUNT(*) FROM n
+    """
+    beat = asyncio.create_task(heartbeat())
+    rows = await asyncio.gather(*(aio.fetchall(slow) for _ in range(4)))
+    beat.cancel()
+
+    assert all(r[0][0] == 300000 for r in rows)
+    assert ticks > 10
+
+
+@pytest.mark.asyncio
+async def test_async_hot_paths_match_sync(test_space):
+    agents.register_agent("alice", "claude-haiku-4-5", None)
+    channel = channels.create_channel("general", "chat")
+    await messaging.send_message(channel.channel_id, "alice", "hello")
+    spawns.create_spawn(agents.get_agent("alice").agent_id)
+
+    assert await channels.alist_channels() == channels.list_channels()
+    assert await channels.aget_channel("general") == channels.get_channel("general")
+    assert await messaging.aget_messages("general") == messaging.get_messages("general")
+    assert await spawns.aget_all_spawns() == spawns.get_all_spawns()
+    alice = agents.get_agent("alice").agent_id
+    assert await spawns.aget_spawns_for_agent(alice) == spawns.get_spawns_for_agent(alice)
+
+
+@pytest.mark.asyncio
+async def test_pool_is_rebuilt_after_close_all(test_space):
+    first = await aio.pool()
+    store.close_all()
+    assert await aio.pool() is not first
+
+
+@pytest.mark.asyncio
+async def test_aget_messages_pages(test_space):
+    agents.register_agent("alice", "claude-haiku-4-5", None)
+    channel = channels.create_channel("paged")
+    for n in range(5):
+        await messaging.send_message(channel.channel_id, "alice", f"m{n}")
+    ids = [m.message_id for m in messaging.get_messages("paged")]
+
+    newest = await messaging.aget_messages("paged", limit=2)
+    older = await messaging.aget_messages("paged", before=ids[3], limit=2)
+    after = await messaging.aget_messages("paged", after=ids[2])
+
+    assert [m.content for m in newest] == ["m3", "m4"]
+    assert [m.content for m in older] == ["m1", "m2"]
+    assert [m.message_id for m in after] == ids[3:]
+
+
+def test_reader_threads_are_daemons(tmp_path):
+    conn = aio._Connection(tmp_path / "x.db")
+    thread = conn if isinstance(conn, threading.Thread) else conn._thread
+    assert thread.daemon
@@ -0,0 +1,107 @@
+from datetime import datetime, timedelta
+
+from space.lib import store
+from space.lib.store import archive
+from space.os import bridge, sessions, spawn
+from space.os.bridge import messaging
+
+
+def _days_ago(days: int) -> str:
+    return (datetime.now() - timedelta(days=days)).isoformat()
+
+
+def _seed(channel_id: str, agent_id: str) -> None:
+    with store.write() as conn:
+        conn.executemany(
+            "INSERT INTO messages (message_id, channel_id, agent_id, content, created_at) "
+            "VALUES (?, ?, ?, ?, ?)",
+            [
+                ("m-old-1", channel_id, agent_id, "ancient deploy notes", _days_ago(200)),
+                ("m-old-2", channel_id, agent_id, "ancient rollback", _days_ago(150)),
+                ("m-new", channel_id, agent_id, "fresh deploy notes", _days_ago(1)),
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO sessions (session_id, provider, model, last_message_at) VALUES (?, ?, ?, ?)",
+            [
+                ("s-old", "claude", "opus", _days_ago(120)),
+                ("s-new", "claude", "opus", _days_ago(2)),
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO transcripts "
+            "(session_id, message_index, provider, type, identity, content, timestamp) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                ("s-old", 0, "claude", "user", None, "legacy kestrel rollout", 1),
+                ("s-old", 1, "claude", "assistant", None, "kestrel done", 2),
+                ("s-new", 0, "claude", "user", None, "kestrel again", 3),
+            ],
+        )
+
+
+def test_move_splits_tiers_and_reads_opt_in(test_space):
+    spawn.register_agent("alice", "claude-haiku-4-5", None)
+    agent_id = spawn.get_agent("alice").agent_id
+    channel = bridge.create_channel("ops")
+    _seed(channel.channel_id, agent_id)
+
+    batches = []
+    moved = archive.move(90, batch_size=1, on_batch=lambda table, n: batches.append(table))
+
+    assert moved == {"messages": 2, "transcripts": 2}
+    assert batches == ["messages", "messages", "transcripts", "transcripts"]
+    assert archive.stats() == {"messages": 2, "transcripts": 2}
+
+    hot = [m.message_id for m in bridge.get_messages(channel.channel_id)]
+    assert hot == ["m-new"]
+    both = bridge.get_messages(channel.channel_id, include_archive=True)
+    assert [m.message_id for m in both] == ["m-old-1", "m-old-2", "m-new"]
+
+    assert len(bridge.search("deploy")) == 1
+    assert len(bridge.search("deploy", include_archive=True)) == 2
+
+    assert {r["session_id"] for r in sessions.search("kestrel")} == {"s-new"}
+    archived = sessions.search("kestrel", include_archive=True)
+    assert sorted(r["session_id"] for r in archived) == ["s-new", "s-old", "s-old"]
+
+
+def test_move_keeps_channel_counters(test_space):
+    spawn.register_agent("alice", "claude-haiku-4-5", None)
+    agent_id = spawn.get_agent("alice").agent_id
+    channel = bridge.create_channel("ops")
+    _seed(channel.channel_id, agent_id)
+    before = bridge.get_channel(channel.channel_id)
+
+    archive.move(90)
+
+    after = bridge.get_channel(channel.channel_id)
+    assert after.message_count == before.message_count == 3
+    assert after.members == [agent_id]
+    assert after.last_activity == before.last_activity
+
+    messaging.delete_message("m-new")
+    assert bridge.get_channel(channel.channel_id).message_count == 2
+
+
+def test_move_is_idempotent_and_keeps_timer_messages(test_space):
+    spawn.register_agent("alice", "claude-haiku-4-5", None)
+    agent_id = spawn.get_agent("alice").agent_id
+    channel = bridge.create_channel("ops")
+    _seed(channel.channel_id, agent_id)
+    with store.write() as conn:
+        conn.execute(
+            "UPDATE channels SET timer_set_by_message_id = 'm-old-1' WHERE channel_id = ?",
+            (channel.channel_id,),
+        )
+
+    assert archive.move(90)["messages"] == 1
+    assert archive.move(90) == {"messages": 0, "transcripts": 0}
+    hot = [m.message_id for m in bridge.get_messages(channel.channel_id)]
+    assert hot == ["m-old-1", "m-new"]
+
+
+def test_reads_without_archive_file(test_space):
+    assert not archive.exists()
+    assert archive.stats() == {}
+    assert sessions.search("anything", include_archive=True) == []
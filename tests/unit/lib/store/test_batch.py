@@ -0,0 +1,75 @@
+"""Tests for space.lib.store group commit."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from space.lib import store
+from space.lib.store.batch import GroupCommitter
+
+
+def _insert_channel(channel_id: str):
+    def insert(conn):
+        sql = "INSERT INTO channels (channel_id, name) VALUES (?, ?)"
+        return conn.execute(sql, (channel_id, channel_id)).rowcount
+
+    return insert
+
+
+def _channel_ids() -> set[str]:
+    with store.read() as conn:
+        return {row[0] for row in conn.execute("SELECT channel_id FROM channels")}
+
+
+def test_write_batched_returns_job_result(test_space):
+    assert store.write_batched(_insert_channel("c-1")) == 1
+    assert "c-1" in _channel_ids()
+
+
+def test_failing_job_does_not_sink_batch(test_space):
+    committer = GroupCommitter(store.pool(), window_ms=50)
+    try:
+        ok = committer.submit(_insert_channel("c-ok"))
+        dup = committer.submit(_insert_channel("c-ok"))
+        also_ok = committer.submit(_insert_channel("c-ok-2"))
+
+        assert ok.result() == 1
+        with pytest.raises(sqlite3.IntegrityError):
+            dup.result()
+        assert also_ok.result() == 1
+    finally:
+        committer.stop()
+
+    assert {"c-ok", "c-ok-2"} <= _channel_ids()
+    assert committer.batches == 1
+
+
+def test_concurrent_writes_share_transactions(test_space):
+    committer = GroupCommitter(store.pool(), window_ms=5)
+    barrier = threading.Barrier(16)
+
+    def worker(n: int) -> None:
+        barrier.wait()
+        for i in range(10):
+            committer.run(_insert_channel(f"w{n}-{i}"))
+
+    threads = [threading.Thread(target=worker, args=(n,)) for n in range(16)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    committer.stop()
+
+    assert committer.jobs == 160
+    assert committer.batches < 160
+    assert len(_channel_ids()) == 160
+
+
+def test_write_batched_inside_write_runs_inline(test_space):
+    with store.write() as conn:
+        conn.execute("BEGIN")
+        store.write_batched(_insert_channel("c-inline"))
+        conn.execute("ROLLBACK")
+
+    assert "c-inline" not in _channel_ids()
@@ -0,0 +1,32 @@
+import threading
+import time
+
+from space.lib import store
+from space.lib.store import changes
+
+
+def _touch():
+    with store.write() as conn:
+        conn.execute(
+            "INSERT INTO channels (channel_id, name) VALUES (?, ?)", (str(time.time()), "c")
+        )
+
+
+def test_watcher_sees_commits_from_this_process(test_space):
+    with changes.Watcher() as watcher:
+        assert not watcher.changed()
+        _touch()
+        assert watcher.changed()
+        assert not watcher.changed()
+
+
+def test_wait_wakes_on_commit_and_times_out(test_space):
+    with changes.Watcher() as watcher:
+        assert watcher.wait(timeout=0.02) is False
+
+        timer = threading.Timer(0.05, _touch)
+        timer.start()
+        started = time.monotonic()
+        assert watcher.wait(timeout=5)
+        assert time.monotonic() - started < 1
+        timer.join()
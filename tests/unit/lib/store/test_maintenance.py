@@ -0,0 +1,62 @@
+from space.lib import store
+from space.lib.store import maintenance
+from space.os import bridge, spawn
+from space.os.bridge import messaging
+
+
+def test_run_task_persists_last_run(test_space):
+    spawn.register_agent("alice", "claude-haiku-4-5", None)
+    agent_id = spawn.get_agent("alice").agent_id
+    channel = bridge.create_channel("ops")
+    for i in range(20):
+        messaging.create_message(channel.channel_id, agent_id, f"note {i}")
+
+    for name in maintenance.TASKS:
+        result = maintenance.run_task(name)
+        assert result["ok"], result
+
+    state = maintenance.load_state()
+    assert set(state) == set(maintenance.TASKS)
+    assert state["checkpoint"]["mode"] == "PASSIVE"
+    assert state["fts"]["optimized"] == []  # first run only seeds the daily optimize
+    assert state["fts"]["last_optimize_at"] > 0
+    assert "messages_fts" in state["fts"]["steps"]
+    assert state["vacuum"]["skipped"]
+    assert maintenance.due() == []
+
+
+def test_due_follows_schedule(test_space):
+    maintenance.run_task("checkpoint")
+    interval = maintenance.SCHEDULE["checkpoint"][0]
+    later = maintenance.load_state()["checkpoint"]["at"] + interval
+    assert "checkpoint" in maintenance.due(now=later)
+    assert "checkpoint" not in maintenance.due(now=later - 1)
+
+
+def test_vacuum_frees_pages_when_incremental(test_space):
+    with store.write() as conn:
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("VACUUM")
+        conn.execute("CREATE TABLE filler (body TEXT)")
+        conn.executemany("INSERT INTO filler VALUES (?)", [("x" * 2000,) for _ in range(200)])
+        conn.execute("DROP TABLE filler")
+
+    result = maintenance.run_task("vacuum")
+    assert result["freed_pages"] > 0
+    assert result["freelist_pages"] == 0
+
+
+def test_fts_optimizes_once_due_and_settled(test_space):
+    maintenance.run_task("fts")
+    state = maintenance.load_state()
+    state["fts"]["last_optimize_at"] -= maintenance.FTS_OPTIMIZE_EVERY_S
+    maintenance._save_state(state)
+
+    result = maintenance.run_task("fts")
+    assert "messages_fts" in result["optimized"]
+    assert result["complete"]
+
+    # Out of budget: merges can't settle, so nothing optimizes and it stays due.
+    result = maintenance.fts(0, optimize=True)
+    assert result["optimized"] == []
+    assert not result["complete"]
@@ -1,5 +1,6 @@
 """Tests for space.lib.store.migrations module."""
 
+import os
 import sqlite3
 import tempfile
 from pathlib import Path
@@ -127,3 +128,135 @@ def test_migrate_data_loss_detection(temp_db_dir):
 
     with pytest.raises(ValueError, match="rows lost"):
         migrations.migrate(sqlite3.connect(db_path), migs[1:])
+
+
+def test_ensure_current_skips_when_stamp_matches(temp_db_dir, monkeypatch):
+    """Matching schema fingerprint skips loading and applying migrations."""
+    conn = sqlite3.connect(temp_db_dir / "test.db")
+
+    assert migrations.ensure_current(conn, "space.core") is True
+
+    def fail(*_):
+        raise AssertionError("migrations should not load on fast path")
+
+    monkeypatch.setattr(migrations, "load_migrations", fail)
+    assert migrations.ensure_current(conn, "space.core") is False
+    conn.close()
+
+
+def test_ensure_current_reruns_on_fingerprint_change(temp_db_dir, monkeypatch):
+    """A new or resized migration set invalidates the stamp."""
+    conn = sqlite3.connect(temp_db_dir / "test.db")
+    migrations.ensure_current(conn, "space.core")
+
+    monkeypatch.setattr(migrations, "fingerprint", lambda _: 12345)
+    assert migrations.ensure_current(conn, "space.core") is True
+    assert conn.execute("PRAGMA user_version").fetchone()[0] == 12345
+    conn.close()
+
+
+def _fingerprint(module_path):
+    migrations.fingerprint.cache_clear()
+    return migrations.fingerprint(module_path)
+
+
+def test_fingerprint_sees_same_size_edit(tmp_path, monkeypatch):
+    (tmp_path / "001_init.sql").write_text("CREATE TABLE a (id TEXT);")
+    monkeypatch.setattr(migrations, "_migrations_dir", lambda _: tmp_path)
+    before = _fingerprint("space.test")
+
+    (tmp_path / "001_init.sql").write_text("CREATE TABLE b (id TEXT);")
+
+    assert _fingerprint("space.test") != before
+
+
+def test_installed_fingerprint_reads_no_files(tmp_path, monkeypatch):
+    sql = tmp_path / "001_init.sql"
+    sql.write_text("CREATE TABLE a (id TEXT);")
+    monkeypatch.setattr(migrations, "_migrations_dir", lambda _: tmp_path)
+    monkeypatch.setattr(migrations, "_installed", lambda _: True)
+    monkeypatch.setattr(Path, "read_bytes", lambda _: pytest.fail("read migration file"))
+    before = _fingerprint("space.test")
+
+    os.utime(sql, ns=(0, 0))  # an upgrade rewrites the file
+
+    assert _fingerprint("space.test") != before
+    migrations.fingerprint.cache_clear()
+
+
+def test_migrate_sql_data_loss_detection(temp_db_dir):
+    """Row-removing SQL migrations are checked against the tables they touch."""
+    conn = sqlite3.connect(temp_db_dir / "test.db")
+    conn.execute("CREATE TABLE test (id TEXT PRIMARY KEY)")
+    conn.execute("INSERT INTO test VALUES ('x')")
+    conn.commit()
+
+    with pytest.raises(ValueError, match="rows lost"):
+        migrations.migrate(conn, [("bad", "DELETE FROM test WHERE id = 'x'")])
+    assert conn.execute("SELECT COUNT(*) FROM test").fetchone()[0] == 1
+    conn.close()
+
+
+def test_migrate_counts_only_touched_tables(temp_db_dir, monkeypatch):
+    """Additive migrations never scan existing tables."""
+    conn = sqlite3.connect(temp_db_dir / "test.db")
+    conn.execute("CREATE TABLE big (id INTEGER PRIMARY KEY)")
+    conn.execute("CREATE TABLE small (id INTEGER PRIMARY KEY)")
+    conn.commit()
+
+    counted = []
+    real_count = migrations._get_table_count
+    monkeypatch.setattr(
+        migrations,
+        "_get_table_count",
+        lambda c, t: counted.append(t) or real_count(c, t),
+    )
+
+    migrations.migrate(
+        conn,
+        [
+            ("add", "ALTER TABLE big ADD COLUMN note TEXT; CREATE INDEX idx_note ON big(note)"),
+            ("prune", "DELETE FROM small WHERE id < 0"),
+        ],
+    )
+    assert set(counted) == {"small"}
+    conn.close()
+
+
+def test_guarded_tables_follow_cascades_and_triggers(temp_db_dir):
+    conn = sqlite3.connect(temp_db_dir / "test.db")
+    conn.executescript(
+        """
+        CREATE TABLE parent (id TEXT PRIMARY KEY);
+        CREATE TABLE child (id TEXT, parent_id TEXT REFERENCES parent(id) ON DELETE CASCADE);
+        CREATE TABLE audit (id TEXT);
+        CREATE TABLE other (id TEXT);
+        CREATE TRIGGER child_ad AFTER DELETE ON child BEGIN
+            DELETE FROM audit WHERE id = old.id;
+        END;
+        """
+    )
+
+    assert migrations._guarded_tables(conn, "DELETE FROM parent") == {"parent", "child", "audit"}
+    assert migrations._guarded_tables(conn, 'ALTER TABLE "other" RENAME TO other_v2') == {"other"}
+    assert migrations._guarded_tables(conn, "CREATE TABLE fresh (id TEXT)") == set()
+    conn.close()
+
+
+def test_guarded_tables_for_callables(temp_db_dir):
+    """Callables declare their tables; undeclared ones get every table checked."""
+    conn = sqlite3.connect(temp_db_dir / "test.db")
+    conn.execute("CREATE TABLE a (id TEXT)")
+    conn.execute("CREATE TABLE b (id TEXT)")
+
+    def opaque(conn):
+        pass
+
+    def declared(conn):
+        pass
+
+    declared.tables = ["a"]
+
+    assert migrations._guarded_tables(conn, opaque) == {"a", "b"}
+    assert migrations._guarded_tables(conn, declared) == {"a"}
+    conn.close()
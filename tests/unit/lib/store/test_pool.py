@@ -0,0 +1,97 @@
+"""Tests for space.lib.store reader pool and serialized writer."""
+
+import sqlite3
+import threading
+
+import pytest
+
+from space.lib import store
+
+
+def test_read_connection_is_query_only(test_space):
+    with store.read() as conn:
+        with pytest.raises(sqlite3.OperationalError, match="readonly"):
+            conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c', 'c')")
+
+
+def test_nested_reads_share_connection(test_space):
+    with store.read() as outer, store.read() as inner:
+        assert outer is inner
+
+
+def test_read_inside_write_sees_uncommitted(test_space):
+    with store.write() as conn:
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c-1', 'pending')")
+        with store.read() as reader:
+            row = reader.execute("SELECT name FROM channels WHERE channel_id = 'c-1'").fetchone()
+        assert row["name"] == "pending"
+
+
+def test_write_rolls_back_on_error(test_space):
+    with pytest.raises(RuntimeError), store.write() as conn:
+        conn.execute("BEGIN")
+        conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c-2', 'doomed')")
+        raise RuntimeError("boom")
+
+    with store.read() as conn:
+        assert conn.execute("SELECT 1 FROM channels WHERE channel_id = 'c-2'").fetchone() is None
+
+
+def test_write_autocommits_each_statement(test_space):
+    with pytest.raises(RuntimeError), store.write() as conn:
+        conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c-3', 'kept')")
+        raise RuntimeError("boom")
+
+    with store.read() as conn:
+        assert conn.execute("SELECT 1 FROM channels WHERE channel_id = 'c-3'").fetchone()
+
+
+def test_transaction_is_atomic_and_joins_outer(test_space):
+    with pytest.raises(RuntimeError), store.write() as conn, store.transaction(conn):
+        conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c-4', 'doomed-4')")
+        with store.write() as inner, store.transaction(inner):
+            inner.execute("INSERT INTO channels (channel_id, name) VALUES ('c-5', 'doomed-5')")
+        assert conn.in_transaction
+        raise RuntimeError("boom")
+
+    with store.write() as conn:
+        with store.transaction(conn):
+            conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c-6', 'kept')")
+        assert not conn.in_transaction
+
+    with store.read() as conn:
+        rows = conn.execute("SELECT channel_id FROM channels WHERE channel_id LIKE 'c-%'")
+        assert [r[0] for r in rows] == ["c-6"]
+
+
+def test_concurrent_writers_are_serialized(test_space):
+    errors: list[Exception] = []
+
+    def insert(worker: int) -> None:
+        try:
+            for i in range(25):
+                with store.write() as conn:
+                    conn.execute(
+                        "INSERT INTO channels (channel_id, name) VALUES (?, ?)",
+                        (f"w{worker}-{i}", f"w{worker}-{i}"),
+                    )
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=insert, args=(n,)) for n in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert errors == []
+    with store.read() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM channels").fetchone()[0] == 200
+
+
+def test_reader_pool_is_bounded(test_space, monkeypatch):
+    monkeypatch.setenv("SPACE_DB_READERS", "2")
+    store.close_all()
+
+    assert store.pool().max_readers == 2
@@ -0,0 +1,61 @@
+import pytest
+
+from space.lib import store
+from space.lib.store import sqlite, tune
+
+
+def _pragmas(conn, names):
+    return {name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in names}
+
+
+def test_connect_applies_default_profiles(test_space, monkeypatch):
+    monkeypatch.delenv("SPACE_DB_PROFILE", raising=False)
+    monkeypatch.delenv("SPACE_DB_READ_PROFILE", raising=False)
+    store.close_all()
+    with store.write() as conn:
+        assert _pragmas(conn, ["synchronous", "cache_size", "temp_store"]) == {
+            "synchronous": 1,
+            "cache_size": -16_000,
+            "temp_store": 2,
+        }
+    with store.read() as conn:
+        assert conn.execute("PRAGMA cache_size").fetchone()[0] == -32_000
+
+
+def test_profile_from_env(tmp_path, monkeypatch):
+    monkeypatch.setenv("SPACE_DB_PROFILE", "low-memory")
+    assert sqlite.profile_name() == "low-memory"
+    assert sqlite.profile_name(query_only=True) == "low-memory"
+    conn = sqlite.connect(tmp_path / "x.db")
+    assert _pragmas(conn, ["cache_size", "mmap_size"]) == {"cache_size": -2_000, "mmap_size": 0}
+    conn.close()
+
+    monkeypatch.setenv("SPACE_DB_PROFILE", "nope")
+    assert sqlite.profile_name() == sqlite.DEFAULT_PROFILE
+
+
+def test_profile_scope_restores(tmp_path):
+    conn = sqlite.connect(tmp_path / "x.db")
+    with sqlite.profile_scope(conn, "bulk-load"):
+        assert _pragmas(conn, ["synchronous", "cache_size"]) == {
+            "synchronous": 0,
+            "cache_size": -64_000,
+        }
+    assert _pragmas(conn, ["synchronous", "cache_size"]) == {
+        "synchronous": 1,
+        "cache_size": -16_000,
+    }
+    conn.close()
+
+
+def test_tune_times_every_profile(test_space):
+    report = tune.run(rounds=1, writes=5)
+    assert set(report["profiles"]) == set(sqlite.PROFILES)
+    assert report["best_read"] in sqlite.PROFILES
+    with store.read() as conn:
+        assert not conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE name = ?", (tune.SCRATCH_TABLE,)
+        ).fetchone()
+
+    with pytest.raises(ValueError):
+        tune.run(profiles=["turbo"])
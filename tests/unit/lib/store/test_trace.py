@@ -0,0 +1,85 @@
+"""Tests for space.lib.store opt-in SQL tracing."""
+
+import pytest
+
+from space.lib import store
+from space.lib.store import trace
+from space.workspace import stats
+
+
+@pytest.fixture
+def traced(test_space, monkeypatch):
+    monkeypatch.setenv("SPACE_DB_TRACE", "1")
+    monkeypatch.setenv("SPACE_DB_SLOW_MS", "1000000")
+    store.close_all()
+    trace.tracer().flush()
+    db_dir = store.pool().db_path.parent
+    trace.reset(db_dir)
+    return db_dir
+
+
+def _list_channel_names() -> list[str]:
+    with store.read() as conn:
+        return [row["name"] for row in conn.execute("SELECT name FROM channels WHERE name != 'x'")]
+
+
+def test_shape_collapses_literals():
+    assert trace.shape("SELECT * FROM t WHERE id = 'abc' AND n > 10") == (
+        "SELECT * FROM t WHERE id = ? AND n > ?"
+    )
+    assert (
+        trace.shape("SELECT * FROM t WHERE id IN (?, ?,\n ?)")
+        == "SELECT * FROM t WHERE id IN (...)"
+    )
+
+
+def test_tracing_disabled_by_default(test_space, monkeypatch):
+    monkeypatch.delenv("SPACE_DB_TRACE", raising=False)
+    store.close_all()
+
+    with store.read() as conn:
+        assert not isinstance(conn, trace.TracedConnection)
+
+
+def test_records_caller_and_rows(traced):
+    with store.write() as conn:
+        conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c1', 'a')")
+        conn.execute("INSERT INTO channels (channel_id, name) VALUES ('c2', 'b')")
+
+    _list_channel_names()
+    _list_channel_names()
+
+    entries = {e["caller"].rsplit(".", 1)[-1]: e for e in trace.tracer().snapshot(traced)}
+    entry = entries["_list_channel_names"]
+    assert entry["shape"] == "SELECT name FROM channels WHERE name != ?"
+    assert entry["calls"] == 2
+    assert entry["rows"] == 4
+    assert sum(entry["histogram"]) == 2
+
+    inserts = entries["test_records_caller_and_rows"]
+    assert inserts["calls"] == 2
+    assert inserts["rows"] == 2
+
+
+def test_flush_accumulates_across_processes(traced):
+    _list_channel_names()
+    trace.tracer().flush()
+    _list_channel_names()
+
+    report = stats.query_stats(limit=None)
+    entry = next(q for q in report["queries"] if q["caller"].endswith("_list_channel_names"))
+    assert entry["calls"] == 2
+    assert report["tracing"] is True
+
+
+def test_slow_queries_capture_plan(traced, monkeypatch):
+    monkeypatch.setenv("SPACE_DB_SLOW_MS", "0")
+    store.close_all()
+
+    with store.read() as conn:
+        conn.execute("SELECT * FROM channels WHERE name = ?", ("a",)).fetchall()
+
+    slow = trace.load_slow(traced)
+    entry = next(s for s in slow if s["sql"].startswith("SELECT * FROM channels"))
+    assert entry["caller"].endswith("test_slow_queries_capture_plan")
+    assert any("channels" in step for step in entry["plan"])
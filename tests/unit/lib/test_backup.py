@@ -22,10 +22,40 @@ def test_backup_stats_counts_rows(tmp_path):
     assert stats["test.db"]["tables"] == 1
 
 
+def test_backup_stats_skip_scans_unless_verified(tmp_path):
+    """Row counts come from sqlite_stat1; quick_check only runs with verify."""
+    from space.lib.backup import _get_db_stats
+
+    db = tmp_path / "test.db"
+    conn = sqlite3.connect(db)
+    conn.execute("CREATE TABLE data (id INTEGER)")
+    conn.executemany("INSERT INTO data VALUES (?)", [(i,) for i in range(10)])
+    conn.execute("ANALYZE")
+    conn.execute("INSERT INTO data VALUES (10)")
+    conn.commit()
+    conn.close()
+
+    statements = []
+    real_connect = sqlite3.connect
+
+    def tracing_connect(*args, **kwargs):
+        traced = real_connect(*args, **kwargs)
+        traced.set_trace_callback(statements.append)
+        return traced
+
+    with patch("space.lib.backup.sqlite3.connect", side_effect=tracing_connect):
+        assert _get_db_stats(db) == {"tables": 1, "rows": 10}
+        assert not any("COUNT(*)" in s or "quick_check" in s for s in statements)
+        _get_db_stats(db, verify=True)
+    assert any("quick_check" in s for s in statements)
+
+
 @patch("space.lib.backup.paths.backup_sessions_dir")
 @patch("space.lib.backup.paths.sessions_dir")
-def test_backup_sessions_mirror_structure(mock_sessions_dir, mock_backup_sessions_dir, tmp_path):
-    """Session backup mirrors structure and is additive (overwrites updated files, preserves backup-only files)."""
+def test_backup_sessions_snapshots_link_unchanged(
+    mock_sessions_dir, mock_backup_sessions_dir, tmp_path
+):
+    """Session snapshots copy only changed files, hardlink the rest, and stay additive."""
     from space.lib.backup import _backup_sessions
 
     src_sessions = tmp_path / "sessions"
@@ -41,16 +71,185 @@ def test_backup_sessions_mirror_structure(mock_sessions_dir, mock_backup_session
     (src_sessions / "claude" / "session1.jsonl").write_text("msg1")
     (src_sessions / "codex" / "session2.jsonl").write_text("msg2")
 
-    _backup_sessions(quiet_output=True)
+    first = _backup_sessions(quiet_output=True, timestamp="20250101_000000")
 
-    assert (backup_dir / "claude" / "session1.jsonl").read_text() == "msg1"
-    assert (backup_dir / "codex" / "session2.jsonl").read_text() == "msg2"
+    assert first["copied"] == 2
+    assert (backup_dir / "latest" / "claude" / "session1.jsonl").read_text() == "msg1"
 
     (src_sessions / "claude" / "session3.jsonl").write_text("msg3")
     (src_sessions / "claude" / "session1.jsonl").write_text("msg1-updated")
+    (src_sessions / "codex" / "session2.jsonl").unlink()
+
+    second = _backup_sessions(quiet_output=True, timestamp="20250101_000100")
+
+    old, new = backup_dir / "20250101_000000", backup_dir / "20250101_000100"
+    assert (second["copied"], second["linked"]) == (2, 0)
+    assert second["added"]["claude"] == 1
+    assert (old / "claude" / "session1.jsonl").read_text() == "msg1"
+    assert (new / "claude" / "session1.jsonl").read_text() == "msg1-updated"
+    assert (new / "claude" / "session3.jsonl").read_text() == "msg3"
+    assert (new / "codex" / "session2.jsonl").read_text() == "msg2"
+    assert (new / "codex" / "session2.jsonl").samefile(old / "codex" / "session2.jsonl")
+
+    third = _backup_sessions(quiet_output=True, timestamp="20250101_000200")
+
+    assert (third["copied"], third["linked"]) == (0, 2)
+    latest = backup_dir / "latest"
+    assert (latest / "claude" / "session3.jsonl").samefile(new / "claude" / "session3.jsonl")
+
+
+@patch("space.lib.backup.paths.backup_sessions_dir")
+@patch("space.lib.backup.paths.sessions_dir")
+def test_backup_sessions_adopts_legacy_mirror(
+    mock_sessions_dir, mock_backup_sessions_dir, tmp_path
+):
+    """A pre-manifest flat mirror seeds the first snapshot without recopying."""
+    import shutil
+
+    from space.lib.backup import _backup_sessions
+
+    src_sessions = tmp_path / "sessions"
+    (src_sessions / "claude").mkdir(parents=True)
+    (src_sessions / "claude" / "s1.jsonl").write_text("msg1")
+    backup_dir = tmp_path / "backup"
+    (backup_dir / "claude").mkdir(parents=True)
+    shutil.copy2(src_sessions / "claude" / "s1.jsonl", backup_dir / "claude" / "s1.jsonl")
+    (backup_dir / "claude" / "gone.jsonl").write_text("kept")
+
+    mock_sessions_dir.return_value = src_sessions
+    mock_backup_sessions_dir.return_value = backup_dir
+
+    stats = _backup_sessions(quiet_output=True, timestamp="20250101_000000")
+
+    assert (stats["copied"], stats["linked"]) == (0, 1)
+    assert (backup_dir / "latest" / "claude" / "gone.jsonl").read_text() == "kept"
+
+
+def _seed_db(path, rows):
+    conn = sqlite3.connect(path, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("CREATE TABLE data (id INTEGER PRIMARY KEY, body TEXT)")
+    conn.executemany("INSERT INTO data (body) VALUES (?)", (("x" * 200,) for _ in range(rows)))
+    return conn
+
+
+def test_snapshot_db_is_consistent_while_writers_continue(tmp_path):
+    """Paged backup keeps one read snapshot; writes between steps land only in the source."""
+    from space.lib import backup
+
+    writer = _seed_db(tmp_path / "space.db", 5000)
+    steps = []
+
+    def on_progress(name, done, total):
+        steps.append((name, done, total))
+        writer.execute("INSERT INTO data (body) VALUES ('late')")
+
+    with patch.object(backup, "BACKUP_STEP_PAGES", 16):
+        backup._snapshot_db(tmp_path / "space.db", tmp_path / "copy.db", on_progress)
+
+    assert len(steps) > 1
+    assert steps[-1][1] == steps[-1][2]
+    copy = sqlite3.connect(tmp_path / "copy.db")
+    assert copy.execute("SELECT COUNT(*) FROM data").fetchone()[0] == 5000
+    assert writer.execute("SELECT COUNT(*) FROM data").fetchone()[0] == 5000 + len(steps)
+    copy.close()
+    writer.close()
+
+
+def test_incremental_snapshot_stores_changed_pages(tmp_path):
+    """Incremental snapshots keep only changed pages and materialize to the live state."""
+    from space.lib import backup
+
+    dot_space = tmp_path / ".space"
+    dot_space.mkdir()
+    conn = _seed_db(dot_space / "space.db", 5000)
+
+    def snapshot_dir(ts):
+        return tmp_path / "backups" / "data" / ts
+
+    with (
+        patch.object(backup.paths, "dot_space", return_value=dot_space),
+        patch.object(backup.paths, "backup_snapshot", side_effect=snapshot_dir),
+    ):
+        backup._backup_data_snapshot("20250101_000000", True, incremental=True)
+        conn.execute("UPDATE data SET body = 'changed' WHERE id = 42")
+        stats = backup._backup_data_snapshot("20250101_000100", True, incremental=True)
+
+    full = backup._read_manifest(snapshot_dir("20250101_000000"))["databases"]["space.db"]
+    delta = backup._read_manifest(snapshot_dir("20250101_000100"))["databases"]["space.db"]
+    assert full["mode"] == "full"
+    assert delta["mode"] == "delta"
+    assert delta["base"] == "20250101_000000"
+    assert 0 < delta["changed"] < delta["pages"] // 10
+    assert not (snapshot_dir("20250101_000100") / "space.db").exists()
+    assert stats["space.db"]["rows"] == 5000
+
+    restored = backup.materialize(snapshot_dir("20250101_000100"), "space.db", tmp_path / "r.db")
+    check = sqlite3.connect(restored)
+    assert check.execute("PRAGMA integrity_check").fetchone()[0] == "ok"
+    assert check.execute("SELECT body FROM data WHERE id = 42").fetchone()[0] == "changed"
+    check.close()
+    conn.close()
+
+
+def test_archive_round_trip(tmp_path):
+    """backup --archive streams DBs and sessions into one tar; restore puts them back."""
+    import tarfile
+
+    from space.lib import backup
+
+    dot_space = tmp_path / ".space"
+    dot_space.mkdir()
+    _seed_db(dot_space / "space.db", 100).close()
+    sessions = tmp_path / "sessions"
+    (sessions / "claude").mkdir(parents=True)
+    (sessions / "claude" / "s1.jsonl").write_text('{"role": "user"}\n' * 500)
+
+    with (
+        patch.object(backup.paths, "dot_space", return_value=dot_space),
+        patch.object(backup.paths, "sessions_dir", return_value=sessions),
+    ):
+        dest = tmp_path / "out" / "space.tar.gz"
+        result = backup.write_archive(dest, compression="gz")
+
+        assert (result["databases"], result["sessions"]) == (1, 1)
+        with tarfile.open(dest) as tar:
+            assert sorted(tar.getnames()) == ["data/space.db", "sessions/claude/s1.jsonl"]
+
+        conn = sqlite3.connect(dot_space / "space.db")
+        conn.execute("DELETE FROM data")
+        conn.commit()
+        conn.close()
+        (sessions / "claude" / "s1.jsonl").unlink()
+
+        counts = backup.restore_archive(dest)
+
+    assert counts == {"databases": 1, "sessions": 1, "skipped": 0}
+    assert (dot_space / "space.db.pre-restore").exists()
+    conn = sqlite3.connect(dot_space / "space.db")
+    assert conn.execute("SELECT COUNT(*) FROM data").fetchone()[0] == 100
+    conn.close()
+    assert (sessions / "claude" / "s1.jsonl").read_text().count("\n") == 500
+
+
+def test_restore_skips_unexpected_members(tmp_path):
+    import io
+    import tarfile
+
+    from space.lib import backup
+
+    archive = tmp_path / "evil.tar.gz"
+    with tarfile.open(archive, "w:gz") as tar:
+        for name in ("../escape.db", "data/../../x.db", "other/file"):
+            info = tarfile.TarInfo(name)
+            info.size = 1
+            tar.addfile(info, io.BytesIO(b"x"))
 
-    _backup_sessions(quiet_output=True)
+    with (
+        patch.object(backup.paths, "dot_space", return_value=tmp_path / ".space"),
+        patch.object(backup.paths, "sessions_dir", return_value=tmp_path / "sessions"),
+    ):
+        counts = backup.restore_archive(archive)
 
-    assert (backup_dir / "claude" / "session1.jsonl").read_text() == "msg1-updated"
-    assert (backup_dir / "claude" / "session3.jsonl").read_text() == "msg3"
-    assert (backup_dir / "codex" / "session2.jsonl").read_text() == "msg2"
+    assert counts == {"databases": 0, "sessions": 0, "skipped": 3}
+    assert not (tmp_path / "escape.db").exists()
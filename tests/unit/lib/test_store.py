@@ -3,7 +3,7 @@
 import sqlite3
 from dataclasses import dataclass
 
-from space.lib.store import from_row
+from space.lib.store import from_row, from_rows, mapper
 
 
 @dataclass
@@ -71,3 +71,32 @@ def test_from_row_missing_optional_fields():
     assert entity.id == "1"
     assert entity.name == "test"
     assert entity.description is None
+
+
+def test_from_rows_maps_by_cursor_description():
+    """Test result set conversion, including plain tuple rows and reordered columns."""
+    conn = sqlite3.connect(":memory:")
+    conn.execute("CREATE TABLE test (id TEXT, name TEXT, value INTEGER, extra TEXT)")
+    conn.executemany(
+        "INSERT INTO test VALUES (?, ?, ?, ?)", [("1", "a", 1, "x"), ("2", "b", 2, "y")]
+    )
+
+    entities = from_rows(
+        conn.execute("SELECT extra, value, name, id FROM test ORDER BY id"), SimpleEntity
+    )
+
+    assert entities == [SimpleEntity("1", "a", 1), SimpleEntity("2", "b", 2)]
+    assert from_rows(conn.execute("SELECT * FROM test WHERE 0"), SimpleEntity) == []
+
+
+def test_mapper_is_cached_per_column_layout():
+    columns = ("id", "name", "value")
+
+    assert mapper(SimpleEntity, columns) is mapper(SimpleEntity, list(columns))
+    assert mapper(SimpleEntity, columns) is not mapper(SimpleEntity, ("name", "id", "value"))
+
+
+def test_from_row_accepts_dict():
+    entity = from_row({"value": 3, "id": "1", "name": "n", "other": True}, SimpleEntity)
+
+    assert entity == SimpleEntity("1", "n", 3)
@@ -0,0 +1,84 @@
+"""Parallel process-group termination."""
+
+import os
+import subprocess
+import sys
+import threading
+import time
+
+from space.lib import terminate
+
+IGNORE_TERM = "import signal, time; signal.signal(signal.SIGTERM, signal.SIG_IGN); time.sleep(60)"
+# Leader exits on SIGTERM but leaves a child that ignores it in the same group.
+ORPHAN_CHILD = (
+    "import subprocess, sys, time; "
+    f"subprocess.Popen([sys.executable, '-c', {IGNORE_TERM!r}]); time.sleep(60)"
+)
+
+
+def _start(code: str, group: bool = True) -> subprocess.Popen:
+    proc = subprocess.Popen([sys.executable, "-c", code], start_new_session=group)
+    # The launcher reaps its own child; terminate() only signals and watches.
+    threading.Thread(target=proc.wait, daemon=True).start()
+    time.sleep(0.3)  # let the interpreter install its handlers
+    return proc
+
+
+def _group_alive(pgid: int) -> bool:
+    try:
+        os.killpg(pgid, 0)
+        return True
+    except ProcessLookupError:
+        return False
+
+
+def test_terminates_many_in_parallel():
+    procs = [_start("import time; time.sleep(60)") for _ in range(5)]
+
+    started = time.monotonic()
+    outcome = terminate.terminate([p.pid for p in procs])
+
+    assert time.monotonic() - started < 1.0
+    assert set(outcome.values()) == {"terminated"}
+    for p in procs:
+        assert p.wait(timeout=1) != 0
+
+
+def test_escalates_to_sigkill_at_grace():
+    proc = _start(IGNORE_TERM)
+
+    started = time.monotonic()
+    outcome = terminate.terminate([proc.pid], grace=0.3, deadline=2.0)
+
+    assert outcome == {proc.pid: "killed"}
+    assert time.monotonic() - started < 1.5
+    assert proc.wait(timeout=1) == -9
+
+
+def test_kills_subprocesses_left_in_group():
+    proc = _start(ORPHAN_CHILD)
+    time.sleep(0.3)  # and the child's
+
+    # Generous deadline: the orphaned child is reaped by init, not by us.
+    outcome = terminate.terminate([proc.pid], grace=0.3, deadline=5.0)
+    proc.wait(timeout=1)
+
+    assert outcome == {proc.pid: "killed"}
+    time.sleep(0.1)
+    assert not _group_alive(proc.pid)
+
+
+def test_missing_pid_is_gone():
+    proc = _start("pass")
+    proc.wait(timeout=5)
+
+    assert terminate.terminate([proc.pid]) == {proc.pid: "gone"}
+
+
+def test_non_leader_gets_plain_kill():
+    proc = _start("import time; time.sleep(60)", group=False)
+
+    outcome = terminate.terminate([proc.pid])
+
+    assert outcome == {proc.pid: "terminated"}
+    assert proc.wait(timeout=1) != 0
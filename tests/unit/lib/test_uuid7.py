@@ -107,3 +107,43 @@ def test_reject_case_mismatch():
         resolve_id("AGENTS", "agent_id", "abc")
     with pytest.raises(ValueError, match="Invalid column"):
         resolve_id("agents", "AGENT_ID", "abc")
+
+
+def _insert_memories(ids):
+    from space.lib import store
+
+    with store.write() as conn:
+        conn.execute(
+            "INSERT INTO agents (agent_id, identity, created_at) VALUES ('a1', 'a', 'now')"
+        )
+        conn.executemany(
+            "INSERT INTO memories (memory_id, agent_id, topic, message, created_at) "
+            "VALUES (?, 'a1', 't', 'm', 'now')",
+            [(i,) for i in ids],
+        )
+
+
+def test_resolve_id_suffix_lengths(test_space):
+    _insert_memories(["0000-aaaa-11112222", "0000-bbbb-33332222", "0000-cccc-44445555"])
+
+    assert resolve_id("memories", "memory_id", "44445555") == "0000-cccc-44445555"
+    assert resolve_id("memories", "memory_id", "5555") == "0000-cccc-44445555"
+    assert resolve_id("memories", "memory_id", "bbbb-33332222") == "0000-bbbb-33332222"
+    assert resolve_id("memories", "memory_id", "CCCC-44445555") == "0000-cccc-44445555"
+    with pytest.raises(ValueError, match="Ambiguous"):
+        resolve_id("memories", "memory_id", "2222")
+    with pytest.raises(ValueError, match="No entry"):
+        resolve_id("memories", "memory_id", "zzzz-44445555")
+
+
+def test_resolve_id_uses_suffix_index(test_space):
+    from space.lib import store
+    from space.lib.uuid7 import suffix_key
+
+    key = suffix_key("memory_id")
+    with store.read() as conn:
+        plan = conn.execute(
+            f"EXPLAIN QUERY PLAN SELECT memory_id FROM memories WHERE {key} >= ? AND {key} < ?",
+            ("a", "b"),
+        ).fetchall()
+    assert any("idx_memories_id_suffix" in row[3] for row in plan)
@@ -159,3 +159,67 @@ async def test_first_recv_creates_bookmark_at_latest(test_space, test_channel, t
 
     bookmark = messaging.get_bookmark(reader_id, test_channel.channel_id)
     assert bookmark == msgs[-1].message_id
+
+
+@pytest.mark.asyncio
+async def test_recv_limit_pages_bookmark_forward(test_space, test_channel, test_agent):
+    """recv with limit returns the oldest unread page and advances the bookmark by it."""
+    reader_id = uuid7()
+    for i in range(5):
+        await messaging.send_message(test_channel.channel_id, test_agent, f"msg {i}")
+
+    first, _, _, _ = messaging.recv_messages(test_channel.channel_id, reader_id=reader_id, limit=2)
+    second, _, _, _ = messaging.recv_messages(test_channel.channel_id, reader_id=reader_id, limit=2)
+    rest, _, _, _ = messaging.recv_messages(test_channel.channel_id, reader_id=reader_id)
+
+    assert [m.content for m in first] == ["msg 0", "msg 1"]
+    assert [m.content for m in second] == ["msg 2", "msg 3"]
+    assert [m.content for m in rest] == ["msg 4"]
+
+
+@pytest.mark.asyncio
+async def test_recv_before_after_cursors(test_space, test_channel, test_agent):
+    """before/after page by (created_at, message_id); paging back leaves the bookmark."""
+    reader_id = uuid7()
+    for i in range(5):
+        await messaging.send_message(test_channel.channel_id, test_agent, f"msg {i}")
+    all_msgs, _, _, _ = messaging.recv_messages(test_channel.channel_id, reader_id=reader_id)
+    ids = [m.message_id for m in all_msgs]
+
+    older, _, _, _ = messaging.recv_messages(
+        test_channel.channel_id, reader_id=reader_id, before=ids[3], limit=2
+    )
+    assert [m.message_id for m in older] == ids[1:3]
+    assert messaging.get_bookmark(reader_id, test_channel.channel_id) == ids[-1]
+
+    newer, _, _, _ = messaging.recv_messages(test_channel.channel_id, after=ids[2])
+    assert [m.message_id for m in newer] == ids[3:]
+
+    with pytest.raises(ValueError, match="not found"):
+        messaging.recv_messages(test_channel.channel_id, after="missing")
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_only_new_messages_from_others(test_space, test_channel, test_agent):
+    """wait blocks past existing history and wakes on another agent's message."""
+    import threading
+
+    agents.register_agent(identity="other-agent", constitution="zealot", model="claude-sonnet-4")
+    other_id = agents.get_agent("other-agent").agent_id
+    await messaging.send_message(test_channel.channel_id, "other-agent", "old news")
+
+    def post():
+        messaging.create_message(test_channel.channel_id, other_id, "fresh")
+
+    timer = threading.Timer(0.05, post)
+    timer.start()
+    msgs, count, _, _ = messaging.wait_for_message(test_channel.channel_id, test_agent, timeout=5)
+    timer.join()
+
+    assert count == 1
+    assert msgs[0].content == "fresh"
+
+    msgs, count, _, _ = messaging.wait_for_message(
+        test_channel.channel_id, test_agent, timeout=0.05
+    )
+    assert count == 0
@@ -99,3 +99,135 @@ def test_get_channel(mock_db):
 
     mock_db.execute.return_value.fetchone.return_value = None
     assert bridge.get_channel("missing") is None
+
+
+def _post(channel_id: str, agent_id: str, created_at: str) -> str:
+    from space.lib import store
+    from space.lib.uuid7 import uuid7
+
+    message_id = uuid7()
+    with store.write() as conn:
+        conn.execute(
+            "INSERT INTO messages (message_id, channel_id, agent_id, content, created_at) VALUES (?, ?, ?, 'hi', ?)",
+            (message_id, channel_id, agent_id, created_at),
+        )
+    return message_id
+
+
+def test_channel_stats_track_messages(test_space):
+    from space.lib import store
+    from space.os import spawn
+
+    spawn.register_agent("alice", "claude-haiku-4-5", None)
+    spawn.register_agent("bob", "claude-haiku-4-5", None)
+    alice = spawn.get_agent("alice").agent_id
+    bob = spawn.get_agent("bob").agent_id
+    channel = bridge.create_channel("general")
+    bridge.create_channel("quiet")
+
+    _post(channel.channel_id, alice, "2025-01-01T00:00:01")
+    _post(channel.channel_id, bob, "2025-01-01T00:00:03")
+    latest = _post(channel.channel_id, bob, "2025-01-01T00:00:05")
+
+    got = bridge.get_channel("general")
+    assert (got.message_count, got.last_activity) == (3, "2025-01-01T00:00:05")
+    assert got.members == sorted([alice, bob])
+    assert {c.name: c.message_count for c in bridge.list_channels()} == {"general": 3, "quiet": 0}
+
+    with store.write() as conn:
+        conn.execute("DELETE FROM messages WHERE message_id = ?", (latest,))
+        conn.execute("DELETE FROM messages WHERE agent_id = ?", (alice,))
+
+    got = bridge.get_channel("general")
+    assert (got.message_count, got.last_activity) == (1, "2025-01-01T00:00:03")
+    assert got.members == [bob]
+
+
+def test_channel_stats_follow_agent_merge(test_space):
+    from space.os import spawn
+
+    spawn.register_agent("alice", "claude-haiku-4-5", None)
+    spawn.register_agent("alias", "claude-haiku-4-5", None)
+    alice = spawn.get_agent("alice").agent_id
+    alias = spawn.get_agent("alias").agent_id
+    channel = bridge.create_channel("general")
+    _post(channel.channel_id, alias, "2025-01-01T00:00:01")
+    _post(channel.channel_id, alice, "2025-01-01T00:00:02")
+
+    spawn.merge_agents("alias", "alice")
+
+    got = bridge.get_channel("general")
+    assert got.message_count == 2
+    assert got.members == [alice]
+
+
+def test_channel_stats_backfilled_by_migration(tmp_path):
+    import sqlite3
+
+    from space.lib.store import migrations
+
+    conn = sqlite3.connect(tmp_path / "space.db")
+    foundation, stats = migrations.load_migrations("space.core")[:2]
+    migrations.migrate(conn, [foundation])
+    conn.executescript(
+        """
+        INSERT INTO agents (agent_id, identity, created_at) VALUES ('a1', 'alice', 'now');
+        INSERT INTO channels (channel_id, name) VALUES ('c1', 'general');
+        INSERT INTO messages (message_id, channel_id, agent_id, content, created_at)
+        VALUES ('m1', 'c1', 'a1', 'x', '2025-01-01'), ('m2', 'c1', 'a1', 'y', '2025-01-02');
+        """
+    )
+
+    migrations.migrate(conn, [stats])
+
+    assert conn.execute("SELECT * FROM channel_stats").fetchall() == [("c1", 2, "2025-01-02")]
+    assert conn.execute("SELECT * FROM channel_members").fetchall() == [("c1", "a1", 2)]
+    conn.close()
+
+
+@pytest.mark.asyncio
+async def test_list_channels_unread_counts(test_space):
+    from space.os import spawn
+    from space.os.bridge import channels, messaging
+
+    spawn.register_agent("alice", "claude-haiku-4-5", None)
+    alice = spawn.get_agent("alice").agent_id
+    general = bridge.create_channel("general")
+    ops = bridge.create_channel("ops")
+    bridge.create_channel("quiet")
+
+    _post(general.channel_id, alice, "2025-01-01T00:00:01")
+    read_up_to = _post(general.channel_id, alice, "2025-01-01T00:00:02")
+    _post(general.channel_id, alice, "2025-01-01T00:00:03")
+    _post(general.channel_id, alice, "2025-01-01T00:00:04")
+    _post(ops.channel_id, alice, "2025-01-01T00:00:05")
+    messaging.update_bookmark("reader", general.channel_id, read_up_to)
+
+    expected = {"general": 2, "ops": 1, "quiet": 0}
+    assert {c.name: c.unread_count for c in bridge.list_channels(reader_id="reader")} == expected
+    listed = await channels.alist_channels(reader_id="reader")
+    assert {c.name: c.unread_count for c in listed} == expected
+    assert {c.unread_count for c in bridge.list_channels()} == {0}
+
+
+def test_unread_stays_caught_up_after_archive(test_space):
+    from space.lib.store import archive
+    from space.os import spawn
+    from space.os.bridge import messaging
+
+    spawn.register_agent("alice", "claude-haiku-4-5", None)
+    alice = spawn.get_agent("alice").agent_id
+    general = bridge.create_channel("general")
+    last = None
+    for second in range(1, 6):
+        last = _post(general.channel_id, alice, f"2020-01-01T00:00:0{second}")
+    messaging.update_bookmark("reader", general.channel_id, last)
+
+    archive.move(90)
+
+    channel = bridge.list_channels(reader_id="reader")[0]
+    assert (channel.message_count, channel.unread_count) == (5, 0)
+    assert messaging.recv_messages(general.channel_id, reader_id="reader")[1] == 0
+
+    _post(general.channel_id, alice, "2099-01-01T00:00:00")
+    assert bridge.list_channels(reader_id="reader")[0].unread_count == 1
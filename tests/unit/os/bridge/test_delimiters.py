@@ -137,4 +137,6 @@ async def test_process_delimiters_async():
 
         mock_control.assert_called_once_with("test-ch", "@zealot test", "agent-1")
         mock_signals.assert_called_once_with("test-ch", "@zealot test", "agent-1")
-        mock_mentions.assert_called_once_with("test-ch", "@zealot test", "agent-1")
+        mock_mentions.assert_called_once_with(
+            "test-ch", "@zealot test", "agent-1", done=(), mark=None
+        )
@@ -7,17 +7,29 @@ from space.os import bridge
 
 def make_mock_row(data):
     row = MagicMock()
-    row.__getitem__ = lambda self, key: data[key]
+    values = list(data.values())
+    row.__getitem__ = lambda self, key: values[key] if isinstance(key, int) else data[key]
     row.keys = lambda: data.keys()
     return row
 
 
+def describe(data):
+    """cursor.description for a mock result set with data's columns."""
+    return [(key, None, None, None, None, None, None) for key in data]
+
+
 @pytest.fixture
 def mock_db():
     conn = MagicMock()
-    with patch("space.lib.store.ensure") as mock_ensure:
+    with (
+        patch("space.lib.store.ensure") as mock_ensure,
+        patch("space.lib.store.read", mock_ensure),
+        patch("space.lib.store.write", mock_ensure),
+        patch("space.lib.store.write_batched") as batched,
+    ):
         mock_ensure.return_value.__enter__.return_value = conn
         mock_ensure.return_value.__exit__.return_value = None
+        batched.side_effect = lambda job: job(conn)
         conn.execute.return_value.fetchone.return_value = make_mock_row(
             {
                 "channel_id": "ch-1",
@@ -95,6 +107,7 @@ def test_get_messages_fetches_all(mock_db, mock_get_channel):
         }
     )
     mock_db.execute.return_value.fetchall.return_value = [mock_row]
+    mock_db.execute.return_value.description = describe(mock_row.keys())
     mock_db.execute.return_value.fetchone.return_value = None
 
     result = bridge.get_messages("ch-1")
@@ -120,6 +133,7 @@ def test_recv_messages_returns_new(mock_db, mock_get_channel, mock_get_agent):
         }
     )
     mock_db.execute.return_value.fetchall.return_value = [mock_row]
+    mock_db.execute.return_value.description = describe(mock_row.keys())
     mock_db.execute.return_value.fetchone.return_value = None
 
     messages, count, _, _ = bridge.recv_messages("ch-1")
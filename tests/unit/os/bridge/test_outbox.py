@@ -0,0 +1,102 @@
+"""Tests for the durable delimiter outbox."""
+
+from unittest.mock import patch
+
+import pytest
+
+from space.lib import store
+from space.os.bridge import channels, messaging, outbox
+from space.os.spawn import agents
+
+
+@pytest.fixture
+def sender(test_space):
+    agents.register_agent(identity="sender", constitution="zealot", model="claude-sonnet-4")
+    return channels.create_channel("ops")
+
+
+def _rows():
+    with store.read() as conn:
+        return conn.execute("SELECT * FROM outbox ORDER BY id").fetchall()
+
+
+@pytest.mark.asyncio
+async def test_send_enqueues_with_message_and_worker_drains(sender):
+    with patch.object(outbox, "kick"):
+        await messaging.send_message(sender.channel_id, "sender", "plain update")
+        await messaging.send_message(sender.channel_id, "sender", "@zealot take a look")
+
+    rows = _rows()
+    assert len(rows) == 1
+    assert outbox.stats()["pending"] == 1
+
+    with patch("space.os.bridge.delimiters.dispatch") as dispatch:
+        assert outbox.drain() == 1
+    dispatch.assert_called_once()
+    assert dispatch.call_args[0][1] == "@zealot take a look"
+    assert _rows() == []
+    assert outbox.stats() == {"pending": 0, "in_flight": 0, "dead": 0, "lag_seconds": 0.0}
+
+
+@pytest.mark.asyncio
+async def test_failures_back_off_then_go_dead(sender):
+    with patch.object(outbox, "kick"):
+        await messaging.send_message(sender.channel_id, "sender", "/stop someone")
+    entry_id = _rows()[0]["id"]
+
+    with patch("space.os.bridge.delimiters.dispatch", side_effect=RuntimeError("boom")):
+        assert outbox.process_entry(entry_id) is False
+        row = _rows()[0]
+        assert (row["attempts"], row["last_error"]) == (1, "boom")
+        assert not outbox.claim()  # backing off
+
+        for _ in range(outbox.MAX_ATTEMPTS - 1):
+            with store.write() as conn:
+                conn.execute("UPDATE outbox SET next_attempt_at = 0")
+            outbox.drain()
+
+    assert _rows()[0]["dead_at"] is not None
+    assert outbox.stats()["dead"] == 1
+    assert outbox.stats()["pending"] == 0
+
+
+@pytest.mark.asyncio
+async def test_claimed_rows_are_leased(sender):
+    with patch.object(outbox, "kick"):
+        await messaging.send_message(sender.channel_id, "sender", "!compact done")
+
+    assert len(outbox.claim()) == 1
+    assert outbox.claim() == []
+    assert outbox.stats()["in_flight"] == 1
+
+
+@pytest.mark.asyncio
+async def test_retry_resumes_after_completed_steps(sender):
+    for identity in ("alpha", "beta"):
+        agents.register_agent(identity=identity, model="claude-haiku-4-5")
+    with patch.object(outbox, "kick"):
+        await messaging.send_message(sender.channel_id, "sender", "/stop someone @alpha @beta")
+    entry_id = _rows()[0]["id"]
+
+    submitted = []
+
+    def submit(identity, *args, **kwargs):
+        submitted.append(identity)
+        if identity == "beta" and submitted.count("beta") == 1:
+            raise RuntimeError("supervisor down")
+
+    with (
+        patch("space.os.bridge.control._stop_agent_in_channel") as stop,
+        patch("space.os.spawn.supervisor.submit", side_effect=submit),
+    ):
+        assert outbox.process_entry(entry_id) is False
+        # alpha may have gone before or after beta; whatever finished is recorded.
+        assert "control" in _rows()[0]["steps_done"]
+
+        with store.write() as conn:
+            conn.execute("UPDATE outbox SET next_attempt_at = 0")
+        assert outbox.drain() == 1
+
+    stop.assert_called_once()
+    assert sorted(submitted) == ["alpha", "beta", "beta"]
+    assert _rows() == []
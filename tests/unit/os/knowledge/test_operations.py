@@ -18,9 +18,15 @@ def make_mock_row(data):
 @pytest.fixture
 def mock_db():
     conn = MagicMock()
-    with patch("space.lib.store.ensure") as mock_ensure:
+    with (
+        patch("space.lib.store.ensure") as mock_ensure,
+        patch("space.lib.store.read", mock_ensure),
+        patch("space.lib.store.write", mock_ensure),
+        patch("space.lib.store.write_batched") as batched,
+    ):
         mock_ensure.return_value.__enter__.return_value = conn
         mock_ensure.return_value.__exit__.return_value = None
+        batched.side_effect = lambda job: job(conn)
         yield conn
 
 
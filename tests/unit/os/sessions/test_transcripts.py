@@ -362,3 +362,27 @@ class TestIntegration:
                 "SELECT identity FROM transcripts WHERE session_id = ?", (sid,)
             ).fetchone()
             assert row[0] == identity
+
+
+def test_batch_index_restores_writer_profile(test_space, tmp_path):
+    with store.write() as conn:
+        before = {
+            p: conn.execute(f"PRAGMA {p}").fetchone()[0] for p in ("synchronous", "cache_size")
+        }
+    provider_dir = tmp_path / "sessions" / "claude"
+    provider_dir.mkdir(parents=True)
+    line = {
+        "type": "user",
+        "message": {"role": "user", "content": "hi"},
+        "timestamp": "2025-11-01T10:00:00Z",
+    }
+    (provider_dir / "profile-restore.jsonl").write_text(json.dumps(line))
+
+    assert sync._batch_index_sessions(tmp_path / "sessions") == 1
+
+    with store.write() as conn:
+        after = {
+            p: conn.execute(f"PRAGMA {p}").fetchone()[0] for p in ("synchronous", "cache_size")
+        }
+        assert not conn.in_transaction
+    assert after == before
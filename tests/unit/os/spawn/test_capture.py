@@ -0,0 +1,66 @@
+"""Spawn output capture: streamed log, bounded tail, incremental session parse."""
+
+import io
+
+from space.lib.providers import Codex
+from space.os.spawn import capture
+
+
+class _Chunked(io.RawIOBase):
+    """Pipe stand-in that returns fixed-size reads."""
+
+    def __init__(self, data: bytes, size: int):
+        self._data = data
+        self._size = size
+
+    def readable(self) -> bool:
+        return True
+
+    def read1(self, n: int = -1) -> bytes:
+        chunk, self._data = self._data[: self._size], self._data[self._size :]
+        return chunk
+
+
+def test_streams_to_log_with_stderr_prefixed(tmp_path):
+    path = tmp_path / "logs" / "s.log"
+    output = capture.OutputCapture(path)
+    output.attach(io.BytesIO(b"hello\nworld\n"), _Chunked(b"bad\nworse\n", 3))
+    output.join()
+
+    text = path.read_bytes()
+    assert b"hello\nworld\n" in text
+    assert b"[stderr] bad\n[stderr] worse\n" in text
+    assert output.tail("stderr") == "bad\nworse"
+
+
+def test_tail_is_bounded(tmp_path, monkeypatch):
+    monkeypatch.setattr(capture, "TAIL_LINES", 3)
+    output = capture.OutputCapture(tmp_path / "s.log")
+    data = b"".join(f"line {i}\n".encode() for i in range(1000))
+    output.attach(_Chunked(data, 100), None)
+    output.join()
+
+    assert output.tail("stdout") == "line 997\nline 998\nline 999"
+    assert (tmp_path / "s.log").read_bytes() == data
+
+
+def test_session_id_parsed_from_split_first_line(tmp_path):
+    first = b'{"type":"session_meta","payload":{"id":"sess-123","cwd":"/x"}}\n'
+    output = capture.OutputCapture(tmp_path / "s.log", Codex.extract_session_id)
+    output.attach(_Chunked(first + b'{"payload":{"id":"later"}}\n', 7), None)
+    output.join()
+
+    assert output.session_id == "sess-123"
+
+
+def test_log_rotates(tmp_path):
+    path = tmp_path / "s.log"
+    log = capture.RotatingLog(path, max_bytes=10, backups=2)
+    for ch in b"abcd":
+        log.write(bytes([ch]) * 6)
+    log.close()
+
+    assert path.read_bytes() == b"dddddd"
+    assert path.with_name("s.log.1").read_bytes() == b"cccccc"
+    assert path.with_name("s.log.2").read_bytes() == b"bbbbbb"
+    assert not path.with_name("s.log.3").exists()
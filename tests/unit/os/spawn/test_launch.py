@@ -1,5 +1,6 @@
 """Integration tests for ephemeral spawning (Claude Code ephemeral execution)."""
 
+import io
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -8,6 +9,16 @@ from space.os.bridge import channels
 from space.os.spawn import agents, launch, spawns
 
 
+def _proc(stdout: bytes = b"Response", stderr: bytes = b"", returncode: int = 0):
+    """Fresh fake process per Popen call (retries re-run the command)."""
+    proc = MagicMock()
+    proc.pid = 12345
+    proc.stdout = io.BytesIO(stdout)
+    proc.stderr = io.BytesIO(stderr)
+    proc.returncode = returncode
+    return proc
+
+
 @pytest.fixture
 def test_agent(test_space):
     """Create a test agent."""
@@ -23,12 +34,8 @@ def test_channel(test_space):
 
 def test_spawn_ephemeral_claude_streams_ingest(test_agent, test_channel):
     """Contract: session autodiscovery attempts post-spawn discovery."""
-    mock_proc = MagicMock()
-    mock_proc.pid = 12345
-    mock_proc.communicate.return_value = ("Response text", "")
-    mock_proc.returncode = 0
 
-    with patch("subprocess.Popen", return_value=mock_proc):
+    with patch("subprocess.Popen", side_effect=lambda *a, **kw: _proc(b"Response text")):
         with patch("space.os.sessions.linker.link_spawn_to_session") as mock_link:
             with patch(
                 "space.lib.providers.Claude.discover_session", return_value="test-session-id"
@@ -44,12 +51,8 @@ def test_spawn_ephemeral_claude_streams_ingest(test_agent, test_channel):
 
 def test_spawn_ephemeral_claude_extracts_session_once(test_agent, test_channel):
     """Contract: explicit resume links to provided session."""
-    mock_proc = MagicMock()
-    mock_proc.pid = 12345
-    mock_proc.communicate.return_value = ("Response", "")
-    mock_proc.returncode = 0
 
-    with patch("subprocess.Popen", return_value=mock_proc):
+    with patch("subprocess.Popen", side_effect=lambda *a, **kw: _proc(b"Response")):
         with patch("space.os.sessions.linker.link_spawn_to_session") as mock_link:
             with patch("space.os.spawn.launch.resolve_session_id") as mock_resolve:
                 with patch("space.os.bridge.messaging.send_message"):
@@ -68,12 +71,8 @@ def test_spawn_ephemeral_claude_extracts_session_once(test_agent, test_channel):
 
 def test_spawn_ephemeral_no_session_id_raises(test_agent, test_channel):
     """Contract: Succeeds even if no session discovered (session linking is optional)."""
-    mock_proc = MagicMock()
-    mock_proc.pid = 12345
-    mock_proc.communicate.return_value = ("Response", "")
-    mock_proc.returncode = 0
 
-    with patch("subprocess.Popen", return_value=mock_proc):
+    with patch("subprocess.Popen", side_effect=lambda *a, **kw: _proc(b"Response")):
         with patch("space.os.spawn.launch._discover_recent_session") as mock_discover:
             with patch("space.os.bridge.messaging.send_message"):
                 mock_discover.return_value = None
@@ -86,13 +85,9 @@ def test_spawn_ephemeral_no_session_id_raises(test_agent, test_channel):
 
 def test_spawn_ephemeral_process_failure_raises(test_agent, test_channel):
     """Contract: Raises RuntimeError when subprocess returns non-zero."""
-    mock_proc = MagicMock()
-    mock_proc.pid = 12345
-    mock_proc.communicate.return_value = ("", "Process error")
-    mock_proc.returncode = 1
 
-    with patch("subprocess.Popen", return_value=mock_proc):
-        with pytest.raises(RuntimeError, match="spawn failed"):
+    with patch("subprocess.Popen", side_effect=lambda *a, **kw: _proc(b"", b"Process error", 1)):
+        with pytest.raises(RuntimeError, match="spawn failed: Process error"):
             launch.spawn_ephemeral(
                 identity="test-agent",
                 instruction="test",
@@ -102,12 +97,8 @@ def test_spawn_ephemeral_process_failure_raises(test_agent, test_channel):
 
 def test_spawn_ephemeral_ingest_graceful_failure(test_agent, test_channel):
     """Contract: session discovery failures are graceful."""
-    mock_proc = MagicMock()
-    mock_proc.pid = 12345
-    mock_proc.communicate.return_value = ("Response", "")
-    mock_proc.returncode = 0
 
-    with patch("subprocess.Popen", return_value=mock_proc):
+    with patch("subprocess.Popen", side_effect=lambda *a, **kw: _proc(b"Response")):
         with patch(
             "space.os.spawn.launch._discover_recent_session",
             side_effect=Exception("discovery failed"),
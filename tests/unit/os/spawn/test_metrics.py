@@ -0,0 +1,100 @@
+"""Per-spawn resource accounting."""
+
+import os
+import sys
+
+import pytest
+from typer.testing import CliRunner
+
+from space.lib import store
+from space.os.spawn import agents, launch, metrics, spawns
+from space.os.spawn.cli import app
+
+ECHO = "import sys, time; data = sys.stdin.read(); time.sleep(0.1); print(len(data))"
+
+
+@pytest.fixture
+def agent(test_space):
+    agents.register_agent("metered", "claude-haiku-4-5", None)
+    return agents.get_agent("metered")
+
+
+def test_execute_spawn_records_rusage(agent):
+    spawn = spawns.create_spawn(agent.agent_id)
+
+    launch._execute_spawn([sys.executable, "-c", ECHO], "x" * 10, agent, spawn.id, {})
+
+    m = metrics.get_metrics([spawn.id])[spawn.id]
+    assert m.runs == 1
+    assert m.wall_seconds >= 0.1
+    assert 0 < m.first_output_seconds <= m.wall_seconds
+    assert m.cpu_user_seconds > 0
+    assert m.cpu_system_seconds is not None
+    assert m.max_rss_kb > 1024
+
+
+def test_failed_run_is_recorded(agent):
+    spawn = spawns.create_spawn(agent.agent_id)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        launch._execute_spawn(
+            [sys.executable, "-c", "import sys; sys.exit('boom')"], "", agent, spawn.id, {}
+        )
+
+    m = metrics.get_metrics([spawn.id])[spawn.id]
+    assert m.runs == 1
+    assert m.first_output_seconds is None
+
+
+def test_unknown_exit_status_is_not_recorded(agent, monkeypatch):
+    spawn = spawns.create_spawn(agent.agent_id)
+
+    def reaped_elsewhere(pid, options):
+        os.waitpid(pid, 0)
+        raise ChildProcessError
+
+    monkeypatch.setattr(launch.os, "wait4", reaped_elsewhere)
+    launch._execute_spawn(
+        [sys.executable, "-c", "import sys; sys.exit(3)"], "", agent, spawn.id, {}
+    )
+
+    assert metrics.get_metrics([spawn.id])[spawn.id].runs == 0
+
+
+def test_metrics_sum_runs_and_join_session_tokens(agent):
+    spawn = spawns.create_spawn(agent.agent_id)
+    for wall, rss in ((2.0, 1000), (3.0, 5000)):
+        metrics.record(spawn.id, 0, wall, 0.5, None)
+        with store.write() as conn:
+            conn.execute(
+                "UPDATE spawn_metrics SET cpu_user_seconds = 1, cpu_system_seconds = 0.5, "
+                "max_rss_kb = ? WHERE id = (SELECT MAX(id) FROM spawn_metrics)",
+                (rss,),
+            )
+    with store.write() as conn:
+        conn.execute(
+            "INSERT INTO sessions (session_id, agent_id, provider, model, input_tokens, "
+            "output_tokens) VALUES ('sess-m', ?, 'claude', 'claude-haiku-4-5', 1200, 340)",
+            (agent.agent_id,),
+        )
+    spawns.link_session_to_spawn(spawn.id, "sess-m")
+    idle = spawns.create_spawn(agent.agent_id)
+
+    found = metrics.get_metrics([spawn.id, idle.id])
+
+    m = found[spawn.id]
+    assert (m.runs, m.wall_seconds, m.cpu_user_seconds, m.max_rss_kb) == (2, 5.0, 2.0, 5000)
+    assert (m.input_tokens, m.output_tokens) == (1200, 340)
+    assert found[idle.id].runs == 0
+
+
+def test_list_metrics_columns(agent):
+    spawn = spawns.create_spawn(agent.agent_id)
+    spawns.update_status(spawn.id, "running")
+    metrics.record(spawn.id, 0, 42.0, 1.5, None)
+
+    result = CliRunner().invoke(app, ["list", "--metrics"])
+
+    assert result.exit_code == 0
+    assert "CPU" in result.stdout
+    assert "1.5s" in result.stdout
@@ -0,0 +1,158 @@
+"""Admission control: caps, priority queue, release on slot free."""
+
+import subprocess
+import sys
+
+import pytest
+
+from space.lib import store
+from space.os.spawn import agents, scheduler, spawns
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    calls = []
+    monkeypatch.setattr(
+        "space.os.spawn.supervisor.submit", lambda *a, **kw: calls.append((a, kw)) or True
+    )
+    return calls
+
+
+def _spawn(agent_id):
+    return spawns.create_spawn(agent_id=agent_id)
+
+
+def _admit(agent_id, priority=0):
+    spawn = _spawn(agent_id)
+    agent = agents.get_agent(agent_id)
+    ok = scheduler.admit(spawn.id, agent, {"instruction": "go", "resume": None}, priority)
+    return spawn.id, ok
+
+
+def test_admit_within_caps_marks_running(test_space, default_agents, submitted):
+    spawn_id, ok = _admit(default_agents["zealot"])
+
+    assert ok
+    spawn = spawns.get_spawn(spawn_id)
+    assert spawn.status == "running"
+    assert spawn.queue_wait_seconds == 0.0
+
+
+def test_per_agent_cap_queues(test_space, default_agents, submitted, monkeypatch):
+    monkeypatch.setenv("SPACE_SPAWN_MAX_PER_AGENT", "1")
+    zealot = default_agents["zealot"]
+
+    _, first = _admit(zealot)
+    queued_id, second = _admit(zealot)
+    _, other = _admit(default_agents["sentinel"])
+
+    assert first and other
+    assert not second
+    spawn = spawns.get_spawn(queued_id)
+    assert spawn.status == "pending"
+    assert spawn.started_at is None
+    assert spawn.queue_wait_seconds is not None
+
+
+def test_provider_cap_counts_across_agents(test_space, default_agents, submitted, monkeypatch):
+    monkeypatch.setenv("SPACE_SPAWN_MAX_GEMINI", "1")
+
+    _, first = _admit(default_agents["sentinel"])
+    _, second = _admit(default_agents["crucible"])
+    _, claude = _admit(default_agents["zealot"])
+
+    assert first and claude
+    assert not second
+
+
+def test_release_starts_highest_priority_first(test_space, default_agents, submitted, monkeypatch):
+    monkeypatch.setenv("SPACE_SPAWN_MAX", "1")
+    running_id, _ = _admit(default_agents["zealot"])
+    low_id, _ = _admit(default_agents["sentinel"], priority=0)
+    high_id, _ = _admit(default_agents["crucible"], priority=scheduler.PRIORITY_HUMAN)
+
+    spawns.update_status(running_id, "active")
+
+    assert spawns.get_spawn(high_id).status == "running"
+    assert spawns.get_spawn(high_id).started_at is not None
+    assert spawns.get_spawn(low_id).status == "pending"
+    assert len(submitted) == 1
+    args, kwargs = submitted[0]
+    assert args == ("crucible", "go")
+    assert kwargs["spawn_id"] == high_id
+
+
+def test_newcomer_does_not_overtake_queue(test_space, default_agents, submitted, monkeypatch):
+    monkeypatch.setenv("SPACE_SPAWN_MAX", "1")
+    running_id, _ = _admit(default_agents["zealot"])
+    waiting_id, _ = _admit(default_agents["sentinel"])
+    spawns.update_status(running_id, "completed")
+    # Queue drained into the free slot; the next arrival has to wait behind it.
+    _, ok = _admit(default_agents["crucible"])
+
+    assert spawns.get_spawn(waiting_id).status == "running"
+    assert not ok
+
+
+def test_killing_queued_spawn_removes_it(test_space, default_agents, submitted, monkeypatch):
+    monkeypatch.setenv("SPACE_SPAWN_MAX", "1")
+    running_id, _ = _admit(default_agents["zealot"])
+    queued_id, _ = _admit(default_agents["sentinel"])
+
+    spawns.terminate_spawn(queued_id, "killed")
+    spawns.update_status(running_id, "active")
+
+    assert spawns.get_spawn(queued_id).status == "killed"
+    assert submitted == []
+
+
+def test_queued_spawn_found_for_mention_reuse(test_space, default_agents, submitted, monkeypatch):
+    from space.os import bridge
+
+    monkeypatch.setenv("SPACE_SPAWN_MAX", "1")
+    channel = bridge.create_channel("queue-reuse")
+    _admit(default_agents["zealot"])
+    spawn = spawns.create_spawn(agent_id=default_agents["sentinel"], channel_id=channel.channel_id)
+    scheduler.admit(spawn.id, agents.get_agent("sentinel"), {"instruction": "go"})
+
+    found = spawns.get_active_spawn_in_channel(default_agents["sentinel"], channel.channel_id)
+    assert found.id == spawn.id
+    assert found.status == "pending"
+
+
+def test_unqueued_pending_spawn_is_not_reused(test_space, default_agents):
+    from space.os import bridge
+
+    channel = bridge.create_channel("fresh-pending")
+    spawns.create_spawn(agent_id=default_agents["sentinel"], channel_id=channel.channel_id)
+
+    assert (
+        spawns.get_active_spawn_in_channel(default_agents["sentinel"], channel.channel_id) is None
+    )
+
+
+def test_orphan_cleanup_spares_just_admitted(test_space, default_agents, submitted):
+    fresh_id, _ = _admit(default_agents["zealot"])
+    stale_id, _ = _admit(default_agents["sentinel"])
+    with store.write() as conn:
+        conn.execute(
+            "UPDATE spawns SET started_at = '2000-01-01T00:00:00' WHERE id = ?", (stale_id,)
+        )
+
+    assert spawns.cleanup_orphans() == 1
+    assert spawns.get_spawn(fresh_id).status == "running"
+    assert spawns.get_spawn(stale_id).status == "failed"
+
+
+def test_tick_reaps_dead_spawn_and_starts_queue(test_space, default_agents, submitted, monkeypatch):
+    monkeypatch.setenv("SPACE_SPAWN_MAX", "1")
+    dead_id, _ = _admit(default_agents["zealot"])
+    queued_id, _ = _admit(default_agents["sentinel"])
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    spawns.set_pid(dead_id, proc.pid)
+
+    scheduler.tick()
+
+    assert spawns.get_spawn(dead_id).status == "failed"
+    assert spawns.get_spawn(queued_id).status == "running"
@@ -161,3 +161,24 @@ def test_terminate_spawn_active_sets_status(test_space, default_agents, mocker):
 
     spawn = spawns.get_spawn(spawn.id)
     assert spawn.status == SpawnStatus.COMPLETED
+
+
+def test_terminate_spawns_kills_running_together(test_space, default_agents, mocker):
+    """terminate_spawns signals all running spawns in one termination pass."""
+    zealot = default_agents["zealot"]
+    running = [spawns.create_spawn(agent_id=zealot) for _ in range(3)]
+    for pid, spawn in enumerate(running, start=90001):
+        spawns.update_status(spawn.id, "running")
+        spawns.set_pid(spawn.id, pid)
+    idle = spawns.create_spawn(agent_id=zealot)
+    spawns.update_status(idle.id, "active")
+
+    mocker.patch("space.os.sessions.sync.ingest")
+    mocker.patch("space.os.sessions.sync.index")
+    mock_terminate = mocker.patch("space.lib.terminate.terminate", return_value={})
+
+    spawns.terminate_spawns([s.id for s in running] + [idle.id], "killed")
+
+    mock_terminate.assert_called_once_with([90001, 90002, 90003])
+    for spawn in [*running, idle]:
+        assert spawns.get_spawn(spawn.id).status == SpawnStatus.KILLED
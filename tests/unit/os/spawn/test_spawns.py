@@ -87,6 +87,26 @@ def test_get_spawn_depth(test_space):
     assert spawns.get_spawn_depth(child2.id) == 2
 
 
+def test_get_spawn_resolves_unique_prefix(test_space):
+    """Contract: get_spawn matches exact IDs, then a unique prefix; ambiguity raises."""
+    import pytest
+
+    from space.os.spawn import agents
+
+    agents.register_agent("test-agent", "claude-haiku-4-5", None)
+    agent = agents.get_agent("test-agent")
+    first = spawns.create_spawn(agent.agent_id)
+    second = spawns.create_spawn(agent.agent_id)
+
+    assert spawns.get_spawn(first.id).id == first.id
+    assert spawns.get_spawn(second.id[:-4]).id == second.id
+    assert spawns.get_spawn(second.id[:-4].upper()).id == second.id
+    assert spawns.get_spawn("zzzz") is None
+    assert spawns.get_spawn("") is None
+    with pytest.raises(ValueError, match="Ambiguous"):
+        spawns.get_spawn(first.id[:4])
+
+
 def test_get_spawn_lineage(test_space):
     """Contract: get_spawn_lineage returns [spawn, parent, grandparent, ...]."""
     from space.os.spawn import agents
@@ -0,0 +1,68 @@
+"""Spawn supervisor: socket hand-off with detach fallback."""
+
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from space.os.spawn import supervisor
+
+
+@pytest.fixture
+def sock_path(monkeypatch):
+    # Unix socket paths are capped near 108 bytes; pytest's tmp_path can exceed that.
+    with tempfile.TemporaryDirectory(prefix="spawnd-", dir="/tmp") as tmp:
+        path = Path(tmp) / "s.sock"
+        monkeypatch.setattr(supervisor, "socket_path", lambda: path)
+        yield path
+
+
+@pytest.fixture
+def running(sock_path):
+    server = supervisor.Supervisor(sock_path)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def test_submit_falls_back_to_detach(sock_path, monkeypatch):
+    monkeypatch.setenv("SPACE_SPAWN_ID", "parent-1")
+    with patch.object(supervisor, "detach") as detach:
+        assert supervisor.submit("zealot", "do it", channel_id="ch-1") is False
+
+    detach.assert_called_once_with(
+        ["spawn", "run", "zealot", "do it", "--channel", "ch-1", "--parent-spawn", "parent-1"]
+    )
+    assert supervisor.status() is None
+
+
+def test_submit_runs_on_supervisor(running):
+    launched = threading.Event()
+    calls = []
+
+    def fake_spawn(identity, instruction, **kwargs):
+        calls.append((identity, instruction, kwargs))
+        launched.set()
+
+    with (
+        patch("space.os.spawn.launch.spawn_ephemeral", side_effect=fake_spawn),
+        patch.object(supervisor, "detach") as detach,
+    ):
+        assert supervisor.submit("zealot", "hi", channel_id="ch-1", spawn_id="sp-1", resume="s-1")
+        assert launched.wait(5)
+
+    detach.assert_not_called()
+    identity, instruction, kwargs = calls[0]
+    assert (identity, instruction) == ("zealot", "hi")
+    assert kwargs["existing_spawn_id"] == "sp-1"
+    assert kwargs["resume"] == "s-1"
+    assert supervisor.status()["launched"] == 1
+
+
+def test_serve_refuses_second_supervisor(running, sock_path):
+    with pytest.raises(RuntimeError, match="already running"):
+        supervisor.serve(sock_path)
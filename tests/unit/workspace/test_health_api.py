@@ -77,3 +77,54 @@ def test_health_check_detects_fk_violation(test_space):
     assert ok is False
     assert any("messages" in issue for issue in issues)
     assert "messages" in counts and counts["messages"] >= 1
+
+
+def test_quick_tier_persists_approximate_counts(test_space):
+    with store.write() as conn:
+        conn.execute(
+            "INSERT INTO channels (channel_id, name, created_at) VALUES ('c1', 'ops', 'now')"
+        )
+
+    result = health_api.run_quick()
+
+    assert result["ok"] is True
+    assert result["counts"]["channels"] == 1
+    assert result["wal_bytes"] >= 0
+    assert health_api.load_state()["quick"]["at"] == result["at"]
+
+    with store.write() as conn:
+        conn.execute("ANALYZE")
+    assert health_api.run_quick()["counts"]["channels"] == 1
+
+
+def test_deep_tier_resumes_across_runs(test_space):
+    first = health_api.run_deep(budget_s=0)
+    assert first["tables"] == {}
+    total = len(first["pending"])
+
+    health_api.run_deep(budget_s=None)
+    deep = health_api.load_state()["deep"]
+    assert deep["pending"] == []
+    assert len(deep["tables"]) == total
+    assert deep["completed_at"] is not None
+    assert all(result["ok"] for result in deep["tables"].values())
+
+    report = health_api.summary(health_api.load_state())
+    assert report["deep"]["checked"] == report["deep"]["total"] == total
+    assert report["ok"] is True
+
+
+def test_deep_tier_reports_last_pass_while_next_runs(test_space):
+    health_api.run_deep(budget_s=None)
+    state = health_api.load_state()
+    state["deep"]["tables"]["channels"]["issues"] = ["❌ channels: integrity_check=bad"]
+    health_api._save_state(state)
+
+    restarted = health_api.run_deep(budget_s=0)
+    assert restarted["tables"] == {}
+    assert restarted["last"]["completed_at"] is not None
+
+    report = health_api.summary(health_api.load_state())
+    assert report["issues"] == ["❌ channels: integrity_check=bad"]
+    assert report["deep"]["checked"] == 0
+    assert report["deep"]["completed_age_s"] is not None